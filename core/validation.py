@@ -2,12 +2,24 @@ from __future__ import annotations
 import re
 from typing import Any, List
 
+_RE_CONTRACT_KEY = re.compile(r"^\s*([A-Z][A-Z0-9_]*)\s*=")
+_RE_KEY_VALUE_LINE = re.compile(r"^\s*([A-Z][A-Z0-9_]*)\s*=\s*(.*?)\s*$")
+_RE_FIRST_LINE_VERDICT = re.compile(r"^VERDICT\s*[=:]\s*[A-Z_]+\s*$")
+_RE_SECOND_LINE_CITATIONS = re.compile(r"^CITATIONS\s*[=:]\s*.+$")
+_RE_STANDALONE_HEADER = re.compile(r"(?mi)^\s*(?:#{1,6}\s*)?(?:analysis|citations)\s*:\s*$")
+_RE_VERDICT_LINE = re.compile(r"^\s*VERDICT\s*[=:]\s*([A-Z_]+)\s*$", re.MULTILINE)
+_RE_CITATIONS_LINE = re.compile(r"^\s*CITATIONS\s*[=:]\s*(.*)$", re.MULTILINE)
+_RE_CITATIONS_HEADER = re.compile(r"^\s*CITATIONS\s*[=:]?\s*$", re.MULTILINE)
+_RE_TOKEN_KIND_PREFIX = re.compile(r"^\s*(?:file|path|artifact|section):\s*", re.IGNORECASE)
+_RE_TOKEN_CITE_PREFIX = re.compile(r"^\s*cite\s*=\s*", re.IGNORECASE)
+_RE_CITATION_TOKEN = re.compile(r"^[^\s:]+(?:/[^\s:]+)*:\d+(?:-\d+)?$")
+
 
 def extract_required_keys_from_contract(text: str) -> List[str]:
     keys: List[str] = []
     seen: set[str] = set()
     for ln in (text or "").splitlines():
-        m = re.match(r"^\s*([A-Z][A-Z0-9_]*)\s*=", ln.strip())
+        m = _RE_CONTRACT_KEY.match(ln.strip())
         if not m:
             continue
         key = m.group(1).strip().upper()
@@ -27,7 +39,7 @@ def validate_required_key_lines(answer: str, keys: List[str]) -> List[str]:
     lines = [ln.strip() for ln in (answer or "").splitlines() if ln.strip()]
     values: dict[str, str] = {}
     for ln in lines:
-        m = re.match(r"^\s*([A-Z][A-Z0-9_]*)\s*=\s*(.*?)\s*$", ln)
+        m = _RE_KEY_VALUE_LINE.match(ln)
         if not m:
             continue
         values[m.group(1).upper()] = (m.group(2) or "").strip()
@@ -46,13 +58,13 @@ def validate_response_schema(answer: str, validation: Any, issue_caps: dict[str,
     caps = issue_caps or {}
     clean = (answer or '').replace('**', '')
     nonempty_lines = [ln.strip() for ln in clean.splitlines() if ln.strip()]
-    if not nonempty_lines or not re.match(r"^VERDICT\s*[=:]\s*[A-Z_]+\s*$", nonempty_lines[0]):
+    if not nonempty_lines or not _RE_FIRST_LINE_VERDICT.match(nonempty_lines[0]):
         issues.append('First non-empty line must be VERDICT=TRUE_POSITIVE|FALSE_POSITIVE|INDETERMINATE')
-    if len(nonempty_lines) < 2 or not re.match(r"^CITATIONS\s*[=:]\s*.+$", nonempty_lines[1]):
+    if len(nonempty_lines) < 2 or not _RE_SECOND_LINE_CITATIONS.match(nonempty_lines[1]):
         issues.append('Second non-empty line must be CITATIONS=path:line(-line), ...')
-    if re.findall(r"(?mi)^\s*(?:#{1,6}\s*)?(?:analysis|citations)\s*:\s*$", clean):
+    if _RE_STANDALONE_HEADER.search(clean):
         issues.append("Markdown/standalone 'Analysis:' or 'CITATIONS:' headers are not allowed")
-    verdict_matches = list(re.finditer(r"^\s*VERDICT\s*[=:]\s*([A-Z_]+)\s*$", clean, flags=re.MULTILINE))
+    verdict_matches = list(_RE_VERDICT_LINE.finditer(clean))
     if not verdict_matches:
         issues.append('Missing required line: VERDICT=TRUE_POSITIVE|FALSE_POSITIVE|INDETERMINATE')
     else:
@@ -61,11 +73,11 @@ def validate_response_schema(answer: str, validation: Any, issue_caps: dict[str,
             issues.append(f"Invalid VERDICT '{verdict}' (allowed: {sorted(required_verdicts)})")
         if len(verdict_matches) > 1:
             issues.append('VERDICT must appear exactly once')
-    citation_matches = list(re.finditer(r"^\s*CITATIONS\s*[=:]\s*(.*)$", clean, flags=re.MULTILINE))
+    citation_matches = list(_RE_CITATIONS_LINE.finditer(clean))
     m = citation_matches[0] if citation_matches else None
     citations_raw = ''
     if not m:
-        cit_header = re.search(r"^\s*CITATIONS\s*[=:]?\s*$", clean, flags=re.MULTILINE)
+        cit_header = _RE_CITATIONS_HEADER.search(clean)
         if cit_header:
             issues.append('CITATIONS must be a single comma-separated line (no standalone CITATIONS section)')
         issues.append('Missing required line: CITATIONS=path:line(-line), ...')
@@ -78,9 +90,9 @@ def validate_response_schema(answer: str, validation: Any, issue_caps: dict[str,
     if citations_raw:
         bad=[]
         for t in [x.strip().strip('`') for x in citations_raw.split(',') if x.strip()]:
-            t = re.sub(r"^\s*(?:file|path|artifact|section):\s*", "", t, flags=re.IGNORECASE)
-            t = re.sub(r"^\s*cite\s*=\s*", "", t, flags=re.IGNORECASE)
-            if not re.match(r"^[^\s:]+(?:/[^\s:]+)*:\d+(?:-\d+)?$", t):
+            t = _RE_TOKEN_KIND_PREFIX.sub("", t)
+            t = _RE_TOKEN_CITE_PREFIX.sub("", t)
+            if not _RE_CITATION_TOKEN.match(t):
                 bad.append(t)
         if bad:
             issues.append(f"CITATIONS contains invalid tokens (expected {citation_format}): {bad[:int(caps.get('invalid_citations',6))]}")
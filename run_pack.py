@@ -16,10 +16,16 @@ Keep in mind:
 """
 
 import argparse
+import concurrent.futures
+import functools
 import hashlib
+import heapq
 import importlib
+import io
+import itertools
 import json
 import logging
+import mmap
 import os
 import re
 import shlex
@@ -29,10 +35,11 @@ import subprocess
 import sys
 import time
 import uuid
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import yaml
 
@@ -63,6 +70,8 @@ DEFAULT_RUNNER_POLICY: Dict[str, Any] = {
     "runner": {
         "version": "3.2.0",
         "hash_chunk_size": 8192,
+        "artifact_json_backend": "json",
+        "artifact_mmap_threshold_bytes": 1048576,
         "replicate": {
             "default_seeds": [42, 123, 456],
             "seed_prefix": "seed_",
@@ -286,6 +295,7 @@ DEFAULT_RUNNER_POLICY: Dict[str, Any] = {
             r"(^|/)audit_runs(/|$)",
             r"(^|/)xref_state(/|$)",
         ],
+        "max_workers": 1,
         "filtered_to_zero_fail": {
             "enabled": True,
             "raw_rows_threshold": 20,
@@ -342,6 +352,8 @@ DEFAULT_RUNNER_POLICY: Dict[str, Any] = {
     },
     "evidence_format": {
         "default_render_mode": "list",
+        "json_compact": False,
+        "json_backend": "json",
         "max_chars": {
             "list": 1600,
             "block": 8000,
@@ -452,6 +464,7 @@ DEFAULT_RUNNER_POLICY: Dict[str, Any] = {
             "template_header": "STRICT RESPONSE TEMPLATE (MUST MATCH)",
             "issues_header": "Validation issues to fix in this retry:",
             "max_issue_bullets": 8,
+            "evidence_budget_chars": 0,
         },
     },
     "plugin": {
@@ -520,6 +533,8 @@ RUNNER_POLICY = _load_runner_policy(DEFAULT_RUNNER_POLICY, RUNNER_POLICY_PATH)
 
 RUNNER_VERSION = str(_policy_get("runner.version", "3.2.0"))
 HASH_CHUNK_SIZE = int(_policy_get("runner.hash_chunk_size", 8192))
+ARTIFACT_JSON_BACKEND = str(_policy_get("runner.artifact_json_backend", "json") or "json").strip().lower()
+ARTIFACT_MMAP_THRESHOLD_BYTES = int(_policy_get("runner.artifact_mmap_threshold_bytes", 1048576))
 DEFAULT_REPLICATE_SEEDS = [int(s) for s in (_policy_get("runner.replicate.default_seeds", [42, 123, 456]) or [42, 123, 456])]
 REPLICATE_SEED_PREFIX = str(_policy_get("runner.replicate.seed_prefix", "seed_"))
 MANIFEST_SCHEMA_VERSION = str(_policy_get("runner.manifest.schema_version", "1.1"))
@@ -619,6 +634,7 @@ ISSUE_CAPS: Dict[str, Any] = dict(_policy_get("validators.issue_caps", {}))
 
 DEFAULT_TEST_PATH_PATTERNS = [str(x) for x in (_policy_get("preflight.default_test_path_patterns", []) or [])]
 DEFAULT_EXCLUDE_PATH_REGEX = [str(x) for x in (_policy_get("preflight.default_exclude_path_regex", []) or [])]
+PREFLIGHT_MAX_WORKERS = max(1, int(_policy_get("preflight.max_workers", 1) or 1))
 PREFLIGHT_FILTERED_TO_ZERO_FAIL_ENABLED = bool(_policy_get("preflight.filtered_to_zero_fail.enabled", True))
 try:
     PREFLIGHT_FILTERED_TO_ZERO_FAIL_RAW_ROWS_THRESHOLD = int(
@@ -709,6 +725,51 @@ GROUP_BY_PATH_DEFAULTS: Dict[str, Any] = dict(_policy_get("preflight.group_by_pa
 EVIDENCE_MAX_CHARS: Dict[str, Any] = dict(_policy_get("evidence_format.max_chars", {}))
 EVIDENCE_SHORTEN: Dict[str, Any] = dict(_policy_get("evidence_format.shorten", {}))
 DEFAULT_RENDER_MODE = str(_policy_get("evidence_format.default_render_mode", "list"))
+EVIDENCE_JSON_COMPACT = bool(_policy_get("evidence_format.json_compact", False))
+EVIDENCE_JSON_BACKEND = str(_policy_get("evidence_format.json_backend", "json") or "json").strip().lower()
+
+
+def _stdlib_compact_json_dumps(obj: Any) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _import_orjson():
+    """The optional ``orjson`` module, or None when it is not installed."""
+    try:
+        import orjson  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+    return orjson
+
+
+# orjson differs from json in float formatting, NaN handling and (on decode)
+# integers beyond 64 bits, so every use of it is opt-in via policy.
+_ORJSON = _import_orjson()
+
+
+def _resolve_compact_json_dumps(backend: str):
+    """Serializer for compact evidence JSON.
+
+    ``orjson`` is used only when the policy selects it; when it is not
+    installed, or rejects a value (e.g. ints beyond 64 bits), the stdlib
+    encoder is used.
+    """
+    if backend != "orjson":
+        return _stdlib_compact_json_dumps
+    orjson = _ORJSON
+    if orjson is None:
+        return _stdlib_compact_json_dumps
+
+    def _orjson_dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            return _stdlib_compact_json_dumps(obj)
+
+    return _orjson_dumps
+
+
+_compact_json_dumps = _resolve_compact_json_dumps(EVIDENCE_JSON_BACKEND)
 
 PROMPTS: Dict[str, Any] = dict(_policy_get("prompts", {}))
 PLUGIN_POLICY: Dict[str, Any] = dict(_policy_get("plugin", {}))
@@ -863,14 +924,17 @@ def _stderr_is_noise(stderr_text: str) -> bool:
     return True
 
 
+_RE_CITATIONS_VALUE_ANY_CASE = re.compile(r"(?mi)^\s*CITATIONS\s*[=:]\s*(.*)$")
+
+
 def _count_citations_in_answer(answer_text: str) -> int:
-    m = re.search(r"(?mi)^\s*CITATIONS\s*[=:]\s*(.*)$", answer_text or "")
+    m = _RE_CITATIONS_VALUE_ANY_CASE.search(answer_text or "")
     if not m:
         return 0
     raw = (m.group(1) or "").strip()
     if not raw:
         return 0
-    return len(re.findall(_CITATION_TOKEN_PATTERN, raw))
+    return sum(1 for _ in _CITATION_TOKEN_RE.finditer(raw))
 
 
 # =============================================================================
@@ -907,6 +971,8 @@ _RUNTIME_ENGINE_COLUMNS: List[str] = []
 _RUNTIME_ENGINE_SCHEMA_SOURCE: str = "(none)"
 _RUNTIME_ENGINE_SCHEMA_CONTRACT_LOADED: bool = False
 _RUNTIME_ENGINE_SCHEMA_CONTRACT_VERSION: str = ""
+# Memoized effective key tuples/sets; cleared whenever the runtime key state changes.
+_EFFECTIVE_KEYS_CACHE: Dict[str, Any] = {}
 
 
 def _reset_runtime_dynamic_keys() -> None:
@@ -918,6 +984,7 @@ def _reset_runtime_dynamic_keys() -> None:
     global _RUNTIME_ENGINE_SCHEMA_CONTRACT_LOADED
     global _RUNTIME_ENGINE_SCHEMA_CONTRACT_VERSION
     _RUNTIME_DYNAMIC_KEYS = _empty_runtime_key_state()
+    _EFFECTIVE_KEYS_CACHE.clear()
     _RUNTIME_PARQUET_COLUMNS = []
     _RUNTIME_PARQUET_SCHEMA_SOURCE = "(none)"
     _RUNTIME_ENGINE_COLUMNS = []
@@ -944,34 +1011,66 @@ def _runtime_add_key(category: str, key: Any) -> None:
     if len(arr) >= DYNAMIC_MAX_KEYS_PER_CATEGORY:
         return
     arr.append(k)
+    _EFFECTIVE_KEYS_CACHE.clear()
 
 
 def _ordered_union(base: Tuple[str, ...], extra: List[str]) -> Tuple[str, ...]:
     return tuple(_dedupe_strs(list(base) + [str(x) for x in (extra or [])]))
 
 
+def _effective_keys(category: str, base: Tuple[str, ...]) -> Tuple[str, ...]:
+    cached = _EFFECTIVE_KEYS_CACHE.get(category)
+    if cached is None:
+        cached = _ordered_union(base, _RUNTIME_DYNAMIC_KEYS.get(category, []))
+        _EFFECTIVE_KEYS_CACHE[category] = cached
+    return cached
+
+
 def _effective_iter_rows_keys() -> Tuple[str, ...]:
-    return _ordered_union(ITER_ROWS_KEYS, _RUNTIME_DYNAMIC_KEYS.get("iter_rows_keys", []))
+    return _effective_keys("iter_rows_keys", ITER_ROWS_KEYS)
 
 
 def _effective_has_hits_count_keys() -> Tuple[str, ...]:
-    return _ordered_union(HAS_HITS_COUNT_KEYS, _RUNTIME_DYNAMIC_KEYS.get("has_hits_count_keys", []))
+    return _effective_keys("has_hits_count_keys", HAS_HITS_COUNT_KEYS)
 
 
 def _effective_row_count_keys() -> Tuple[str, ...]:
-    return _ordered_union(ROW_COUNT_KEYS, _RUNTIME_DYNAMIC_KEYS.get("row_count_keys", []))
+    return _effective_keys("row_count_keys", ROW_COUNT_KEYS)
 
 
 def _effective_path_keys() -> Tuple[str, ...]:
-    return _ordered_union(PATH_KEYS, _RUNTIME_DYNAMIC_KEYS.get("path_keys", []))
+    return _effective_keys("path_keys", PATH_KEYS)
 
 
 def _effective_line_keys() -> Tuple[str, ...]:
-    return _ordered_union(LINE_KEYS, _RUNTIME_DYNAMIC_KEYS.get("line_keys", []))
+    return _effective_keys("line_keys", LINE_KEYS)
 
 
 def _effective_snippet_keys() -> Tuple[str, ...]:
-    return _ordered_union(SNIPPET_KEYS, _RUNTIME_DYNAMIC_KEYS.get("snippet_keys", []))
+    return _effective_keys("snippet_keys", SNIPPET_KEYS)
+
+
+def _effective_key_counts() -> Dict[str, int]:
+    """Sizes of the effective key sets, as logged/reported (read-only; memoized)."""
+    counts = _EFFECTIVE_KEYS_CACHE.get("_key_counts")
+    if counts is None:
+        counts = {
+            "path_keys": len(_effective_path_keys()),
+            "line_keys": len(_effective_line_keys()),
+            "snippet_keys": len(_effective_snippet_keys()),
+            "iter_rows_keys": len(_effective_iter_rows_keys()),
+        }
+        _EFFECTIVE_KEYS_CACHE["_key_counts"] = counts
+    return counts
+
+
+def _base_skip_keys() -> frozenset:
+    """Path/line keys never echoed by the unknown-key fallback (memoized with the effective keys)."""
+    cached = _EFFECTIVE_KEYS_CACHE.get("_base_skip_keys")
+    if cached is None:
+        cached = frozenset(_effective_path_keys() + _effective_line_keys() + ("line_end",))
+        _EFFECTIVE_KEYS_CACHE["_base_skip_keys"] = cached
+    return cached
 
 
 def _looks_like_repo_path_text(value: str) -> bool:
@@ -1491,6 +1590,11 @@ class CmdResult:
     stderr: str
 
 
+def _cmd_result_payload(res: CmdResult, stdout: Any) -> Dict[str, Any]:
+    """Chat/advice artifact body: the command result with *stdout* replaced by its parsed form."""
+    return {"argv": res.argv, "returncode": res.returncode, "stdout": stdout, "stderr": res.stderr}
+
+
 def run_cmd(
     argv: List[str], *, cwd: Path | None = None, env: Dict[str, str] | None = None
 ) -> CmdResult:
@@ -1500,13 +1604,16 @@ def run_cmd(
         for k, v in env.items():
             if k and v is not None:
                 proc_env[str(k)] = str(v)
-    _log_event(
-        logging.DEBUG,
-        "run_cmd.start",
-        cwd=str(cwd) if cwd else "(inherit)",
-        argv=_shell_join(argv, max_chars=640),
-        env_override_keys=sorted(env.keys()) if env else [],
-    )
+    # DEBUG call sites below check the level first so the field values
+    # (argv join, sorted keys) are not built when DEBUG is off.
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        _log_event(
+            logging.DEBUG,
+            "run_cmd.start",
+            cwd=str(cwd) if cwd else "(inherit)",
+            argv=_shell_join(argv, max_chars=640),
+            env_override_keys=sorted(env.keys()) if env else [],
+        )
     p = subprocess.run(
         argv,
         cwd=str(cwd) if cwd else None,
@@ -1515,13 +1622,14 @@ def run_cmd(
         capture_output=True,
         check=False,
     )
-    _log_event(
-        logging.DEBUG,
-        "run_cmd.end",
-        returncode=p.returncode,
-        stdout_chars=len(p.stdout or ""),
-        stderr_chars=len(p.stderr or ""),
-    )
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        _log_event(
+            logging.DEBUG,
+            "run_cmd.end",
+            returncode=p.returncode,
+            stdout_chars=len(p.stdout or ""),
+            stderr_chars=len(p.stderr or ""),
+        )
     return CmdResult(argv=argv, returncode=p.returncode, stdout=p.stdout, stderr=p.stderr)
 
 
@@ -1617,24 +1725,163 @@ def ensure_dir(p: Path) -> None:
 
 
 def write_text(path: Path, s: str) -> None:
-    path.write_text(s, encoding="utf-8")
+    # One encode + one binary write; skips the text layer's newline translation.
+    path.write_bytes(s.encode("utf-8"))
+
+
+def _persist_partial_report(out_dir: Path, report_lines: List[str], *, event: str, **fields: Any) -> None:
+    """Write the report collected so far before a fail-fast abort, then log *event*.
+
+    A failed write is logged rather than swallowed; the abort event is emitted
+    either way (with ``partial_report=None`` when nothing was written).
+    """
+    partial_report_path: Path | None = out_dir / REPORT_FILE
+    try:
+        write_text(partial_report_path, "".join(report_lines))
+    except (OSError, ValueError) as e:
+        _log_event(
+            logging.WARNING,
+            "run.abort.partial_report_write_failed",
+            fn="_persist_partial_report",
+            path=str(partial_report_path),
+            error=str(e),
+        )
+        partial_report_path = None
+    _log_event(
+        logging.ERROR,
+        event,
+        fn="_run_single",
+        **fields,
+        partial_report=str(partial_report_path) if partial_report_path is not None else None,
+    )
+
+
+_ARTIFACT_ORJSON = _ORJSON if ARTIFACT_JSON_BACKEND == "orjson" else None
+
+
+def _json_artifact_bytes(obj: Any) -> bytes:
+    """Encoded artifact file contents; orjson output is written as-is, without a str round trip."""
+    if _ARTIFACT_ORJSON is not None:
+        try:
+            return _ARTIFACT_ORJSON.dumps(obj, option=_ARTIFACT_ORJSON.OPT_INDENT_2 | _ARTIFACT_ORJSON.OPT_NON_STR_KEYS) + b"\n"
+        except TypeError:
+            pass
+    return (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _json_loads(s: str | bytes) -> Any:
+    """Decode preflight stdout / artifacts (orjson when runner.artifact_json_backend selects it)."""
+    if _ARTIFACT_ORJSON is not None:
+        try:
+            return _ARTIFACT_ORJSON.loads(s)
+        except ValueError:
+            pass
+    return json.loads(s)
 
 
 def write_json(path: Path, obj: Any) -> None:
-    path.write_text(json.dumps(obj, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    _write_bytes_replace(path, _json_artifact_bytes(obj))
+
+
+def _write_bytes_replace(path: Path, data: bytes) -> None:
+    """Write via a sibling temp file and ``os.replace``.
+
+    The target always gets a fresh inode, so a JSON artifact that was promoted
+    by hardlink (see ``_link_or_copy``) never rewrites its link partner.
+    """
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlink *src* to *dst* (O(1) on the same filesystem); fall back to a copy."""
+    try:
+        os.link(src, dst)
+    except (OSError, NotImplementedError):
+        shutil.copy2(src, dst)
+
+
+class _ArtifactWriter:
+    """Write JSON artifacts on one background thread.
+
+    The object is serialized on the calling thread, so later mutations of it
+    cannot race the write; only the file write itself is deferred. A single
+    worker keeps writes FIFO. Callers ``wait()`` on a path before reading or
+    copying it, and on everything before handing artifacts to other passes;
+    write errors are re-raised there.
+    """
+
+    def __init__(self) -> None:
+        self._pool: concurrent.futures.ThreadPoolExecutor | None = None
+        self._pending: Dict[Path, concurrent.futures.Future[None]] = {}
+
+    def write_json(self, path: Path, obj: Any) -> None:
+        data = _json_artifact_bytes(obj)
+        if self._pool is None:
+            self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifact-writer")
+        self._pending[path] = self._pool.submit(_write_bytes_replace, path, data)
+
+    def wait(self, *paths: Path | None) -> None:
+        """Block until the given paths (all pending writes if none given) are on disk."""
+        targets = [p for p in paths if p is not None] if paths else list(self._pending)
+        for p in targets:
+            fut = self._pending.pop(p, None)
+            if fut is not None:
+                fut.result()
+
+    def close(self) -> None:
+        try:
+            self.wait()
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
 
 
 def load_json_file(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
+    # Parse the raw bytes: orjson consumes them directly and json.loads decodes
+    # UTF-8 itself, so no intermediate str copy of the artifact is built here.
+    if _ARTIFACT_ORJSON is not None and ARTIFACT_MMAP_THRESHOLD_BYTES > 0:
+        with path.open("rb") as f:
+            if os.fstat(f.fileno()).st_size > ARTIFACT_MMAP_THRESHOLD_BYTES:
+                return _json_loads_mmap(f)
+            return _json_loads(f.read())
+    return _json_loads(path.read_bytes())
+
+
+def _json_loads_mmap(f: Any) -> Any:
+    """orjson-parse a large artifact straight from a read-only mapping (no bytes copy)."""
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        try:
+            with memoryview(buf) as view:
+                return _ARTIFACT_ORJSON.loads(view)
+        except ValueError:
+            return json.loads(buf[:])
 
 
 def parse_json_maybe(s: str) -> Any:
     try:
-        return json.loads(s)
+        return _json_loads(s)
     except Exception:
         return None
 
 
+_RE_LEADING_WS = re.compile(r"\s*")
+
+
+def _json_prefix_char(text: Any) -> str:
+    """First non-whitespace character of *text* ("" if none), without an lstrip() copy."""
+    if not isinstance(text, str):
+        text = str(text)
+    i = _RE_LEADING_WS.match(text).end()
+    return text[i:i + 1]
+
+
 def _sha256_text(s: str) -> str:
     return hashlib.sha256(s.encode("utf-8")).hexdigest()
 
@@ -1647,14 +1894,35 @@ def _sha256_file(path: Path) -> str:
     return h.hexdigest()
 
 
-def build_artifact_signature(*, argv: List[str], inputs: List[Path]) -> str:
-    parts: Dict[str, Any] = {"argv": argv, "inputs": []}
+def _artifact_input_stats(inputs: List[Path]) -> List[Dict[str, Any]]:
+    out: List[Dict[str, Any]] = []
     for p in inputs:
         try:
             st = p.stat()
-            parts["inputs"].append({"path": str(p), "mtime_ns": st.st_mtime_ns, "size": st.st_size})
+            out.append({"path": str(p), "mtime_ns": st.st_mtime_ns, "size": st.st_size})
         except FileNotFoundError:
-            parts["inputs"].append({"path": str(p), "missing": True})
+            out.append({"path": str(p), "missing": True})
+    return out
+
+
+def build_artifact_signature(
+    *,
+    argv: List[str],
+    inputs: List[Path] | None = None,
+    input_stats: List[Dict[str, Any]] | None = None,
+    env: Dict[str, str] | None = None,
+) -> str:
+    """Signature of an engine call: argv plus path/mtime/size of its inputs.
+
+    *input_stats* (from ``_artifact_input_stats``) lets callers stat the
+    inputs once per run instead of once per step. *env* (the call's env
+    overrides, e.g. engine executable path and sha256) is folded in when given.
+    """
+    if input_stats is None:
+        input_stats = _artifact_input_stats(inputs or [])
+    parts: Dict[str, Any] = {"argv": argv, "inputs": input_stats}
+    if env is not None:
+        parts["env"] = sorted((str(k), str(v)) for k, v in env.items())
     return _sha256_text(json.dumps(parts, sort_keys=True, ensure_ascii=False))
 
 
@@ -1980,18 +2248,129 @@ def run_engine_preflight(
     stderr_text = (res.stderr or "").strip()
     if stderr_text:
         noise = _stderr_is_noise(stderr_text)
-        _log_event(
-            logging.DEBUG if noise else logging.WARNING,
-            "preflight.stderr",
-            fn="run_engine_preflight",
-            engine=spec.name,
-            returncode=res.returncode,
-            noise=noise,
-            stderr_preview=_compact_log_text(stderr_text, max_chars=DEFAULT_LOG_FIELD_MAX_CHARS),
-        )
+        stderr_level = logging.DEBUG if noise else logging.WARNING
+        if LOGGER.isEnabledFor(stderr_level):
+            _log_event(
+                stderr_level,
+                "preflight.stderr",
+                fn="run_engine_preflight",
+                engine=spec.name,
+                returncode=res.returncode,
+                noise=noise,
+                stderr_preview=_compact_log_text(stderr_text, max_chars=DEFAULT_LOG_FIELD_MAX_CHARS),
+            )
     return res
 
 
+@dataclass(frozen=True)
+class _PreflightPlan:
+    """Resolved engine invocation for one preflight step."""
+    name: str
+    cmd: List[str]
+    out_file: Path
+    spec: EngineSpec
+    prefix: List[str]
+    env: Dict[str, str]
+    argv: List[str]
+    sig: str
+
+
+def _plan_preflight_step(
+    step: Any,
+    *,
+    qid: str,
+    out_dir: Path,
+    spec: EngineSpec,
+    prefix: List[str],
+    all_specs: Dict[str, EngineSpec] | None,
+    prefix_for_engine: Callable[[EngineSpec], List[str]],
+    env_for_engine: Callable[[str], Dict[str, str]],
+    input_stats: List[Dict[str, Any]],
+    parquet_path: Path,
+    index_path: Path,
+) -> _PreflightPlan | None:
+    """Resolve engine, argv and artifact signature for a preflight step (None if malformed)."""
+    if not isinstance(step, dict):
+        return None
+    name = step.get("name")
+    cmd = step.get("cmd")
+    if not name or not isinstance(cmd, list):
+        return None
+
+    # engine_override: use a different engine's prefix for this preflight step
+    step_spec = spec
+    step_prefix = prefix
+    override_engine = step.get("engine_override")
+    if override_engine and all_specs and override_engine in all_specs:
+        step_spec = all_specs[override_engine]
+        step_prefix = prefix_for_engine(step_spec)
+
+    argv_exact = build_engine_preflight_argv(
+        step_spec,
+        step_prefix,
+        cmd=cmd,
+        index_path=index_path,
+        parquet_path=parquet_path,
+    )
+    return _PreflightPlan(
+        name=name,
+        cmd=cmd,
+        out_file=out_dir / f"{qid}_{name}.json",
+        spec=step_spec,
+        prefix=step_prefix,
+        env=env_for_engine(step_spec.name),
+        argv=argv_exact,
+        sig=build_artifact_signature(argv=argv_exact, input_stats=input_stats),
+    )
+
+
+def _preflight_fences(preflights: List[Any], *, short_circuit: bool) -> Dict[int, int]:
+    """Map fence start index -> end index (exclusive) over the preflight list.
+
+    Steps inside a fence are independent engine calls. With short-circuiting
+    enabled a ``stop_if_nonempty`` step may end the loop, so it closes its
+    fence and later steps are never started ahead of it.
+    """
+    fences: Dict[int, int] = {}
+    start = 0
+    for i, step in enumerate(preflights):
+        if short_circuit and isinstance(step, dict) and bool(step.get("stop_if_nonempty")):
+            fences[start] = i + 1
+            start = i + 1
+    if start < len(preflights):
+        fences[start] = len(preflights)
+    return fences
+
+
+def _start_preflight_prefetch(
+    plans: List[_PreflightPlan],
+    *,
+    max_workers: int,
+    index_path: Path,
+    parquet_path: Path,
+) -> Dict[str, "concurrent.futures.Future[CmdResult]"]:
+    """Run the given preflight plans concurrently; futures keyed by artifact signature.
+
+    Results are consumed (and post-processed) in step order by the caller, so
+    report lines, logs and the signature cache stay serial.
+    """
+    if len(plans) < 2 or max_workers < 2:
+        return {}
+    futures: Dict[str, concurrent.futures.Future[CmdResult]] = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(plans), max_workers)) as ex:
+        for plan in plans:
+            futures[plan.sig] = ex.submit(
+                run_engine_preflight,
+                plan.spec,
+                plan.prefix,
+                cmd=plan.cmd,
+                index_path=index_path,
+                parquet_path=parquet_path,
+                env_overrides=plan.env,
+            )
+    return futures
+
+
 def run_engine_chat(
     spec: EngineSpec,
     prefix: List[str],
@@ -2009,7 +2388,15 @@ def run_engine_chat(
     top_p: float = DEFAULT_TOP_P,
     num_ctx: int | None = None,
     env_overrides: Dict[str, str] | None = None,
+    cache_dir: Path | None = None,
 ) -> CmdResult:
+    """Run one engine chat call.
+
+    With *cache_dir* set (``--cache-chat``), successful results are stored
+    under the signature of the exact argv, the env overrides and the index,
+    parquet and system prompt file stats, and an identical later call is
+    answered from disk. Sampled calls (``temperature > 0``) are never cached.
+    """
     argv: List[str] = prefix + [spec.chat_subcommand, question]
     argv += [spec.index_flag, str(index_path)]
     argv += [spec.parquet_flag, str(parquet_path)]
@@ -2032,21 +2419,59 @@ def run_engine_chat(
         argv += [spec.top_p_flag, str(top_p)]
     if spec.num_ctx_flag and num_ctx is not None:
         argv += [spec.num_ctx_flag, str(num_ctx)]
-    _log_event(
-        logging.INFO,
-        "chat.exec",
-        fn="run_engine_chat",
-        engine=spec.name,
-        backend=backend,
-        model=model or "(default)",
-        top_k=top_k,
-        prompt_profile=prompt_profile or "(none)",
-        system_prompt_file=str(system_prompt_file) if system_prompt_file else "(none)",
-        question_preview=_compact_log_text(question, max_chars=DEFAULT_LOG_PROMPT_MAX_CHARS),
-    )
+    if LOGGER.isEnabledFor(logging.INFO):
+        _log_event(
+            logging.INFO,
+            "chat.exec",
+            fn="run_engine_chat",
+            engine=spec.name,
+            backend=backend,
+            model=model or "(default)",
+            top_k=top_k,
+            prompt_profile=prompt_profile or "(none)",
+            system_prompt_file=str(system_prompt_file) if system_prompt_file else "(none)",
+            question_preview=_compact_log_text(question, max_chars=DEFAULT_LOG_PROMPT_MAX_CHARS),
+        )
+    cache_file: Path | None = None
+    if cache_dir is not None and temperature <= 0:
+        cache_inputs = [index_path, parquet_path] + ([system_prompt_file] if system_prompt_file is not None else [])
+        sig = build_artifact_signature(argv=argv, inputs=cache_inputs, env=env_overrides or {})
+        cache_file = cache_dir / f"{sig}.json"
+        if cache_file.exists():
+            try:
+                cached = load_json_file(cache_file)
+                if cached.get("_sig") == sig:
+                    _log_event(
+                        logging.INFO,
+                        "chat.cache_hit",
+                        fn="run_engine_chat",
+                        engine=spec.name,
+                        artifact=str(cache_file),
+                    )
+                    return CmdResult(
+                        argv=argv,
+                        returncode=int(cached.get("returncode", 0)),
+                        stdout=str(cached.get("stdout") or ""),
+                        stderr=str(cached.get("stderr") or ""),
+                    )
+            except Exception as e:
+                _log_event(
+                    logging.WARNING,
+                    "chat.cache_read_failed",
+                    fn="run_engine_chat",
+                    engine=spec.name,
+                    artifact=str(cache_file),
+                    error=f"{type(e).__name__}: {e}",
+                )
     t0 = time.perf_counter()
     res = run_cmd(argv, env=env_overrides)
     elapsed_ms = int((time.perf_counter() - t0) * 1000)
+    if cache_file is not None and res.returncode == 0:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        write_json(
+            cache_file,
+            {"_sig": cache_file.stem, "returncode": res.returncode, "stdout": res.stdout, "stderr": res.stderr},
+        )
     _log_event(
         logging.INFO,
         "chat.done",
@@ -2060,15 +2485,17 @@ def run_engine_chat(
     stderr_text = (res.stderr or "").strip()
     if stderr_text:
         noise = _stderr_is_noise(stderr_text)
-        _log_event(
-            logging.DEBUG if noise else logging.WARNING,
-            "chat.stderr",
-            fn="run_engine_chat",
-            engine=spec.name,
-            returncode=res.returncode,
-            noise=noise,
-            stderr_preview=_compact_log_text(stderr_text, max_chars=DEFAULT_LOG_FIELD_MAX_CHARS),
-        )
+        stderr_level = logging.DEBUG if noise else logging.WARNING
+        if LOGGER.isEnabledFor(stderr_level):
+            _log_event(
+                stderr_level,
+                "chat.stderr",
+                fn="run_engine_chat",
+                engine=spec.name,
+                returncode=res.returncode,
+                noise=noise,
+                stderr_preview=_compact_log_text(stderr_text, max_chars=DEFAULT_LOG_FIELD_MAX_CHARS),
+            )
     return res
 
 
@@ -2086,6 +2513,16 @@ def validate_response_schema(answer: str, validation: PackValidation) -> List[st
 # =============================================================================
 
 _CITATION_TOKEN_RE = re.compile(_CITATION_TOKEN_PATTERN)
+_RE_FILE_PREFIX = re.compile(r"^\s*file:\s*", re.IGNORECASE)
+_RE_LIST_BULLET_PREFIX = re.compile(r"^\s*[-*]\s+")
+_RE_PATH_PREFIX = re.compile(r"^\s*path:\s*", re.IGNORECASE)
+_RE_CITE_EQ_PREFIX = re.compile(r"^\s*cite\s*=\s*", re.IGNORECASE)
+_RE_SECTION_PREFIX = re.compile(r"^\s*section:\s*", re.IGNORECASE)
+_RE_ARTIFACT_PREFIX = re.compile(r"^\s*artifact:\s*", re.IGNORECASE)
+_RE_TRAILING_PAREN_NOTE = re.compile(r"\s*\([^)]*\)\s*$")
+_RE_FILE_ANCHOR_TOKEN = re.compile(r"^(?P<path>[^:]+)::file anchor\s+(?P<a>\d+):(?P<b>\d+)\s*$", re.IGNORECASE)
+_RE_REPORT_ARTIFACT_NAME = re.compile(r"^R_[A-Z0-9_]+_[A-Za-z0-9_]+\.json$")
+_RE_PATHLINE = re.compile(_PATHLINE_PATTERN)
 
 
 def _normalize_citation_token_for_provenance(tok: str) -> str:
@@ -2093,28 +2530,25 @@ def _normalize_citation_token_for_provenance(tok: str) -> str:
     t = (tok or "").strip()
     if not t:
         return ""
-    t = re.sub(r"^\s*[-*]\s+", "", t)
+    t = _RE_LIST_BULLET_PREFIX.sub("", t)
     t = t.strip("`")
     # Allow optional URI-ish prefix emitted by some models:
     #   file:crates/foo.rs:12  -> crates/foo.rs:12
-    t = re.sub(r"^\s*file:\s*", "", t, flags=re.IGNORECASE)
+    t = _RE_FILE_PREFIX.sub("", t)
     # Some models echo schema docs literally:
     #   path:crates/foo.rs:12  -> crates/foo.rs:12
-    t = re.sub(r"^\s*path:\s*", "", t, flags=re.IGNORECASE)
-    t = re.sub(r"^\s*cite\s*=\s*", "", t, flags=re.IGNORECASE)
-    t = re.sub(r"^\s*section:\s*", "", t, flags=re.IGNORECASE)
-    t = re.sub(r"^\s*artifact:\s*", "", t, flags=re.IGNORECASE)
-    t = re.sub(r"\s*\([^)]*\)\s*$", "", t)
-    m_anchor = re.match(
-        r"^(?P<path>[^:]+)::file anchor\s+(?P<a>\d+):(?P<b>\d+)\s*$",
-        t, flags=re.IGNORECASE,
-    )
+    t = _RE_PATH_PREFIX.sub("", t)
+    t = _RE_CITE_EQ_PREFIX.sub("", t)
+    t = _RE_SECTION_PREFIX.sub("", t)
+    t = _RE_ARTIFACT_PREFIX.sub("", t)
+    t = _RE_TRAILING_PAREN_NOTE.sub("", t)
+    m_anchor = _RE_FILE_ANCHOR_TOKEN.match(t)
     if m_anchor:
         a = int(m_anchor.group("a"))
         b = int(m_anchor.group("b"))
         lo, hi = (a, b) if a <= b else (b, a)
         t = f"{m_anchor.group('path')}:{lo}-{hi}"
-    if (":" not in t) and re.match(r"^R_[A-Z0-9_]+_[A-Za-z0-9_]+\.json$", t):
+    if (":" not in t) and _RE_REPORT_ARTIFACT_NAME.match(t):
         t = t + ":1"
     return t.strip()
 
@@ -2194,33 +2628,46 @@ def _should_skip_low_confidence_missing_path(
     return False
 
 
-def _extract_allowed_citation_tokens(evidence_blocks: List[str]) -> set:
+def _extract_allowed_citation_tokens(evidence_blocks: List[str]) -> frozenset:
     """Extract all citeable path:line(-line) tokens from injected evidence."""
-    blob = "\n".join(evidence_blocks or [])
+    return _allowed_tokens_for(tuple(evidence_blocks or ()))
+
+
+@functools.lru_cache(maxsize=64)
+def _allowed_tokens_for(evidence_blocks: Tuple[str, ...]) -> frozenset:
+    """Cached body of ``_extract_allowed_citation_tokens``.
+
+    The same evidence blocks are scanned again by the repair, retry, advice and
+    provenance paths of a question; the result depends only on the block text.
+    """
+    blob = "\n".join(evidence_blocks)
     raw = _CITATION_TOKEN_RE.findall(blob)
-    pathline_re = re.compile(_PATHLINE_PATTERN)
     out: set = set()
     for tok in raw:
         nt = _normalize_citation_token_for_provenance(tok)
         if not nt:
             continue
-        m = pathline_re.match(nt)
+        m = _RE_PATHLINE.match(nt)
         if not m:
             continue
         p = str(m.groupdict().get("path") or "").strip()
         if _is_low_confidence_path_for_audit(p):
             continue
         out.add(nt)
-    return out
+    return frozenset(out)
+
+
+_RE_CITATIONS_VALUE_LINE = re.compile(r"^\s*CITATIONS\s*[=:]\s*(.*)$", re.MULTILINE)
+_RE_CITATIONS_HEADER_LINE = re.compile(r"^\s*CITATIONS\s*[=:]?\s*$", re.MULTILINE)
 
 
 def _extract_answer_citation_tokens(answer: str) -> List[str]:
     """Extract citation tokens from the CITATIONS line in the answer."""
     clean = (answer or "").replace("**", "")
-    m = re.search(r"^\s*CITATIONS\s*[=:]\s*(.*)$", clean, flags=re.MULTILINE)
+    m = _RE_CITATIONS_VALUE_LINE.search(clean)
     citations_raw = ""
     if not m:
-        cit_header = re.search(r"^\s*CITATIONS\s*[=:]?\s*$", clean, flags=re.MULTILINE)
+        cit_header = _RE_CITATIONS_HEADER_LINE.search(clean)
         if cit_header:
             after = clean[cit_header.end():]
             bullet_tokens = _CITATION_TOKEN_RE.findall(after.split("\n\n")[0])
@@ -2245,7 +2692,7 @@ def _unknown_citation_tokens(tokens: List[str], *, allowed: set) -> List[str]:
     if not allowed:
         return list(tokens)
 
-    pathline_re = re.compile(_PATHLINE_PATTERN)
+    pathline_re = _RE_PATHLINE
     allowed_by_path: Dict[str, List[Tuple[int, int]]] = {}
     for tok in allowed:
         m = pathline_re.match(tok)
@@ -2788,6 +3235,21 @@ def _build_question_evidence_audit(
     }
 
 
+_RE_CITE_MARKER_LINE = re.compile(r"(?mi)^\s*CITE\s*=")
+
+
+# Adaptive top_k reruns dispatch the identical prompt, so its audit fields
+# (chars, sha256, preview, cite markers) are derived once.
+@functools.lru_cache(maxsize=16)
+def _prompt_audit_fields(prompt_text: str) -> Tuple[int, str, str, int]:
+    return (
+        len(prompt_text),
+        _sha256_text(prompt_text),
+        _compact_log_text(prompt_text, max_chars=DEFAULT_LOG_PROMPT_MAX_CHARS),
+        len(_RE_CITE_MARKER_LINE.findall(prompt_text)),
+    )
+
+
 def _append_llm_dispatch_to_audit(
     *,
     audit: Dict[str, Any],
@@ -2805,6 +3267,7 @@ def _append_llm_dispatch_to_audit(
         dispatches = []
         audit["llm_dispatches"] = dispatches
     sample_n = int(EVIDENCE_AUDIT_SAMPLE_ITEMS)
+    prompt_chars, prompt_sha256, prompt_preview, prompt_cite_markers = _prompt_audit_fields(prompt_text or "")
     rec = {
         "attempt": len(dispatches) + 1,
         "phase": str(phase),
@@ -2814,19 +3277,28 @@ def _append_llm_dispatch_to_audit(
         "top_k": int(top_k),
         "prompt_profile": str(prompt_profile or "(none)"),
         "system_prompt_file": str(prompt_file) if prompt_file else "(none)",
-        "prompt_chars": len(prompt_text or ""),
-        "prompt_sha256": _sha256_text(prompt_text or ""),
-        "prompt_preview": _compact_log_text(prompt_text or "", max_chars=DEFAULT_LOG_PROMPT_MAX_CHARS),
-        "prompt_cite_markers": len(re.findall(r"(?mi)^\s*CITE\s*=", prompt_text or "")),
+        "prompt_chars": prompt_chars,
+        "prompt_sha256": prompt_sha256,
+        "prompt_preview": prompt_preview,
+        "prompt_cite_markers": prompt_cite_markers,
         "evidence_paths_sample": (audit.get("evidence_paths_sample") or [])[:sample_n],
     }
     dispatches.append(rec)
     return rec
 
 
-def _write_question_evidence_audit(out_dir: Path, qid: str, audit: Dict[str, Any]) -> Path:
+def _write_question_evidence_audit(
+    out_dir: Path,
+    qid: str,
+    audit: Dict[str, Any],
+    *,
+    writer: "_ArtifactWriter | None" = None,
+) -> Path:
     path = out_dir / _evidence_audit_artifact_name(qid)
-    write_json(path, audit)
+    if writer is not None:
+        writer.write_json(path, audit)
+    else:
+        write_json(path, audit)
     return path
 
 
@@ -3276,6 +3748,9 @@ def generate_run_manifest(
     return path
 
 
+_RE_REPORT_QUESTION_HEADING = re.compile(r"^## ([A-Z0-9_]+):", re.MULTILINE)
+
+
 def _parse_report_ok_count(
     report_path: Path,
     *,
@@ -3290,9 +3765,12 @@ def _parse_report_ok_count(
     """
     if not report_path.exists():
         return (0, 0, 0)
+    return _report_ok_count(report_path.read_text(encoding="utf-8"), include_advice_issues=include_advice_issues)
 
-    content = report_path.read_text(encoding="utf-8")
-    q_matches = list(re.finditer(r"^## ([A-Z0-9_]+):", content, re.MULTILINE))
+
+def _report_ok_count(content: str, *, include_advice_issues: bool = False) -> Tuple[int, int, int]:
+    """``_parse_report_ok_count`` on report text already in memory."""
+    q_matches = list(_RE_REPORT_QUESTION_HEADING.finditer(content))
     question_count = len(q_matches)
     if question_count == 0:
         return (0, 0, 0)
@@ -3319,9 +3797,10 @@ def generate_stability_summary(
     out_dir: Path,
     *,
     title: str = PACK_STABILITY_TITLE,
-) -> Path:
+) -> Tuple[Path, str]:
+    """Write STABILITY_SUMMARY.md; returns its path and the text written ("" when there are no results)."""
     if not results:
-        return out_dir / STABILITY_FILE
+        return out_dir / STABILITY_FILE, ""
 
     scores = [r[2] for r in results]
     totals = [r[3] for r in results]
@@ -3350,8 +3829,9 @@ def generate_stability_summary(
         lines.append(f"| {seed} | {ok}/{total} | {issue_count} | [{path.name}]({path.name}) |\n")
 
     summary_path = out_dir / STABILITY_FILE
-    write_text(summary_path, "".join(lines))
-    return summary_path
+    summary_text = "".join(lines)
+    write_text(summary_path, summary_text)
+    return summary_path, summary_text
 
 
 # =============================================================================
@@ -3367,17 +3847,23 @@ _DEFAULT_TEST_PATH_PATTERNS_FALLBACK = list(DEFAULT_TEST_PATH_PATTERNS) or [
 
 _TEST_PATH_REGEX_CACHE: Dict[Tuple[str, ...], List[re.Pattern[str]]] = {}
 _TRANSFORM_REGEX_CACHE: Dict[Tuple[str, ...], List[re.Pattern[str]]] = {}
+_COMBINED_REGEX_CACHE: Dict[Tuple[str, ...], Optional[re.Pattern[str]]] = {}
+_RE_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+# Shared result for empty pattern lists (frozen by convention; callers only iterate).
+_EMPTY_PATTERNS: List[re.Pattern[str]] = []
 
 
 def _compile_test_regexes(patterns: List[str]) -> List[re.Pattern[str]]:
     """Compile and cache a list of regex patterns."""
+    if not patterns:
+        return _EMPTY_PATTERNS
     key = tuple(patterns)
     if key in _TEST_PATH_REGEX_CACHE:
         return _TEST_PATH_REGEX_CACHE[key]
     compiled: List[re.Pattern[str]] = []
     for p in patterns:
         try:
-            compiled.append(re.compile(str(p)))
+            compiled.append(re.compile(p if isinstance(p, str) else str(p)))
         except re.error as e:
             raise SystemExit(f"Invalid test_path_patterns regex: {p!r} ({e})")
     _TEST_PATH_REGEX_CACHE[key] = compiled
@@ -3393,13 +3879,15 @@ def _compile_transform_regexes(
 
     Fail-closed: invalid regex patterns are treated as pack-invalid configuration.
     """
+    if not patterns:
+        return _EMPTY_PATTERNS
     key = (context,) + tuple(patterns)
     if key in _TRANSFORM_REGEX_CACHE:
         return _TRANSFORM_REGEX_CACHE[key]
     compiled: List[re.Pattern[str]] = []
     for p in patterns:
         try:
-            compiled.append(re.compile(str(p)))
+            compiled.append(re.compile(p if isinstance(p, str) else str(p)))
         except re.error as e:
             _log_event(
                 logging.ERROR,
@@ -3416,6 +3904,46 @@ def _compile_transform_regexes(
     return compiled
 
 
+def _combined_search_regex(patterns: List[str], *, context: str) -> Optional[re.Pattern[str]]:
+    """One alternation of *patterns* so "any pattern matches" is a single search.
+
+    Returns None (callers keep the per-pattern loop) when the patterns cannot be
+    merged safely: backreferences and conditional group references would be
+    renumbered, and inline global flags are only legal at the start of an
+    expression.
+    """
+    key = (context,) + tuple(patterns)
+    if key in _COMBINED_REGEX_CACHE:
+        return _COMBINED_REGEX_CACHE[key]
+    combined: Optional[re.Pattern[str]] = None
+    if patterns and not any(_RE_BACKREFERENCE.search(p) for p in patterns):
+        try:
+            combined = re.compile("|".join(f"(?:{p})" for p in patterns))
+        except re.error as e:
+            _log_event(
+                logging.DEBUG,
+                "preflight.transform.combined_regex_fallback",
+                fn="_combined_search_regex",
+                context=context,
+                error=str(e),
+            )
+    _COMBINED_REGEX_CACHE[key] = combined
+    return combined
+
+
+def _any_search_fn(
+    patterns: List[str],
+    compiled: List[re.Pattern[str]],
+    *,
+    context: str,
+) -> Callable[[str], Any]:
+    """Truthy-on-match predicate: "any of *compiled* matches" as one regex scan when possible."""
+    combined = _combined_search_regex([str(p) for p in patterns], context=context)
+    if combined is not None:
+        return combined.search
+    return lambda s: any(rx.search(s) for rx in compiled)
+
+
 _DEFAULT_TEST_PATTERNS_BY_PATH: Dict[str, List[str]] = {}
 _QUESTION_VALIDATORS_CFG_BY_PATH: Dict[str, Dict[str, Any]] = {}
 
@@ -3491,6 +4019,11 @@ def _load_question_validators_cfg(pack: "Pack", pack_path: Path) -> Dict[str, An
 _RS_FILELINE_RE = re.compile(r"[A-Za-z0-9_.\-/]+\.rs:\d+(?:-\d+)?")
 
 
+# Question-validator rule regexes by pattern text: the compiled pattern, or the
+# re.error message for an invalid one (reported on every call, as before).
+_QV_REGEX_CACHE: Dict[str, re.Pattern[str] | str] = {}
+
+
 def _apply_question_validators(*, qid: str, answer_text: str, cfg: Dict[str, Any], default_test_path_patterns: List[str]) -> List[str]:
     if not answer_text or not isinstance(cfg, dict):
         return []
@@ -3502,11 +4035,17 @@ def _apply_question_validators(*, qid: str, answer_text: str, cfg: Dict[str, Any
         return []
     issues: List[str] = []
     def _compile(pattern: str, *, label: str):
-        try:
-            return re.compile(str(pattern))
-        except Exception as e:
-            issues.append(f"{qid}: invalid {label} regex: {pattern!r} ({e})")
+        cre = _QV_REGEX_CACHE.get(pattern)
+        if cre is None:
+            try:
+                cre = re.compile(str(pattern))
+            except Exception as e:
+                cre = str(e)
+            _QV_REGEX_CACHE[pattern] = cre
+        if isinstance(cre, str):
+            issues.append(f"{qid}: invalid {label} regex: {pattern!r} ({cre})")
             return None
+        return cre
     for rule in rules:
         if not isinstance(rule, dict):
             continue
@@ -3588,8 +4127,9 @@ def _unique_paths(rows: List[Dict[str, Any]]) -> List[str]:
     """Return deduplicated, order-preserving path list from preflight rows."""
     out: List[str] = []
     seen: set[str] = set()
+    path_keys = _effective_path_keys()
     for r in rows:
-        p = _get_path(r)
+        p = _get_path_fast(r, path_keys)
         if not p or p in seen:
             continue
         seen.add(p)
@@ -3597,21 +4137,27 @@ def _unique_paths(rows: List[Dict[str, Any]]) -> List[str]:
     return out
 
 
-def _summarize_transform_filters(transform: Dict[str, Any]) -> Dict[str, Any]:
-    """Build compact diagnostics for transform filters used in logs."""
-    include_patterns = _coerce_transform_regex_list(transform.get("include_path_regex"))
+def _ensure_coerced(transform: Dict[str, Any]) -> Dict[str, Any]:
+    """Coerce transform regex/pattern fields once and stash them on *transform*.
 
+    Populates ``_coerced_include``, ``_coerced_exclude``, ``_coerced_require``
+    and the resolved ``_coerced_test_patterns`` so both the filter and the
+    diagnostics paths share a single coerce pass per step. Callers pass a
+    per-step copy of the pack transform, so the stash never leaks into YAML.
+    """
+    if "_coerced_include" in transform:
+        return transform
+    # If a step explicitly sets exclude_path_regex (even to an empty list),
+    # honor that value and do not fall back to runner defaults.
     if "exclude_path_regex" in transform:
         exclude_raw = transform.get("exclude_path_regex")
         exclude_pattern_source = "explicit"
     else:
         exclude_raw = transform.get("_default_exclude_path_regex")
         exclude_pattern_source = "default" if exclude_raw else "none"
-    exclude_patterns = _coerce_transform_regex_list(exclude_raw)
 
-    exclude_test_files = bool(transform.get("exclude_test_files"))
     test_patterns: List[str] = []
-    if exclude_test_files:
+    if transform.get("exclude_test_files"):
         tp = transform.get("test_path_patterns")
         default_tp = transform.get("_default_test_path_patterns")
         if isinstance(tp, list) and tp:
@@ -3626,11 +4172,48 @@ def _summarize_transform_filters(transform: Dict[str, Any]) -> Dict[str, Any]:
     else:
         test_pattern_source = "disabled"
 
+    transform["_coerced_include"] = _coerce_transform_regex_list(transform.get("include_path_regex"))
+    transform["_coerced_exclude"] = _coerce_transform_regex_list(exclude_raw)
+    transform["_coerced_exclude_source"] = exclude_pattern_source
+    transform["_coerced_require"] = _coerce_transform_regex_list(transform.get("require_regex"))
+    transform["_coerced_test_patterns"] = test_patterns
+    transform["_coerced_test_source"] = test_pattern_source
+    return transform
+
+
+def _transform_filter_sig(transform: Dict[str, Any]) -> str | None:
+    """Fingerprint of a row filter: transform config plus the key state it reads.
+
+    Stored on a filtered artifact so a rerun over the cached artifact can skip
+    re-filtering rows that the same filter already produced (the filters are
+    idempotent predicates). None for cross-preflight transforms, whose result
+    also depends on other steps' rows.
+    """
+    if transform.get("group_by_path_top_n") is not None:
+        return None
+    parts: Dict[str, Any] = {
+        "transform": {k: v for k, v in transform.items() if not str(k).startswith("_coerced_")},
+        "path_keys": list(_effective_path_keys()),
+        "snippet_keys": list(_effective_snippet_keys()),
+    }
+    return _sha256_text(json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str))
+
+
+def _summarize_transform_filters(transform: Dict[str, Any]) -> Dict[str, Any]:
+    """Build compact diagnostics for transform filters used in logs."""
+    _ensure_coerced(transform)
+    include_patterns = transform["_coerced_include"]
+    exclude_patterns = transform["_coerced_exclude"]
+    exclude_pattern_source = transform["_coerced_exclude_source"]
+    exclude_test_files = bool(transform.get("exclude_test_files"))
+    test_patterns = transform["_coerced_test_patterns"]
+    test_pattern_source = transform["_coerced_test_source"]
+
     require_contains = transform.get("require_contains")
     if not isinstance(require_contains, str) or not require_contains.strip():
         require_contains = None
 
-    require_regex_patterns = _coerce_transform_regex_list(transform.get("require_regex"))
+    require_regex_patterns = transform["_coerced_require"]
     group_by_path_top_n = transform.get("group_by_path_top_n")
     if not isinstance(group_by_path_top_n, dict):
         group_by_path_top_n = None
@@ -3702,7 +4285,12 @@ def _row_count_maybe(row: Dict[str, Any]) -> int:
     Looks for ``count``, ``total``, ``unwraps``, ``expects`` — the field
     names produced by ``rsqt prod-unwraps`` / ``rsqt prod-expects``.
     """
-    for key in _effective_row_count_keys():
+    return _row_count_maybe_fast(row, _effective_row_count_keys())
+
+
+def _row_count_maybe_fast(row: Dict[str, Any], keys: Tuple[str, ...]) -> int:
+    """``_row_count_maybe`` with a pre-fetched ``_effective_row_count_keys()`` tuple."""
+    for key in keys:
         v = row.get(key)
         if v is not None:
             return _safe_int(v)
@@ -3726,14 +4314,16 @@ def _top_paths_from_aggregate_rows(
     directly instead of the generic ``_row_count_maybe`` heuristic.
     """
     scored: List[tuple] = []
+    path_keys = _effective_path_keys()
+    count_keys = _effective_row_count_keys()
     for r in rows:
-        p = _get_path(r)
+        p = _get_path_fast(r, path_keys)
         if not p:
             continue
         if sort_key:
             scored.append((p, _safe_int(r.get(sort_key, 0))))
         else:
-            scored.append((p, _row_count_maybe(r)))
+            scored.append((p, _row_count_maybe_fast(r, count_keys)))
     scored.sort(key=lambda t: t[1], reverse=True)
     return [p for p, _ in scored[:top_n]]
 
@@ -3747,8 +4337,9 @@ def _group_rows_by_path_and_limit(
     counts: Dict[str, int] = {}
     out: List[Dict[str, Any]] = []
     allowed_set = set(allowed_paths)
+    path_keys = _effective_path_keys()
     for r in rows:
-        p = _get_path(r)
+        p = _get_path_fast(r, path_keys)
         if p not in allowed_set:
             continue
         c = counts.get(p, 0)
@@ -3759,6 +4350,39 @@ def _group_rows_by_path_and_limit(
     return out
 
 
+# stage -> (coerced pattern slot, regex context); test patterns compile via
+# _compile_test_regexes, the others via _compile_transform_regexes.
+_TRANSFORM_MATCH_STAGES: Dict[str, Tuple[str, str]] = {
+    "include": ("_coerced_include", "include_path_regex"),
+    "exclude": ("_coerced_exclude", "exclude_path_regex"),
+    "test": ("_coerced_test_patterns", "test_path_patterns"),
+    "require": ("_coerced_require", "require_regex"),
+}
+
+
+def _transform_matcher(transform: Dict[str, Any], stage: str) -> Optional[Callable[[str], Any]]:
+    """Return the "any pattern matches" predicate for a filter stage (None without patterns).
+
+    Stashed on the (per-step, coerced) transform next to the coerced patterns,
+    so compiled regexes are looked up once per step rather than once per call.
+    """
+    slot = f"_coerced_{stage}_match"
+    if slot in transform:
+        return transform[slot]
+    patterns_slot, context = _TRANSFORM_MATCH_STAGES[stage]
+    patterns = transform[patterns_slot]
+    matcher: Optional[Callable[[str], Any]] = None
+    if patterns:
+        if stage == "test":
+            compiled = _compile_test_regexes(patterns)
+        else:
+            compiled = _compile_transform_regexes(patterns, context=context)
+        if compiled:
+            matcher = _any_search_fn(patterns, compiled, context=context)
+    transform[slot] = matcher
+    return matcher
+
+
 def _apply_transform_filters(rows: List[Dict[str, Any]], transform: Dict[str, Any], *, ctx: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """Apply semantic filters from a step's transform block.
 
@@ -3778,54 +4402,54 @@ def _apply_transform_filters(rows: List[Dict[str, Any]], transform: Dict[str, An
     The optional *ctx* dict may carry ``preflight_rows_by_name`` for
     cross-preflight transforms like ``group_by_path_top_n``.
     """
-    include_path_regex = transform.get("include_path_regex")
-    include_patterns = _coerce_transform_regex_list(include_path_regex)
-    if include_patterns:
-        include_res = _compile_transform_regexes(include_patterns, context="include_path_regex")
-        if include_res:
-            kept: List[Dict[str, Any]] = []
-            for r in rows:
-                p = _get_path(r)
-                if p and any(rx.search(p) for rx in include_res):
-                    kept.append(r)
-            rows = kept
-
-    # If a step explicitly sets exclude_path_regex (even to an empty list),
-    # honor that value and do not fall back to runner defaults.
-    if "exclude_path_regex" in transform:
-        exclude_path_regex = transform.get("exclude_path_regex")
-    else:
-        exclude_path_regex = transform.get("_default_exclude_path_regex")
-    exclude_patterns = _coerce_transform_regex_list(exclude_path_regex)
-    if exclude_patterns:
-        exclude_res = _compile_transform_regexes(exclude_patterns, context="exclude_path_regex")
-        if exclude_res:
-            rows = [r for r in rows if not any(rx.search(_get_path(r)) for rx in exclude_res)]
+    if not rows:
+        return rows
+    _ensure_coerced(transform)
+    # Runtime keys are learned from the payload before filtering, so one
+    # snapshot per call is enough for every stage below.
+    path_keys = _effective_path_keys()
+    snippet_keys = _effective_snippet_keys()
+    include_match = _transform_matcher(transform, "include")
+    if include_match is not None:
+        kept: List[Dict[str, Any]] = []
+        for r in rows:
+            p = _get_path_fast(r, path_keys)
+            if p and include_match(p):
+                kept.append(r)
+        rows = kept
+        if not rows:
+            return rows
+
+    exclude_match = _transform_matcher(transform, "exclude")
+    if exclude_match is not None:
+        rows = [r for r in rows if not exclude_match(_get_path_fast(r, path_keys))]
+        if not rows:
+            return rows
 
     if transform.get("exclude_test_files"):
-        tp = transform.get("test_path_patterns")
-        default_tp = transform.get("_default_test_path_patterns")
-        pats = tp if isinstance(tp, list) and tp else (default_tp or _DEFAULT_TEST_PATH_PATTERNS_FALLBACK)
-        rows = [r for r in rows if not _is_test_file(_get_path(r), patterns=[str(x) for x in pats])]
+        test_match = _transform_matcher(transform, "test")
+        if test_match is not None:
+            rows = [r for r in rows if not test_match(_get_path_fast(r, path_keys))]
+            if not rows:
+                return rows
     if transform.get("exclude_comments"):
-        rows = [r for r in rows if not _is_comment_line(_extract_line_text(r))]
+        rows = [r for r in rows if not _is_comment_line(_extract_line_text_fast(r, snippet_keys))]
+        if not rows:
+            return rows
     rc = transform.get("require_contains")
     if rc and isinstance(rc, str):
-        rows = [r for r in rows if rc in _extract_line_text(r)]
-    rr = transform.get("require_regex")
-    if rr:
-        pats: List[str] = []
-        if isinstance(rr, str):
-            pats = [rr]
-        elif isinstance(rr, list):
-            pats = [p for p in rr if isinstance(p, str)]
-        if pats:
-            compiled = _compile_transform_regexes(pats, context="require_regex")
-            rows = [
-                r
-                for r in rows
-                if any(c.search(f"{_get_path(r) or ''}\n{_extract_line_text(r)}") for c in compiled)
-            ]
+        rows = [r for r in rows if rc in _extract_line_text_fast(r, snippet_keys)]
+        if not rows:
+            return rows
+    require_match = _transform_matcher(transform, "require")
+    if require_match is not None:
+        rows = [
+            r
+            for r in rows
+            if require_match(f"{_get_path_fast(r, path_keys) or ''}\n{_extract_line_text_fast(r, snippet_keys)}")
+        ]
+        if not rows:
+            return rows
     gbp = transform.get("group_by_path_top_n")
     if isinstance(gbp, dict) and ctx:
         from_name = gbp.get("from", "")
@@ -3846,6 +4470,8 @@ def _apply_transform_filters(rows: List[Dict[str, Any]], transform: Dict[str, An
         if ref_rows:
             allowed_paths = _top_paths_from_aggregate_rows(ref_rows, top_n, sort_key=sort_key)
             rows = _group_rows_by_path_and_limit(rows, allowed_paths, per_path)
+            if not rows:
+                return rows
     fn_name = transform.get("filter_fn")
     if fn_name == "compact_docs":
         rows = [r for r in rows if _has_real_doc(r)]
@@ -3853,16 +4479,45 @@ def _apply_transform_filters(rows: List[Dict[str, Any]], transform: Dict[str, An
 
 
 def _iter_rows(obj: Any) -> List[Dict[str, Any]]:
+    return _iter_rows_keyed(obj)[0]
+
+
+def _iter_rows_keyed(obj: Any) -> Tuple[List[Dict[str, Any]], str | None]:
+    """_iter_rows plus the detected row-container key (None for lists/non-dicts)."""
     if isinstance(obj, list):
-        return [x for x in obj if isinstance(x, dict)]
+        return [x for x in obj if isinstance(x, dict)], None
     if isinstance(obj, dict):
         key = _detect_row_container_key(obj)
         if key:
             rows = [x for x in (obj.get(key) or []) if isinstance(x, dict)]
             if rows:
                 _runtime_add_key("iter_rows_keys", str(key))
-                return rows
-    return []
+                return rows, key
+        return [], key
+    return [], None
+
+
+def _count_iter_rows(obj: Any) -> int:
+    """len(_iter_rows(obj)) without building the row list."""
+    if isinstance(obj, list):
+        return sum(1 for x in obj if isinstance(x, dict))
+    if isinstance(obj, dict):
+        key = _detect_row_container_key(obj)
+        if key:
+            n = sum(1 for x in (obj.get(key) or []) if isinstance(x, dict))
+            if n:
+                _runtime_add_key("iter_rows_keys", str(key))
+            return n
+    return 0
+
+
+def _has_iter_rows(obj: Dict[str, Any]) -> bool:
+    """bool(_iter_rows(obj)) for a dict payload, stopping at the first row."""
+    key = _detect_row_container_key(obj)
+    if key and any(isinstance(x, dict) for x in (obj.get(key) or [])):
+        _runtime_add_key("iter_rows_keys", str(key))
+        return True
+    return False
 
 
 def _detect_row_container_key(obj: Any) -> str | None:
@@ -3930,6 +4585,33 @@ def _nonempty_stdout(stdout_data: Any) -> bool:
     return False
 
 
+def _doc_visibility_counts(ents: List[Any]) -> Dict[str, int]:
+    """DOC_SUMMARY visibility tallies for doc_analysis entities (non-dict entries skipped)."""
+    pub_has_doc: List[bool] = []
+
+    def _visibility(e: Dict[str, Any]) -> str:
+        v = (e.get("visibility") or "").strip()
+        if v == "pub":
+            d = e.get("doc")
+            pub_has_doc.append(bool(d.get("has_doc")) if isinstance(d, dict) else False)
+        return v
+
+    # Counter tallies in C; only the visibility lookup runs per entity.
+    vis = Counter(_visibility(e) for e in ents if isinstance(e, dict))
+    pub = vis.pop("pub", 0)
+    pub_doc = sum(pub_has_doc)
+    pub_crate = vis.pop("pub(crate)", 0)
+    private = vis.pop("private", 0)
+    return {
+        "pub_shown": pub,
+        "pub_doc_shown": pub_doc,
+        "pub_undoc_shown": pub - pub_doc,
+        "pub_crate_shown": pub_crate,
+        "private_shown": private,
+        "other_vis_shown": sum(vis.values()),
+    }
+
+
 def _has_preflight_hits(stdout_data: Any) -> bool:
     """Return True when preflight output indicates at least one concrete hit."""
     if stdout_data is None:
@@ -3944,8 +4626,7 @@ def _has_preflight_hits(stdout_data: Any) -> bool:
     if isinstance(stdout_data, dict):
         if bool(stdout_data.get("_stdout_filtered_to_zero")):
             return False
-        rows = _iter_rows(stdout_data)
-        if rows:
+        if _has_iter_rows(stdout_data):
             return True
         for k in _effective_has_hits_count_keys():
             v = stdout_data.get(k)
@@ -4020,7 +4701,12 @@ def _shorten(s: str, max_len: int = int(EVIDENCE_SHORTEN.get("default", 200))) -
 
 
 def _get_path(row: Dict[str, Any]) -> str:
-    for k in _effective_path_keys():
+    return _get_path_fast(row, _effective_path_keys())
+
+
+def _get_path_fast(row: Dict[str, Any], keys: Tuple[str, ...]) -> str:
+    """``_get_path`` with a pre-fetched ``_effective_path_keys()`` tuple (for row loops)."""
+    for k in keys:
         v = row.get(k)
         if v:
             s = str(v).strip().replace("\\", "/")
@@ -4030,7 +4716,7 @@ def _get_path(row: Dict[str, Any]) -> str:
                 # RAG rows frequently use `title=path::symbol_kind ...`; keep only
                 # the concrete file path prefix so path-gating/citation filters work.
                 s = s.split("::", 1)[0].strip()
-            s = re.sub(r"^\s*file:\s*", "", s, flags=re.IGNORECASE)
+            s = _RE_FILE_PREFIX.sub("", s)
             if s:
                 return s
     for k, v in row.items():
@@ -4040,7 +4726,7 @@ def _get_path(row: Dict[str, Any]) -> str:
         if not _is_path_key_candidate(lk):
             continue
         s = str(v).strip().replace("\\", "/")
-        s = re.sub(r"^\s*file:\s*", "", s, flags=re.IGNORECASE)
+        s = _RE_FILE_PREFIX.sub("", s)
         if _looks_like_repo_path_text(s):
             _runtime_add_key("path_keys", str(k))
             return s
@@ -4048,7 +4734,12 @@ def _get_path(row: Dict[str, Any]) -> str:
 
 
 def _get_line_start(row: Dict[str, Any]) -> str:
-    for k in _effective_line_keys():
+    return _get_line_start_fast(row, _effective_line_keys())
+
+
+def _get_line_start_fast(row: Dict[str, Any], keys: Tuple[str, ...]) -> str:
+    """``_get_line_start`` with a pre-fetched ``_effective_line_keys()`` tuple."""
+    for k in keys:
         v = row.get(k)
         if v is not None:
             return str(v)
@@ -4068,9 +4759,26 @@ def _get_line_end(row: Dict[str, Any]) -> str:
 
 def _loc_str(row: Dict[str, Any]) -> str:
     """Format 'path:line' or 'path:start-end' location string."""
-    fp = _get_path(row)
-    ls = _get_line_start(row)
-    le = _get_line_end(row)
+    return _loc_str_fast(row, _effective_path_keys(), _effective_line_keys())
+
+
+def _loc_str_fast(row: Dict[str, Any], path_keys: Tuple[str, ...], line_keys: Tuple[str, ...]) -> str:
+    """``_loc_str`` with pre-fetched path/line key tuples (for row loops)."""
+    return _format_loc(
+        _get_path_fast(row, path_keys),
+        _get_line_start_fast(row, line_keys),
+        _get_line_end(row),
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_loc(fp: str, ls: str, le: str) -> str:
+    """Compose the location string from extracted path/line values.
+
+    Pure in its (string) arguments, so it is memoized: evidence rows cluster
+    by file and repeat the same locations. The row accessors stay uncached
+    because they can learn runtime keys.
+    """
     if fp and ls and le and le != ls:
         return f"{fp}:{ls}-{le}"
     if fp and ls:
@@ -4109,7 +4817,12 @@ def _extract_doc_text(row: Dict[str, Any]) -> str:
 
 def _extract_line_text(row: Dict[str, Any]) -> str:
     """Extract source line text (search results, pub use lines, etc.)."""
-    for k in _effective_snippet_keys():
+    return _extract_line_text_fast(row, _effective_snippet_keys())
+
+
+def _extract_line_text_fast(row: Dict[str, Any], keys: Tuple[str, ...]) -> str:
+    """``_extract_line_text`` with a pre-fetched ``_effective_snippet_keys()`` tuple."""
+    for k in keys:
         v = row.get(k)
         if v and isinstance(v, str):
             return v
@@ -4122,61 +4835,140 @@ def _extract_line_text(row: Dict[str, Any]) -> str:
 
 def _remaining_fields(row: Dict[str, Any], extracted_keys: set) -> Dict[str, Any]:
     """Return non-extracted, non-path/line fields (unknown-key fallback)."""
-    skip = frozenset(_effective_path_keys() + _effective_line_keys() + ("line_end",)) | extracted_keys
-    remaining = {}
+    base_skip = _base_skip_keys()
+    cap = max(0, int(ISSUE_CAPS.get("unknown_key_fields", 5)))
+    return dict(
+        itertools.islice(
+            (
+                (k, v)
+                for k, v in row.items()
+                if k not in base_skip and k not in extracted_keys and v is not None and v != "" and v != 0
+            ),
+            cap,
+        )
+    )
+
+
+
+
+@dataclass
+class _RowView:
+    """Per-row fields used by the list renderer, extracted once per row."""
+    loc: str
+    counts: Dict[str, int]
+    sig: str
+    doc: str
+    line_text: str
+    remaining: Dict[str, Any]
+
+
+def _view_row(
+    row: Dict[str, Any],
+    *,
+    path_keys: Tuple[str, ...],
+    line_keys: Tuple[str, ...],
+    snippet_keys: Tuple[str, ...],
+) -> _RowView:
+    """Build a ``_RowView``; counts and unknown-key candidates share one walk of *row*.
+
+    Equivalent to calling ``_loc_str``/``_extract_*``/``_remaining_fields`` separately.
+    """
+    loc = _loc_str_fast(row, path_keys, line_keys)
+    base_skip = _base_skip_keys()
+    counts: Dict[str, int] = {}
+    candidates: List[Tuple[str, Any]] = []
     for k, v in row.items():
-        if k not in skip and v is not None and v != "" and v != 0:
-            remaining[k] = v
-    return dict(list(remaining.items())[: int(ISSUE_CAPS.get("unknown_key_fields", 5))])
+        if k.endswith("_count") and isinstance(v, (int, float)):
+            counts[k] = int(v)
+        elif k not in base_skip and v is not None and v != "" and v != 0:
+            candidates.append((k, v))
+
+    sig = _extract_signature(row)
+    doc = _extract_doc_text(row)
+    line_text = _extract_line_text_fast(row, snippet_keys)
+
+    extracted_keys: set = set()
+    if sig:
+        extracted_keys.update(("signature", "signature_meta"))
+    if doc:
+        extracted_keys.update(("doc", "has_doc"))
+    if line_text:
+        # Re-read: the snippet fallback above may have learned a new key.
+        extracted_keys.update(_effective_snippet_keys())
+    cap = max(0, int(ISSUE_CAPS.get("unknown_key_fields", 5)))
+    remaining = dict(itertools.islice(((k, v) for k, v in candidates if k not in extracted_keys), cap))
+
+    return _RowView(
+        loc=loc,
+        counts=counts,
+        sig=sig,
+        doc=doc,
+        line_text=line_text,
+        remaining=remaining,
+    )
+
 
+def _append_more_marker(out: List[str], total: int, remaining: int, max_chars: int) -> None:
+    """Append a ``... (N more)`` line, dropping trailing rows until it fits *max_chars*.
 
+    *total* is the running size of *out* counted as ``len(line) + 1`` per line.
+    """
+    while True:
+        marker = f"  ... ({remaining} more)"
+        if not out or total + len(marker) <= max_chars:
+            out.append(marker)
+            return
+        total -= len(out.pop()) + 1
+        remaining += 1
 
 
 def _format_list_rows(
     rows: List[Dict[str, Any]],
     max_chars: int = int(EVIDENCE_MAX_CHARS.get("list", 1600)),
 ) -> str:
-    """Compact per-row summaries with counts, signature, doc text, line text."""
+    """Compact per-row summaries with counts, signature, doc text, line text.
+
+    Rows are formatted until the *max_chars* budget is reached; trailing rows
+    are summarized by a ``... (N more)`` line instead of being formatted.
+    """
     out: List[str] = []
+    total = 0
+    path_keys = _effective_path_keys()
+    line_keys = _effective_line_keys()
+    snippet_keys = _effective_snippet_keys()
     for i, r in enumerate(rows):
-        loc = _loc_str(r)
-        parts = [f"{i+1}. {loc}"] if loc else [f"{i+1}."]
+        view = _view_row(r, path_keys=path_keys, line_keys=line_keys, snippet_keys=snippet_keys)
+        parts = [f"{i+1}. {view.loc}"] if view.loc else [f"{i+1}."]
 
-        counts = _extract_counts(r)
-        if counts:
-            parts.append(" ".join(f"{k}={v}" for k, v in counts.items()))
+        if view.counts:
+            parts.append(" ".join(f"{k}={v}" for k, v in view.counts.items()))
 
-        sig = _extract_signature(r)
-        if sig:
-            parts.append(f"sig: {_shorten(sig, int(EVIDENCE_SHORTEN.get('signature', 120)))}")
+        if view.sig:
+            parts.append(f"sig: {_shorten(view.sig, int(EVIDENCE_SHORTEN.get('signature', 120)))}")
 
-        doc = _extract_doc_text(r)
-        if doc:
-            parts.append(f"doc: {_shorten(doc, int(EVIDENCE_SHORTEN.get('doc', 100)))}")
+        if view.doc:
+            parts.append(f"doc: {_shorten(view.doc, int(EVIDENCE_SHORTEN.get('doc', 100)))}")
 
-        line_text = _extract_line_text(r)
-        if line_text:
-            s = line_text.replace("\n", " ").strip()
+        if view.line_text:
+            s = view.line_text.replace("\n", " ").strip()
             parts.append(_shorten(s, int(EVIDENCE_SHORTEN.get("line_text", 200))))
 
         # Unknown-key fallback (prevent future field-drop bugs)
-        extracted_keys = set()
-        if counts:
-            extracted_keys.update(counts.keys())
-        if sig:
-            extracted_keys.update(("signature", "signature_meta"))
-        if doc:
-            extracted_keys.update(("doc", "has_doc"))
-        if line_text:
-            extracted_keys.update(_effective_snippet_keys())
-        remaining = _remaining_fields(r, extracted_keys)
-        if remaining:
-            parts.append("+" + ",".join(f"{k}={v!r}" for k, v in remaining.items()))
-
-        out.append("  " + " | ".join(parts))
+        if view.remaining:
+            parts.append("+" + ",".join(f"{k}={v!r}" for k, v in view.remaining.items()))
+
+        line = "  " + " | ".join(parts)
+        if total + len(line) > max_chars:
+            if not out:
+                # A single oversized row is still evidence; keep its prefix.
+                out.append(line[:max_chars])
+            else:
+                _append_more_marker(out, total, len(rows) - i, max_chars)
+            break
+        out.append(line)
+        total += len(line) + 1
 
-    result = "\n".join(out)
-    return result[:max_chars]
+    return "\n".join(out)
 
 
 def _format_block_rows(
@@ -4184,28 +4976,46 @@ def _format_block_rows(
     fence_lang: str = "",
     max_chars: int = int(EVIDENCE_MAX_CHARS.get("block", 8000)),
 ) -> str:
-    """Fenced code block rendering — one block per row's source_text."""
-    out: List[str] = []
+    """Fenced code block rendering — one block per row's source_text.
+
+    Blocks are written straight into a StringIO buffer (separated by a blank
+    line) rather than formatted into per-row strings and joined at the end.
+    """
+    buf = io.StringIO()
     total = 0
-    for i, r in enumerate(rows):
-        loc = _loc_str(r)
-        source = _extract_line_text(r)
-        if not source:
-            source = str(r.get("source_text") or r.get("text") or "")
-        if not source:
-            continue
+    fence = f"```{fence_lang}" if fence_lang else "```"
+    path_keys = _effective_path_keys()
+    line_keys = _effective_line_keys()
+    snippet_keys = _effective_snippet_keys()
+    # Rows without any source text are skipped lazily, so rows past the
+    # max_chars cut are only scanned to count them. The row index is kept for
+    # "Block N".
+    blocks = (
+        (i, r, src)
+        for i, r in enumerate(rows)
+        if (src := (_extract_line_text_fast(r, snippet_keys) or str(r.get("source_text") or r.get("text") or "")))
+    )
+    for i, r, source in blocks:
+        loc = _loc_str_fast(r, path_keys, line_keys)
 
         header = f"### {loc}" if loc else f"### Block {i+1}"
-        fence = f"```{fence_lang}" if fence_lang else "```"
-        block = f"{header}\n{fence}\n{source}\n```\n"
+        # len(f"{header}\n{fence}\n{source}\n```\n")
+        block_len = len(header) + len(fence) + len(source) + 7
 
-        if total + len(block) > max_chars:
-            out.append(f"... ({len(rows) - i} more rows truncated)")
+        if buf.tell():
+            buf.write("\n")
+        if total + block_len > max_chars:
+            buf.write(f"... ({1 + sum(1 for _ in blocks)} more rows truncated)")
             break
-        out.append(block)
-        total += len(block)
+        buf.write(header)
+        buf.write("\n")
+        buf.write(fence)
+        buf.write("\n")
+        buf.write(source)
+        buf.write("\n```\n")
+        total += block_len
 
-    return "\n".join(out)
+    return buf.getvalue()
 
 
 def _format_lines_rows(
@@ -4220,29 +5030,52 @@ def _format_lines_rows(
     """
     parts: List[str] = []
     total = 0
-    for row in rows:
-        loc = _loc_str(row)
-        text = _extract_line_text(row)
+    path_keys = _effective_path_keys()
+    line_keys = _effective_line_keys()
+    snippet_keys = _effective_snippet_keys()
+    for i, row in enumerate(rows):
+        text = _extract_line_text_fast(row, snippet_keys)
         if not text:
             text = _extract_signature(row)
         if not text:
             continue
+        loc = _loc_str_fast(row, path_keys, line_keys)
         text = text.replace("\n", " ").strip()
         line = f"  [{loc}] {text}" if loc else f"  {text}"
-        total += len(line) + 1
-        if total > max_chars:
-            parts.append(f"  ... ({len(rows) - len(parts)} more)")
+        if total + len(line) > max_chars:
+            _append_more_marker(parts, total, len(rows) - i, max_chars)
             break
         parts.append(line)
+        total += len(line) + 1
     return "\n".join(parts)
 
 
 def _format_json_rows(
     rows: List[Dict[str, Any]],
     max_chars: int = int(EVIDENCE_MAX_CHARS.get("json", 10000)),
+    *,
+    compact: bool = EVIDENCE_JSON_COMPACT,
 ) -> str:
-    """Compact JSON array rendering — preserves full structure for the LLM."""
-    s = json.dumps(rows, ensure_ascii=False, indent=1)
+    """Compact JSON array rendering — preserves full structure for the LLM.
+
+    Rows are serialized one at a time (same layout as ``json.dumps(rows, indent=1)``,
+    or ``separators=(",", ":")`` when *compact*) and serialization stops once the
+    *max_chars* budget is exceeded.
+    """
+    chunks: List[str] = ["["]
+    total = 1
+    for i, r in enumerate(rows):
+        if compact:
+            piece = ("" if i == 0 else ",") + _compact_json_dumps(r)
+        else:
+            item = json.dumps(r, ensure_ascii=False, indent=1).replace("\n", "\n ")
+            piece = ("\n " if i == 0 else ",\n ") + item
+        chunks.append(piece)
+        total += len(piece)
+        if total > max_chars:
+            return "".join(chunks)[:max_chars] + "\n... (truncated)"
+    chunks.append("]" if compact else "\n]")
+    s = "".join(chunks)
     if len(s) > max_chars:
         s = s[:max_chars] + "\n... (truncated)"
     return s
@@ -4255,6 +5088,7 @@ def format_evidence_block(
     max_chars: int = int(EVIDENCE_MAX_CHARS.get("evidence_block", 1600)),
     render_mode: str = DEFAULT_RENDER_MODE,
     fence_lang: str = "",
+    json_compact: bool = EVIDENCE_JSON_COMPACT,
 ) -> str:
     """Format preflight evidence for LLM injection.
 
@@ -4263,6 +5097,9 @@ def format_evidence_block(
         "block" — fenced code block excerpts (for source_text heavy results)
         "lines" — bare source lines with location suffix (for regex matching)
         "json"  — compact JSON array (preserves full structure)
+
+    *json_compact* drops indentation from "json" rendering (policy default:
+    ``evidence_format.json_compact``).
     """
     rows = _iter_rows(stdout_data)
     if rows:
@@ -4273,13 +5110,13 @@ def format_evidence_block(
         elif render_mode == "lines":
             body = _format_lines_rows(rows, max_chars=budget)
         elif render_mode == "json":
-            body = _format_json_rows(rows, max_chars=budget)
+            body = _format_json_rows(rows, max_chars=budget, compact=json_compact)
         else:
             body = _format_list_rows(rows, max_chars=budget)
         return f"{header}\n{body}"
     # Fallback for non-row data
     try:
-        s = json.dumps(stdout_data, ensure_ascii=False, separators=(",", ":"))
+        s = _compact_json_dumps(stdout_data)
     except Exception:
         s = str(stdout_data)
     return s[:max_chars]
@@ -4309,76 +5146,122 @@ def _select_prompt_files(pack: Pack, args: argparse.Namespace) -> Tuple[Path | N
     return (grounding, analyze or grounding)
 
 
-def _build_augmented_question(question_text: str, evidence_blocks: List[str], quote_bypass: bool, response_schema: str = "") -> str:
-    if not evidence_blocks:
-        return question_text
-
-    injected = []
-    for block in evidence_blocks:
-        injected.append(block)
-
-    mandatory_procedure = ""
-    if not quote_bypass:
-        mandatory_text = str(
-            PROMPTS.get(
-                "mandatory_procedure",
-                (
-                    "MANDATORY PROCEDURE:\n"
-                    "1) Before any explanation, paste the required quoted code/text verbatim from the Sections above.\n"
-                    "2) If you cannot quote it verbatim, output NOT FOUND and stop.\n"
-                    "3) After quoting, provide the answer body."
-                ),
-            )
-        ).strip()
-        mandatory_procedure = mandatory_text + "\n\n"
-
-    response_schema_section = ""
-    if response_schema:
-        response_header = str(PROMPTS.get("response_format_header", "RESPONSE FORMAT (MUST FOLLOW EXACTLY)")).rstrip(":")
-        cite_rule = str(
-            PROMPTS.get(
-                "response_format_cite_rule",
-                "If evidence provides CITE=..., cite that token verbatim (without the CITE= prefix).",
-            )
-        )
-        response_schema_section = (
-            f"{response_header}:\n"
-            f"{cite_rule}\n\n"
-            f"{response_schema}\n\n"
-        )
+# =============================================================================
+# Prompt text (resolved once from runner policy; see reload_prompts())
+# =============================================================================
 
+_MANDATORY_PROCEDURE: str = ""
+_RESPONSE_FORMAT_HEADER: str = ""
+_RESPONSE_FORMAT_CITE_RULE: str = ""
+_RETRIEVED_SOURCES_HEADER: str = ""
+_QUESTION_HEADER: str = ""
+_EVIDENCE_EMPTY_ANSWER: str = ""
+_QUOTE_BYPASS_TITLE: str = ""
+_QUOTE_BYPASS_PREAMBLE: str = ""
+_QUOTE_BYPASS_EVIDENCE_HEADER: str = ""
+_QUOTE_BYPASS_INSTRUCTIONS_TEXT: str = ""
+_SCHEMA_RETRY_INITIAL_PREAMBLE: str = ""
+_SCHEMA_RETRY_PREAMBLE: str = ""
+_SCHEMA_RETRY_TEMPLATE_HEADER: str = ""
+_SCHEMA_RETRY_ISSUES_HEADER: str = ""
+_SCHEMA_RETRY_MAX_ISSUE_BULLETS: int = 8
+_SCHEMA_RETRY_EVIDENCE_BUDGET_CHARS: int = 0
+_ADAPTIVE_RERUN_PREAMBLE: str = ""
+_ADAPTIVE_RERUN_ISSUES_HEADER: str = ""
+_ADVICE_TEXT_TEMPLATE: str = ""
+_ADVICE_NO_EVIDENCE_TEXT: str = ""
+_ADVICE_ALLOWED_CITATIONS_HEADER: str = ""
+_ADVICE_ALLOWED_CITATIONS_CAP: int = 60
+_ADVICE_RETRY_PREAMBLE: str = ""
+_ADVICE_RETRY_ISSUES_HEADER: str = ""
+_DETERMINISTIC_FALLBACK_SUFFIX: str = ""
+_DETERMINISTIC_VERDICT: str = ""
+_DETERMINISTIC_NOTE: str = ""
+
+# strict_template -> schema-retry prompt head (preamble + template section);
+# cleared whenever the prompt constants are re-resolved.
+_SCHEMA_RETRY_HEAD_CACHE: Dict[str, str] = {}
+
+
+# Cached per response_schema; cleared whenever the prompt constants are re-resolved.
+@functools.lru_cache(maxsize=32)
+def _make_response_schema_section(response_schema: str) -> str:
+    """Response-format header, cite rule and schema body, or "" without a schema."""
+    if not response_schema:
+        return ""
     return (
-        str(PROMPTS.get("retrieved_sources_header", "RETRIEVED SOURCES (authoritative; cite these sections):")) + "\n\n"
-        + "\n\n".join(injected)
-        + "\n\n---\n\n"
-        + mandatory_procedure
-        + response_schema_section
-        + str(PROMPTS.get("question_header", "QUESTION:"))
-        + "\n\n"
-        + question_text
+        f"{_RESPONSE_FORMAT_HEADER}:\n"
+        f"{_RESPONSE_FORMAT_CITE_RULE}\n\n"
+        f"{response_schema}\n\n"
     )
 
 
-def _build_quote_bypass_prompt(question_text: str, evidence_blocks: List[str], response_schema: str = "") -> str:
-    combined = "\n\n---\n\n".join([b.split("]:\n", 1)[-1].strip() for b in evidence_blocks if b.strip()])
-
-    response_schema_section = ""
-    if response_schema:
-        response_header = str(PROMPTS.get("response_format_header", "RESPONSE FORMAT (MUST FOLLOW EXACTLY)")).rstrip(":")
-        cite_rule = str(
-            PROMPTS.get(
-                "response_format_cite_rule",
-                "If evidence provides CITE=..., cite that token verbatim (without the CITE= prefix).",
-            )
+def _resolve_prompt_constants() -> None:
+    """Resolve PROMPTS/PROMPT_* policy entries into the module-level prompt constants.
+
+    Prompt builders run once per question (and per retry); resolving the
+    lookups, ``str()`` coercions and strip/rstrip calls here keeps them off
+    that path.
+    """
+    _SCHEMA_RETRY_HEAD_CACHE.clear()
+    _make_response_schema_section.cache_clear()
+    global _MANDATORY_PROCEDURE
+    global _RESPONSE_FORMAT_HEADER
+    global _RESPONSE_FORMAT_CITE_RULE
+    global _RETRIEVED_SOURCES_HEADER
+    global _QUESTION_HEADER
+    global _EVIDENCE_EMPTY_ANSWER
+    global _QUOTE_BYPASS_TITLE
+    global _QUOTE_BYPASS_PREAMBLE
+    global _QUOTE_BYPASS_EVIDENCE_HEADER
+    global _QUOTE_BYPASS_INSTRUCTIONS_TEXT
+    global _SCHEMA_RETRY_INITIAL_PREAMBLE
+    global _SCHEMA_RETRY_PREAMBLE
+    global _SCHEMA_RETRY_TEMPLATE_HEADER
+    global _SCHEMA_RETRY_ISSUES_HEADER
+    global _SCHEMA_RETRY_MAX_ISSUE_BULLETS
+    global _SCHEMA_RETRY_EVIDENCE_BUDGET_CHARS
+    global _ADAPTIVE_RERUN_PREAMBLE
+    global _ADAPTIVE_RERUN_ISSUES_HEADER
+    global _ADVICE_TEXT_TEMPLATE
+    global _ADVICE_NO_EVIDENCE_TEXT
+    global _ADVICE_ALLOWED_CITATIONS_HEADER
+    global _ADVICE_ALLOWED_CITATIONS_CAP
+    global _ADVICE_RETRY_PREAMBLE
+    global _ADVICE_RETRY_ISSUES_HEADER
+    global _DETERMINISTIC_FALLBACK_SUFFIX
+    global _DETERMINISTIC_VERDICT
+    global _DETERMINISTIC_NOTE
+
+    _MANDATORY_PROCEDURE = str(
+        PROMPTS.get(
+            "mandatory_procedure",
+            (
+                "MANDATORY PROCEDURE:\n"
+                "1) Before any explanation, paste the required quoted code/text verbatim from the Sections above.\n"
+                "2) If you cannot quote it verbatim, output NOT FOUND and stop.\n"
+                "3) After quoting, provide the answer body."
+            ),
+        )
+    ).strip()
+    _RESPONSE_FORMAT_HEADER = str(PROMPTS.get("response_format_header", "RESPONSE FORMAT (MUST FOLLOW EXACTLY)")).rstrip(":")
+    _RESPONSE_FORMAT_CITE_RULE = str(
+        PROMPTS.get(
+            "response_format_cite_rule",
+            "If evidence provides CITE=..., cite that token verbatim (without the CITE= prefix).",
         )
-        response_schema_section = (
-            f"---\n\n{response_header}:\n"
-            f"{cite_rule}\n\n"
-            f"{response_schema}\n\n"
+    )
+    _RETRIEVED_SOURCES_HEADER = str(PROMPTS.get("retrieved_sources_header", "RETRIEVED SOURCES (authoritative; cite these sections):"))
+    _QUESTION_HEADER = str(PROMPTS.get("question_header", "QUESTION:"))
+    _EVIDENCE_EMPTY_ANSWER = str(
+        PROMPTS.get(
+            "evidence_empty_answer",
+            "**NOT FOUND**\n\nDeterministic evidence extraction returned no results. Model call skipped.",
         )
+    )
 
-    quote_bypass_title = str(PROMPT_QUOTE_BYPASS.get("title", "QUOTE-BYPASS MODE"))
-    quote_bypass_preamble = str(
+    _QUOTE_BYPASS_TITLE = str(PROMPT_QUOTE_BYPASS.get("title", "QUOTE-BYPASS MODE"))
+    _QUOTE_BYPASS_PREAMBLE = str(
         PROMPT_QUOTE_BYPASS.get(
             "preamble",
             (
@@ -4388,60 +5271,247 @@ def _build_quote_bypass_prompt(question_text: str, evidence_blocks: List[str], r
             ),
         )
     )
-    quote_bypass_evidence_header = str(PROMPT_QUOTE_BYPASS.get("evidence_header", "EVIDENCE (authoritative)")).rstrip(":")
-    quote_bypass_instructions = PROMPT_QUOTE_BYPASS.get(
-        "instructions",
-        [
-            "1. Reference the evidence above to answer the question.",
-            "2. If the question asks for text/definitions, repeat the relevant parts from Evidence.",
-            "3. If evidence is insufficient, say INSUFFICIENT EVIDENCE and list what's missing.",
-        ],
+    _QUOTE_BYPASS_EVIDENCE_HEADER = str(PROMPT_QUOTE_BYPASS.get("evidence_header", "EVIDENCE (authoritative)")).rstrip(":")
+    _QUOTE_BYPASS_INSTRUCTIONS_TEXT = "\n".join(
+        str(x)
+        for x in PROMPT_QUOTE_BYPASS.get(
+            "instructions",
+            [
+                "1. Reference the evidence above to answer the question.",
+                "2. If the question asks for text/definitions, repeat the relevant parts from Evidence.",
+                "3. If evidence is insufficient, say INSUFFICIENT EVIDENCE and list what's missing.",
+            ],
+        )
+    )
+
+    _SCHEMA_RETRY_INITIAL_PREAMBLE = str(
+        PROMPT_SCHEMA_RETRY.get(
+            "initial_preamble",
+            (
+                "OUTPUT CONTRACT OVERRIDE:\n"
+                "- Return plain text only (no markdown headers/bullets).\n"
+                "- First line must be VERDICT=...\n"
+                "- Second line must be CITATIONS=...\n"
+                "- CITATIONS must only use tokens from CITE= evidence lines."
+            ),
+        )
+    ).strip()
+    _SCHEMA_RETRY_PREAMBLE = str(
+        PROMPT_SCHEMA_RETRY.get(
+            "preamble",
+            (
+                "SCHEMA RETRY MODE:\n"
+                "- Fix all validation issues listed below.\n"
+                "- Preserve factual claims; only repair format/citations as needed.\n"
+                "- Return plain text only."
+            ),
+        )
+    ).strip()
+    _SCHEMA_RETRY_TEMPLATE_HEADER = str(PROMPT_SCHEMA_RETRY.get("template_header", "STRICT RESPONSE TEMPLATE (MUST MATCH)")).rstrip(":")
+    _SCHEMA_RETRY_ISSUES_HEADER = str(PROMPT_SCHEMA_RETRY.get("issues_header", "Validation issues to fix in this retry:")).rstrip(":")
+    _SCHEMA_RETRY_MAX_ISSUE_BULLETS = max(
+        1, int(PROMPT_SCHEMA_RETRY.get("max_issue_bullets", ISSUE_CAPS.get("adaptive_rerun_bullets", 8)))
+    )
+    _SCHEMA_RETRY_EVIDENCE_BUDGET_CHARS = max(0, int(PROMPT_SCHEMA_RETRY.get("evidence_budget_chars", 0) or 0))
+
+    _ADAPTIVE_RERUN_PREAMBLE = str(
+        PROMPT_ADAPTIVE_RERUN.get(
+            "preamble",
+            (
+                "IMPORTANT:\n"
+                "- Follow the required response schema exactly (VERDICT/CITATIONS first).\n"
+                "- If evidence is present, do not output NOT FOUND.\n"
+                "- Ensure CITATIONS tokens are path:line(-line)."
+            ),
+        )
+    ).strip()
+    _ADAPTIVE_RERUN_ISSUES_HEADER = str(
+        PROMPT_ADAPTIVE_RERUN.get("issues_header", "Validation issues to fix in this rerun:")
+    )
+
+    _ADVICE_TEXT_TEMPLATE = str(
+        PROMPT_ADVICE.get(
+            "text",
+            (
+                "RUST IMPROVEMENT ADVICE MODE\n\n"
+                "You are reviewing deterministic Rust audit output and must provide implementation guidance.\n"
+                "Do not restate the audit answer; provide concrete, actionable improvements.\n\n"
+                "REQUIRED OUTPUT FORMAT (plain text):\n"
+                "ISSUE_1=...\n"
+                "WHY_IT_MATTERS_1=...\n"
+                "PATCH_SKETCH_1=...\n"
+                "TEST_PLAN_1=...\n"
+                "CITATIONS_1=path:line(-line), path:line(-line)  (must be copied from ALLOWED_CITATIONS)\n"
+                "ISSUE_2=... (optional)\n"
+                "WHY_IT_MATTERS_2=... (optional)\n"
+                "PATCH_SKETCH_2=... (optional)\n"
+                "TEST_PLAN_2=... (optional)\n"
+                "CITATIONS_2=... (optional; same rules)\n"
+                "ISSUE_3=... (optional)\n"
+                "WHY_IT_MATTERS_3=... (optional)\n"
+                "PATCH_SKETCH_3=... (optional)\n"
+                "TEST_PLAN_3=... (optional)\n"
+                "CITATIONS_3=... (optional; same rules)\n\n"
+                "RULES:\n"
+                "- Max 3 issues.\n"
+                "- Prefer Rust-idiomatic suggestions (error conversions, trait boundaries, async/thread safety, testing seams).\n"
+                "- CITATIONS_n must be repo-relative tokens of the form path:line or path:start-end (or artifact anchors like *.json:1).\n"
+                "- CITATIONS_n must be copied verbatim from ALLOWED_CITATIONS. Do NOT cite symbol forms like path::fn_name.\n"
+                "- Every included issue must have at least one citation token.\n"
+                "- If evidence is insufficient for an issue, do not include that issue.\n\n"
+            ),
+        )
+    ).rstrip() + "\n\n"
+    _ADVICE_NO_EVIDENCE_TEXT = str(PROMPT_ADVICE.get("no_evidence_text", "(no evidence blocks available)"))
+    _ADVICE_ALLOWED_CITATIONS_HEADER = str(
+        PROMPT_ADVICE.get("allowed_citations_header", "ALLOWED_CITATIONS (copy/paste ONLY; do not invent)")
+    ).rstrip(":")
+    _ADVICE_ALLOWED_CITATIONS_CAP = max(0, int(PROMPT_ADVICE.get("allowed_citations_cap", 60)))
+    _ADVICE_RETRY_PREAMBLE = str(
+        PROMPT_ADVICE.get(
+            "retry_preamble",
+            (
+                "ADVICE RETRY MODE:\n"
+                "- Fix all advice validation issues listed below.\n"
+                "- Preserve factual grounding and cite only evidence tokens from CITE= blocks.\n"
+                "- Return plain text only and follow ISSUE_n field format exactly."
+            ),
+        )
+    ).strip()
+    _ADVICE_RETRY_ISSUES_HEADER = str(
+        PROMPT_ADVICE.get("retry_issues_header", "Advice validation issues to fix in this retry:")
+    ).rstrip(":")
+
+    _DETERMINISTIC_FALLBACK_SUFFIX = str(PROMPT_DETERMINISTIC.get("fallback_suffix", "_preflight.json:1"))
+    _DETERMINISTIC_VERDICT = str(PROMPT_DETERMINISTIC.get("verdict", "INDETERMINATE"))
+    _DETERMINISTIC_NOTE = str(
+        PROMPT_DETERMINISTIC.get("note", "question.answer_mode=deterministic; model answer generation was skipped.")
+    )
+
+
+def reload_prompts() -> None:
+    """Re-read the prompt sections of RUNNER_POLICY and refresh the resolved prompt constants."""
+    global PROMPTS
+    global PROMPT_QUOTE_BYPASS
+    global PROMPT_DETERMINISTIC
+    global PROMPT_ADVICE
+    global PROMPT_ADAPTIVE_RERUN
+    global PROMPT_SCHEMA_RETRY
+    PROMPTS = dict(_policy_get("prompts", {}))
+    PROMPT_QUOTE_BYPASS = dict(PROMPTS.get("quote_bypass", {}))
+    PROMPT_DETERMINISTIC = dict(PROMPTS.get("deterministic_answer", {}))
+    PROMPT_ADVICE = dict(PROMPTS.get("advice_prompt", {}))
+    PROMPT_ADAPTIVE_RERUN = dict(PROMPTS.get("adaptive_rerun", {}))
+    PROMPT_SCHEMA_RETRY = dict(PROMPTS.get("schema_retry", {}))
+    _resolve_prompt_constants()
+
+
+_resolve_prompt_constants()
+
+
+def _build_augmented_question(question_text: str, evidence_blocks: List[str], quote_bypass: bool, response_schema: str = "") -> str:
+    if not evidence_blocks:
+        return question_text
+
+    mandatory_procedure = ""
+    if not quote_bypass:
+        mandatory_procedure = _MANDATORY_PROCEDURE + "\n\n"
+
+    return "".join((
+        _RETRIEVED_SOURCES_HEADER,
+        "\n\n",
+        "\n\n".join(evidence_blocks),
+        "\n\n---\n\n",
+        mandatory_procedure,
+        _make_response_schema_section(response_schema),
+        _QUESTION_HEADER,
+        "\n\n",
+        question_text,
+    ))
+
+
+def _evidence_block_body(block: str) -> str:
+    """Block text after its ``[Preflight …]:`` header line, stripped (one slice, no split lists)."""
+    i = block.find("]:\n")
+    return (block[i + 3:] if i >= 0 else block).strip()
+
+
+def _compress_evidence_blocks(evidence_blocks: List[str], budget_chars: int) -> List[str]:
+    """Extractive trim of evidence blocks to roughly *budget_chars* in total.
+
+    Each block gets an equal share. Its ``[Preflight …]:`` header and all
+    ``CITE=`` lines are always kept (citation provenance is checked against
+    the full blocks), then other non-blank lines in order while the share
+    lasts. Returns *evidence_blocks* itself when already within budget.
+    """
+    if budget_chars <= 0 or not evidence_blocks or sum(map(len, evidence_blocks)) <= budget_chars:
+        return evidence_blocks
+    share = max(1, budget_chars // len(evidence_blocks))
+    out: List[str] = []
+    for block in evidence_blocks:
+        if len(block) <= share:
+            out.append(block)
+            continue
+        lines = block.splitlines()
+        kept = lines[:1]
+        used = len(kept[0]) if kept else 0
+        for ln in lines[1:]:
+            if not ln.strip():
+                continue
+            if _RE_CITE_MARKER_LINE.match(ln):
+                kept.append(ln)
+            elif used + len(ln) + 1 <= share:
+                kept.append(ln)
+                used += len(ln) + 1
+        out.append("\n".join(kept))
+    return out
+
+
+def _build_quote_bypass_prompt(question_text: str, evidence_blocks: List[str], response_schema: str = "") -> str:
+    combined = "\n\n---\n\n".join(
+        _evidence_block_body(b) for b in evidence_blocks if b and not b.isspace()
     )
-    instructions_text = "\n".join(str(x) for x in quote_bypass_instructions)
+
+    response_schema_section = _make_response_schema_section(response_schema)
+    if response_schema_section:
+        response_schema_section = "---\n\n" + response_schema_section
 
     return (
-        f"{quote_bypass_title}\n\n"
-        f"{quote_bypass_preamble}\n\n"
+        f"{_QUOTE_BYPASS_TITLE}\n\n"
+        f"{_QUOTE_BYPASS_PREAMBLE}\n\n"
         "---\n\n"
-        f"{quote_bypass_evidence_header}:\n\n"
+        f"{_QUOTE_BYPASS_EVIDENCE_HEADER}:\n\n"
         f"{combined}\n\n"
         f"{response_schema_section}"
         "---\n\n"
-        f"{str(PROMPTS.get('question_header', 'QUESTION:'))}\n\n"
+        f"{_QUESTION_HEADER}\n\n"
         f"{question_text}\n\n"
         "---\n\n"
         "INSTRUCTIONS:\n"
-        f"{instructions_text}\n"
+        f"{_QUOTE_BYPASS_INSTRUCTIONS_TEXT}\n"
     )
 
 
+_ANSWER_KEYS: Tuple[str, ...] = ("answer", "response", "text")
+
+
 def _extract_answer_and_sources(chat_payload: Any) -> Tuple[str, Any]:
     if isinstance(chat_payload, dict):
-        ans = chat_payload.get("answer") or chat_payload.get("response") or chat_payload.get("text") or ""
-        return str(ans), chat_payload.get("sources")
-    return str(chat_payload), None
+        for k in _ANSWER_KEYS:
+            v = chat_payload.get(k)
+            if v:
+                return (v if type(v) is str else str(v)), chat_payload.get("sources")
+        return "", chat_payload.get("sources")
+    return (chat_payload if type(chat_payload) is str else str(chat_payload)), None
 
 
 def _inject_strict_response_template(base_question: str, strict_template: str) -> str:
     template = str(strict_template or "").strip()
     if not template:
         return base_question
-    initial_preamble = str(
-        PROMPT_SCHEMA_RETRY.get(
-            "initial_preamble",
-            (
-                "OUTPUT CONTRACT OVERRIDE:\n"
-                "- Return plain text only (no markdown headers/bullets).\n"
-                "- First line must be VERDICT=...\n"
-                "- Second line must be CITATIONS=...\n"
-                "- CITATIONS must only use tokens from CITE= evidence lines."
-            ),
-        )
-    ).strip()
-    template_header = str(PROMPT_SCHEMA_RETRY.get("template_header", "STRICT RESPONSE TEMPLATE (MUST MATCH)")).rstrip(":")
     return (
-        f"{initial_preamble}\n\n"
-        f"{template_header}:\n"
+        f"{_SCHEMA_RETRY_INITIAL_PREAMBLE}\n\n"
+        f"{_SCHEMA_RETRY_TEMPLATE_HEADER}:\n"
         f"{template}\n\n"
         f"{base_question}"
     )
@@ -4455,30 +5525,37 @@ def _build_schema_retry_prompt(
     attempt: int,
     total_attempts: int,
 ) -> str:
-    preamble = str(
-        PROMPT_SCHEMA_RETRY.get(
-            "preamble",
-            (
-                "SCHEMA RETRY MODE:\n"
-                "- Fix all validation issues listed below.\n"
-                "- Preserve factual claims; only repair format/citations as needed.\n"
-                "- Return plain text only."
-            ),
-        )
-    ).strip()
-    template_header = str(PROMPT_SCHEMA_RETRY.get("template_header", "STRICT RESPONSE TEMPLATE (MUST MATCH)")).rstrip(":")
-    issues_header = str(PROMPT_SCHEMA_RETRY.get("issues_header", "Validation issues to fix in this retry:")).rstrip(":")
-    cap = int(PROMPT_SCHEMA_RETRY.get("max_issue_bullets", ISSUE_CAPS.get("adaptive_rerun_bullets", 8)))
-    issue_bullets = "\n".join(f"- {it}" for it in issues[: max(1, cap)])
-    template = str(strict_template or "").strip()
-
-    parts: List[str] = [preamble]
-    if template:
-        parts.extend(["", f"{template_header}:", template])
-    if issue_bullets:
-        parts.extend(["", f"{issues_header}:", issue_bullets])
-    parts.extend(["", f"RETRY_ATTEMPT={attempt}/{total_attempts}", "", base_question])
-    return "\n".join(parts)
+    return "".join((
+        _schema_retry_head(strict_template),
+        _issue_bullets_section(_SCHEMA_RETRY_ISSUES_HEADER, issues, _SCHEMA_RETRY_MAX_ISSUE_BULLETS),
+        f"\n\nRETRY_ATTEMPT={attempt}/{total_attempts}\n\n",
+        base_question,
+    ))
+
+
+def _schema_retry_head(strict_template: str) -> str:
+    """Preamble plus (optional) template section; constant for a question across retries."""
+    key = strict_template or ""
+    head = _SCHEMA_RETRY_HEAD_CACHE.get(key)
+    if head is None:
+        template = str(key).strip()
+        head = _SCHEMA_RETRY_PREAMBLE
+        if template:
+            head = f"{head}\n\n{_SCHEMA_RETRY_TEMPLATE_HEADER}:\n{template}"
+        if len(_SCHEMA_RETRY_HEAD_CACHE) >= 128:
+            _SCHEMA_RETRY_HEAD_CACHE.clear()
+        _SCHEMA_RETRY_HEAD_CACHE[key] = head
+    return head
+
+
+def _issue_bullets_section(header: str, issues: Optional[List[str]], cap: int) -> str:
+    """Blank line, ``<header>:`` and one bullet per issue (first ``cap``); "" when there are none."""
+    if not issues:
+        return ""
+    issue_bullets = "\n".join(f"- {it}" for it in issues[:cap])
+    if not issue_bullets:
+        return ""
+    return f"\n\n{header}:\n{issue_bullets}"
 
 
 def _build_advice_retry_prompt(
@@ -4488,27 +5565,19 @@ def _build_advice_retry_prompt(
     attempt: int,
     total_attempts: int,
 ) -> str:
-    preamble = str(
-        PROMPT_ADVICE.get(
-            "retry_preamble",
-            (
-                "ADVICE RETRY MODE:\n"
-                "- Fix all advice validation issues listed below.\n"
-                "- Preserve factual grounding and cite only evidence tokens from CITE= blocks.\n"
-                "- Return plain text only and follow ISSUE_n field format exactly."
-            ),
-        )
-    ).strip()
-    issues_header = str(
-        PROMPT_ADVICE.get("retry_issues_header", "Advice validation issues to fix in this retry:")
-    ).rstrip(":")
-    issue_cap = max(1, ADVICE_RETRY_ISSUE_BULLETS)
-    issue_bullets = "\n".join(f"- {it}" for it in (issues or [])[:issue_cap])
-    parts: List[str] = [preamble]
-    if issue_bullets:
-        parts.extend(["", f"{issues_header}:", issue_bullets])
-    parts.extend(["", f"RETRY_ATTEMPT={attempt}/{total_attempts}", "", base_prompt])
-    return "\n".join(parts)
+    return "".join((
+        _ADVICE_RETRY_PREAMBLE,
+        _issue_bullets_section(_ADVICE_RETRY_ISSUES_HEADER, issues, max(1, ADVICE_RETRY_ISSUE_BULLETS)),
+        f"\n\nRETRY_ATTEMPT={attempt}/{total_attempts}\n\n",
+        base_prompt,
+    ))
+
+
+_RE_VERDICT = re.compile(r"^\s*VERDICT\s*[=:]\s*([A-Z_]+)\s*$", re.MULTILINE)
+_RE_VERDICT_LINE = re.compile(r"^\s*VERDICT\s*[=:]")
+_RE_CITATIONS_LINE = re.compile(r"^\s*CITATIONS\s*[=:]?")
+_RE_BANNED_HEADING_LINE = re.compile(r"(?i)^(?:#{1,6}\s*)?(?:\*{1,2}\s*)?(analysis|citations)(?:\s*\*{1,2})?\s*:\s*$")
+_CITATION_PLACEHOLDERS = frozenset({"NONE", "N/A", "NA", "INSUFFICIENT", "UNKNOWN", "MISSING"})
 
 
 def _repair_answer_for_strict_contract(
@@ -4532,50 +5601,56 @@ def _repair_answer_for_strict_contract(
     clean = (answer or "").replace("**", "")
     required = set(validation.required_verdicts or [])
 
-    mv = re.search(r"^\s*VERDICT\s*[=:]\s*([A-Z_]+)\s*$", clean, flags=re.MULTILINE)
-    verdict = mv.group(1).strip() if mv else ""
+    # Single pass over the answer: pick up the first well-formed VERDICT value,
+    # remove existing VERDICT/CITATIONS lines (the header is rebuilt below) and
+    # drop banned standalone heading lines like "Analysis:" / "CITATIONS:"
+    # (including markdown variants). startswith/endswith prefilter the regexes.
+    body_lines: List[str] = []
+    verdict = ""
+    dropped_banned_headings = False
+    for ln in clean.splitlines():
+        s = ln.strip()
+        if s.startswith("VERDICT") and _RE_VERDICT_LINE.match(s):
+            if not verdict:
+                mv = _RE_VERDICT.match(s)
+                if mv:
+                    verdict = mv.group(1).strip()
+            continue
+        if s.startswith("CITATIONS") and _RE_CITATIONS_LINE.match(s):
+            continue
+        if s.endswith(":") and _RE_BANNED_HEADING_LINE.match(s):
+            dropped_banned_headings = True
+            continue
+        body_lines.append(ln)
+
     if (not verdict) or (required and verdict not in required):
         verdict = "INDETERMINATE" if "INDETERMINATE" in required else (next(iter(required)) if required else "INDETERMINATE")
         notes.append("repaired_verdict")
 
     tokens = _extract_answer_citation_tokens(clean)
-    valid_token_re = re.compile(_PATHLINE_PATTERN)
-    citation_placeholders = {"NONE", "N/A", "NA", "INSUFFICIENT", "UNKNOWN", "MISSING"}
-    has_placeholder_only = bool(tokens) and all((t or "").strip().upper() in citation_placeholders for t in tokens)
-    has_bad_format = any(not valid_token_re.match(t or "") for t in tokens)
+    has_placeholder_only = bool(tokens) and all((t or "").strip().upper() in _CITATION_PLACEHOLDERS for t in tokens)
+    has_bad_format = any(not _RE_PATHLINE.match(t or "") for t in tokens)
     needs_citations_repair = (not tokens) or has_placeholder_only or has_bad_format
 
     allowed = _extract_allowed_citation_tokens(evidence_blocks)
     if validation.enforce_citations_from_evidence:
         # If provenance check fails, prefer deterministic replacement with allowed evidence tokens.
-        prov = validate_citations_from_evidence(clean, allowed=allowed)
-        if prov:
+        # Same outcome as validate_citations_from_evidence(clean, allowed=allowed),
+        # reusing the tokens extracted above instead of re-scanning the answer.
+        if not allowed or (tokens and _unknown_citation_tokens(tokens, allowed=allowed)):
             needs_citations_repair = True
 
     citations_out = ", ".join(tokens) if tokens else ""
     if needs_citations_repair:
-        ordered_allowed = sorted(t for t in allowed if valid_token_re.match(t or ""))
         cap = max(1, int(ISSUE_CAPS.get("deterministic_citations", 5)))
+        # Only the first `cap` tokens in sort order are needed.
+        ordered_allowed = heapq.nsmallest(cap, (t for t in allowed if _RE_PATHLINE.match(t or "")))
         if ordered_allowed:
-            citations_out = ", ".join(ordered_allowed[:cap])
+            citations_out = ", ".join(ordered_allowed)
         else:
             citations_out = f"{qid}_preflight.json:1"
         notes.append("repaired_citations")
 
-    # Remove existing VERDICT/CITATIONS lines and rebuild with repaired header.
-    # Also drop banned standalone heading lines like "Analysis:" / "CITATIONS:" (including markdown variants).
-    body_lines: List[str] = []
-    dropped_banned_headings = False
-    for ln in clean.splitlines():
-        s = ln.strip()
-        if re.match(r"^\s*VERDICT\s*[=:]", s):
-            continue
-        if re.match(r"^\s*CITATIONS\s*[=:]?", s):
-            continue
-        if re.match(r"(?i)^(?:#{1,6}\s*)?(?:\*{1,2}\s*)?(analysis|citations)(?:\s*\*{1,2})?\s*:\s*$", s):
-            dropped_banned_headings = True
-            continue
-        body_lines.append(ln)
     if dropped_banned_headings:
         notes.append("dropped_banned_headings")
 
@@ -4590,18 +5665,17 @@ def _repair_answer_for_strict_contract(
 
 def _build_deterministic_seed_answer(qid: str, evidence_blocks: List[str]) -> str:
     """Fallback answer body when answer_mode=deterministic and no plugin synthesizer exists."""
-    tokens = sorted(_extract_allowed_citation_tokens(evidence_blocks))
+    allowed = _extract_allowed_citation_tokens(evidence_blocks)
     det_citation_cap = int(ISSUE_CAPS.get("deterministic_citations", 5))
-    fallback_suffix = str(PROMPT_DETERMINISTIC.get("fallback_suffix", "_preflight.json:1"))
-    citations = ", ".join(tokens[:det_citation_cap]) if tokens else f"{qid}{fallback_suffix}"
-    deterministic_verdict = str(PROMPT_DETERMINISTIC.get("verdict", "INDETERMINATE"))
-    deterministic_note = str(
-        PROMPT_DETERMINISTIC.get("note", "question.answer_mode=deterministic; model answer generation was skipped.")
-    )
+    if det_citation_cap > 0:
+        tokens = heapq.nsmallest(det_citation_cap, allowed)
+    else:
+        tokens = sorted(allowed)[:det_citation_cap]
+    citations = ", ".join(tokens) if allowed else f"{qid}{_DETERMINISTIC_FALLBACK_SUFFIX}"
     return (
-        f"VERDICT={deterministic_verdict}\n"
+        f"VERDICT={_DETERMINISTIC_VERDICT}\n"
         f"CITATIONS={citations}\n\n"
-        f"DETERMINISTIC_NOTE={deterministic_note}\n"
+        f"DETERMINISTIC_NOTE={_DETERMINISTIC_NOTE}\n"
     )
 
 
@@ -4612,76 +5686,46 @@ def _build_advice_prompt(
     deterministic_answer: str,
     evidence_blocks: List[str],
 ) -> str:
-    evidence = "\n\n".join(evidence_blocks) if evidence_blocks else str(
-        PROMPT_ADVICE.get("no_evidence_text", "(no evidence blocks available)")
-    )
+    evidence = "\n\n".join(evidence_blocks) if evidence_blocks else _ADVICE_NO_EVIDENCE_TEXT
 
-    allowed_tokens = sorted(_extract_allowed_citation_tokens(evidence_blocks))
-    allow_cap = int(PROMPT_ADVICE.get("allowed_citations_cap", 60))
-    allow_cap = max(0, allow_cap)
-    allowed_tokens = allowed_tokens[:allow_cap] if allow_cap else allowed_tokens
+    allow_cap = _ADVICE_ALLOWED_CITATIONS_CAP
+    if allow_cap > 0:
+        allowed_tokens = heapq.nsmallest(allow_cap, _extract_allowed_citation_tokens(evidence_blocks))
+    else:
+        allowed_tokens = sorted(_extract_allowed_citation_tokens(evidence_blocks))
     allowed_line = ", ".join(allowed_tokens) if allowed_tokens else ""
 
-    allowed_header = str(
-        PROMPT_ADVICE.get("allowed_citations_header", "ALLOWED_CITATIONS (copy/paste ONLY; do not invent)")
-    ).rstrip(":")
-
-    advice_text_template = str(
-        PROMPT_ADVICE.get(
-            "text",
-            (
-                "RUST IMPROVEMENT ADVICE MODE\n\n"
-                "You are reviewing deterministic Rust audit output and must provide implementation guidance.\n"
-                "Do not restate the audit answer; provide concrete, actionable improvements.\n\n"
-                "REQUIRED OUTPUT FORMAT (plain text):\n"
-                "ISSUE_1=...\n"
-                "WHY_IT_MATTERS_1=...\n"
-                "PATCH_SKETCH_1=...\n"
-                "TEST_PLAN_1=...\n"
-                "CITATIONS_1=path:line(-line), path:line(-line)  (must be copied from ALLOWED_CITATIONS)\n"
-                "ISSUE_2=... (optional)\n"
-                "WHY_IT_MATTERS_2=... (optional)\n"
-                "PATCH_SKETCH_2=... (optional)\n"
-                "TEST_PLAN_2=... (optional)\n"
-                "CITATIONS_2=... (optional; same rules)\n"
-                "ISSUE_3=... (optional)\n"
-                "WHY_IT_MATTERS_3=... (optional)\n"
-                "PATCH_SKETCH_3=... (optional)\n"
-                "TEST_PLAN_3=... (optional)\n"
-                "CITATIONS_3=... (optional; same rules)\n\n"
-                "RULES:\n"
-                "- Max 3 issues.\n"
-                "- Prefer Rust-idiomatic suggestions (error conversions, trait boundaries, async/thread safety, testing seams).\n"
-                "- CITATIONS_n must be repo-relative tokens of the form path:line or path:start-end (or artifact anchors like *.json:1).\n"
-                "- CITATIONS_n must be copied verbatim from ALLOWED_CITATIONS. Do NOT cite symbol forms like path::fn_name.\n"
-                "- Every included issue must have at least one citation token.\n"
-                "- If evidence is insufficient for an issue, do not include that issue.\n\n"
-            ),
-        )
-    )
-    template_with_sep = advice_text_template.rstrip() + "\n\n"
-
     allowed_section = ""
     if allowed_line:
-        allowed_section = f"{allowed_header}:\n{allowed_line}\n\n"
+        allowed_section = f"{_ADVICE_ALLOWED_CITATIONS_HEADER}:\n{allowed_line}\n\n"
 
-    return (
-        template_with_sep
-        + f"QUESTION_ID={qid}\n\n"
-        + "ORIGINAL QUESTION:\n"
-        + f"{question_text}\n\n"
-        + "DETERMINISTIC AUDIT ANSWER:\n"
-        + f"{deterministic_answer}\n\n"
-        + allowed_section
-        + "EVIDENCE:\n"
-        + f"{evidence}\n"
-    )
+    return "".join((
+        _ADVICE_TEXT_TEMPLATE,
+        f"QUESTION_ID={qid}\n\n",
+        "ORIGINAL QUESTION:\n",
+        f"{question_text}\n\n",
+        "DETERMINISTIC AUDIT ANSWER:\n",
+        f"{deterministic_answer}\n\n",
+        allowed_section,
+        "EVIDENCE:\n",
+        f"{evidence}\n",
+    ))
 
 
 # =============================================================================
 # Plugin selection
 # =============================================================================
 
+def _norm_plugin_name(x: Any) -> str:
+    return str(x).strip().lower()
+
+
+_PLUGIN_DISABLE_ALIASES = frozenset(
+    _norm_plugin_name(x) for x in (PLUGIN_POLICY.get("disable_aliases") or ["", "none", "null", "no", "false", "off"])
+)
+_KNOWN_PLUGINS = frozenset(_norm_plugin_name(x) for x in (PLUGIN_POLICY.get("known_plugins") or ["rsqt_guru"]))
+
+
 def _select_plugins(pack: Pack) -> List[PackPlugin]:
     """Select plugins for this pack.
 
@@ -4701,19 +5745,13 @@ def _select_plugins(pack: Pack) -> List[PackPlugin]:
         elif "plugin" in runner:
             explicit = runner.get("plugin")
 
-    def norm(x: Any) -> str:
-        return str(x).strip().lower()
-
-    disable_aliases = {norm(x) for x in (PLUGIN_POLICY.get("disable_aliases") or ["", "none", "null", "no", "false", "off"])}
-    known_plugins = {norm(x) for x in (PLUGIN_POLICY.get("known_plugins") or ["rsqt_guru"])}
-
     # Explicit disable
     if explicit is not None:
         if explicit is False:
             return []
         if explicit is None:
             return []
-        if isinstance(explicit, str) and norm(explicit) in disable_aliases:
+        if isinstance(explicit, str) and _norm_plugin_name(explicit) in _PLUGIN_DISABLE_ALIASES:
             return []
         names: List[str] = []
         if isinstance(explicit, str):
@@ -4724,8 +5762,8 @@ def _select_plugins(pack: Pack) -> List[PackPlugin]:
             raise SystemExit(f"Invalid runner.plugin value (expected string/list): {explicit!r}")
 
         for name in names:
-            key = norm(name)
-            if key not in known_plugins:
+            key = _norm_plugin_name(name)
+            if key not in _KNOWN_PLUGINS:
                 raise SystemExit(f"Unknown plugin requested by pack: {name}")
             if key == "rsqt_guru":
                 if RsqtGuruPlugin is None:
@@ -4826,10 +5864,7 @@ def _run_single(
         engine_columns_count=evidence_key_state.get("engine_columns_count"),
         parquet_schema_source=evidence_key_state.get("parquet_schema_source"),
         parquet_columns_count=evidence_key_state.get("parquet_columns_count"),
-        path_keys=len(_effective_path_keys()),
-        line_keys=len(_effective_line_keys()),
-        snippet_keys=len(_effective_snippet_keys()),
-        iter_rows_keys=len(_effective_iter_rows_keys()),
+        **_effective_key_counts(),
         key_map=str(evidence_key_map_path),
     )
     repo_root = _find_repo_root(pack_path.parent)
@@ -4860,6 +5895,17 @@ def _run_single(
     use_uv = not args.no_uv
     prefix = build_engine_prefix(spec, use_uv=use_uv, target_dir=parquet_path.parent if spec.target_dir_flag else None)
     engine_env_cache: Dict[str, Dict[str, str]] = {}
+    # Prefixes are only read (argv builders concatenate), so cached lists are shared.
+    prefix_cache: Dict[Tuple[str, bool, str], List[str]] = {}
+
+    def _prefix_for(step_spec: EngineSpec) -> List[str]:
+        target_dir = parquet_path.parent if step_spec.target_dir_flag else None
+        key = (step_spec.name, bool(step_spec.target_dir_flag), str(target_dir) if target_dir else "")
+        cached = prefix_cache.get(key)
+        if cached is None:
+            cached = build_engine_prefix(step_spec, use_uv=use_uv, target_dir=target_dir)
+            prefix_cache[key] = cached
+        return cached
 
     def _env_for_engine(engine_name: str) -> Dict[str, str]:
         if engine_name not in engine_env_cache:
@@ -4877,7 +5923,7 @@ def _run_single(
                     engine=engine_name,
                     keys=sorted(env_map.keys()),
                 )
-            else:
+            elif LOGGER.isEnabledFor(logging.DEBUG):
                 _log_event(
                     logging.DEBUG,
                     "runner.env.overrides",
@@ -4888,6 +5934,29 @@ def _run_single(
         return engine_env_cache[engine_name]
 
     main_engine_env = _env_for_engine(spec.name)
+    chat_temperature = args.temperature if args.temperature is not None else pack.defaults.temperature
+    if args.cache_chat and chat_temperature > 0:
+        _log_event(
+            logging.WARNING,
+            "chat.cache_disabled",
+            fn="_run_single",
+            reason="--cache-chat is deterministic-only; temperature > 0",
+            temperature=chat_temperature,
+        )
+    # run_engine_chat arguments shared by every chat/advice dispatch of this run.
+    chat_engine_kwargs: Dict[str, Any] = dict(
+        index_path=index_path,
+        parquet_path=parquet_path,
+        backend=args.backend,
+        model=args.model,
+        prompt_profile=args.prompt_profile if spec.prompt_profile_flag else None,
+        max_tokens=args.max_tokens if args.max_tokens is not None else pack.defaults.max_tokens,
+        temperature=chat_temperature,
+        top_p=args.top_p,
+        num_ctx=args.num_ctx,
+        env_overrides=main_engine_env,
+        cache_dir=(out_dir / ".chat_cache") if args.cache_chat and chat_temperature <= 0 else None,
+    )
 
     prompt_grounding, prompt_analyze = _select_prompt_files(pack, args)
     _log_event(
@@ -4905,6 +5974,28 @@ def _run_single(
 
     # SSOT: load default test-path patterns once per run from validator YAML
     default_test_path_patterns = _load_default_test_path_patterns(pack, pack_path)
+    # Runner defaults merged under every step transform. Steps without a
+    # transform share one defaults-only dict (its coerced-filter stash is then
+    # computed once per run); steps with one get a fresh merged copy.
+    transform_defaults: Dict[str, Any] = {
+        "_default_test_path_patterns": default_test_path_patterns,
+        "_default_exclude_path_regex": DEFAULT_EXCLUDE_PATH_REGEX,
+    }
+    defaults_only_transform: Dict[str, Any] = dict(transform_defaults)
+    # Merged transform per pack step (keyed by id; the steps live as long as
+    # the pack), shared by the filter and evidence passes of every question.
+    step_transform_cache: Dict[int, Dict[str, Any]] = {}
+
+    def _step_transform(step: Any) -> Dict[str, Any]:
+        t = step.get("transform") if isinstance(step, dict) else None
+        if not (isinstance(t, dict) and t):
+            return defaults_only_transform
+        merged = step_transform_cache.get(id(step))
+        if merged is None:
+            merged = {**transform_defaults, **t}
+            step_transform_cache[id(step)] = merged
+        return merged
+
     question_validators_cfg = (
         _load_question_validators_cfg(pack, pack_path)
         if qv_enabled
@@ -4920,7 +6011,7 @@ def _run_single(
     report_lines.append(f"Index: {index_path}\nParquet: {parquet_path}\n")
     mode_str = QUOTE_BYPASS_MODE_LABELS.get(args._effective_qb_mode, QUOTE_BYPASS_MODE_LABELS.get("off", "STANDARD"))
     report_lines.append(
-        f"Mode: {mode_str}  cache_preflights={args.cache_preflights} "
+        f"Mode: {mode_str}  cache_preflights={args.cache_preflights} cache_chat={args.cache_chat} "
         f"short_circuit_preflights={args.short_circuit_preflights} "
         f"adaptive_top_k={args.adaptive_top_k} chat_top_k_initial={args.chat_top_k_initial}\n"
     )
@@ -4946,9 +6037,8 @@ def _run_single(
         f"strict_missing_semantics={DYNAMIC_FAIL_ON_MISSING_SEMANTIC_CATEGORIES}\n"
     )
     report_lines.append(
-        f"effective_evidence_keys: paths={len(_effective_path_keys())} "
-        f"lines={len(_effective_line_keys())} snippets={len(_effective_snippet_keys())} "
-        f"iter_rows={len(_effective_iter_rows_keys())}\n"
+        "effective_evidence_keys: paths={path_keys} lines={line_keys} "
+        "snippets={snippet_keys} iter_rows={iter_rows_keys}\n".format(**_effective_key_counts())
     )
     report_lines.append(
         f"preflight.filtered_to_zero_fail={PREFLIGHT_FILTERED_TO_ZERO_FAIL_ENABLED} "
@@ -4976,7 +6066,9 @@ def _run_single(
     report_lines.append(f"apply_question_validators={qv_enabled} source={qv_source}\n")
 
     if PREFLIGHT_CORPUS_SCOPE_GATE_ENABLED:
-        forbidden_patterns = _coerce_transform_regex_list(PREFLIGHT_CORPUS_SCOPE_FORBIDDEN_REGEX)
+        # Already stripped/non-empty strings (normalized at policy load); the
+        # compiled list comes from the process-wide _TRANSFORM_REGEX_CACHE.
+        forbidden_patterns = PREFLIGHT_CORPUS_SCOPE_FORBIDDEN_REGEX
         forbidden_regexes = _compile_transform_regexes(
             forbidden_patterns,
             context="corpus_scope_gate.forbidden_path_regex",
@@ -4998,23 +6090,24 @@ def _run_single(
                 errors=parquet_path_universe_meta.get("errors") or [],
             )
             if PREFLIGHT_CORPUS_SCOPE_GATE_FAIL_FAST:
-                try:
-                    partial_report_path = out_dir / REPORT_FILE
-                    write_text(partial_report_path, "".join(report_lines))
-                    _log_event(
-                        logging.ERROR,
-                        "run.abort.corpus_scope_gate",
-                        fn="_run_single",
-                        reason="path_universe_unavailable",
-                        partial_report=str(partial_report_path),
-                    )
-                except Exception:
-                    pass
+                _persist_partial_report(
+                    out_dir,
+                    report_lines,
+                    event="run.abort.corpus_scope_gate",
+                    reason="path_universe_unavailable",
+                )
                 raise SystemExit(2)
         elif parquet_path_universe and forbidden_regexes:
-            contaminated = sorted(
-                p for p in parquet_path_universe if any(rx.search(p) for rx in forbidden_regexes)
+            forbidden_any = _combined_search_regex(
+                forbidden_patterns,
+                context="corpus_scope_gate.forbidden_path_regex",
             )
+            if forbidden_any is not None:
+                contaminated = sorted(p for p in parquet_path_universe if forbidden_any.search(p))
+            else:
+                contaminated = sorted(
+                    p for p in parquet_path_universe if any(rx.search(p) for rx in forbidden_regexes)
+                )
             if contaminated:
                 sample = contaminated[:gate_sample_items]
                 msg = (
@@ -5039,18 +6132,12 @@ def _run_single(
                     contaminated_sample=sample,
                 )
                 if PREFLIGHT_CORPUS_SCOPE_GATE_FAIL_FAST:
-                    try:
-                        partial_report_path = out_dir / REPORT_FILE
-                        write_text(partial_report_path, "".join(report_lines))
-                        _log_event(
-                            logging.ERROR,
-                            "run.abort.corpus_scope_gate",
-                            fn="_run_single",
-                            reason="contaminated_parquet_path_universe",
-                            partial_report=str(partial_report_path),
-                        )
-                    except Exception:
-                        pass
+                    _persist_partial_report(
+                        out_dir,
+                        report_lines,
+                        event="run.abort.corpus_scope_gate",
+                        reason="contaminated_parquet_path_universe",
+                    )
                     raise SystemExit(2)
 
     if pack.validation.minimum_questions and len(pack.questions) < pack.validation.minimum_questions:
@@ -5064,1323 +6151,1221 @@ def _run_single(
                 f"Found non-llm advice_mode in: {non_llm_advice_qids}"
             )
 
-    allowed_citations_by_q: Dict[str, set] = {}
+    allowed_citations_by_q: Dict[str, frozenset] = {}
     question_runtime_stats: List[Dict[str, Any]] = []
     evidence_audit_rows: List[Dict[str, Any]] = []
     preflight_sig_cache: Dict[str, Path] = {}
+    # Fresh preflight artifacts are written in the background while the next
+    # step runs; flushed per question before the filter/evidence passes.
+    # Chat/advice artifacts (only read after the run) go through it as well.
+    artifact_writer = _ArtifactWriter()
+    # pack/parquet/index do not change during a run; stat them once for all
+    # preflight artifact signatures.
+    preflight_input_stats = _artifact_input_stats([pack_path, parquet_path, index_path])
 
     total_questions = len(pack.questions)
-    for q_idx, q in enumerate(pack.questions, start=1):
-        q_t0 = time.perf_counter()
-        schema_retry_count = 0
-        adaptive_rerun_count = 0
-        advice_retry_count = 0
-        advice_rc: int | str | None = None
-        advice_text: str = ""
-        advice_quality_issues: List[str] = []
-        validator_section_opened = False
-        advice_validator_section_opened = False
-        _log_event(
-            logging.INFO,
-            "question.start",
-            fn="_run_single",
-            question_num=f"{q_idx}/{total_questions}",
-            qid=q.id,
-            title=q.title,
-            answer_mode=q.answer_mode,
-            advice_mode=q.advice_mode,
-            mission_advice_gate=mission_advice_gate_enabled,
-            question_preview=_compact_log_text(
-                q.question,
-                max_chars=max(32, int(getattr(args, "log_question_max_chars", DEFAULT_LOG_QUESTION_MAX_CHARS))),
-            ),
-        )
-        report_lines.append(f"\n## {q.id}: {q.title}\n")
-        report_lines.append(f"\n**Question:**\n\n{q.question}\n")
-        report_lines.append(
-            f"- Question modes: answer_mode={q.answer_mode} advice_mode={q.advice_mode}\n"
-        )
+    # Closed in finally so pending chat/audit writes are flushed (and their
+    # errors raised) on the SystemExit aborts inside the loop as well.
+    try:
+        for q_idx, q in enumerate(pack.questions, start=1):
+            q_t0 = time.perf_counter()
+            schema_retry_count = 0
+            adaptive_rerun_count = 0
+            advice_retry_count = 0
+            advice_rc: int | str | None = None
+            advice_text: str = ""
+            advice_quality_issues: List[str] = []
+            validator_section_opened = False
+            advice_validator_section_opened = False
+            if LOGGER.isEnabledFor(logging.INFO):
+                _log_event(
+                    logging.INFO,
+                    "question.start",
+                    fn="_run_single",
+                    question_num=f"{q_idx}/{total_questions}",
+                    qid=q.id,
+                    title=q.title,
+                    answer_mode=q.answer_mode,
+                    advice_mode=q.advice_mode,
+                    mission_advice_gate=mission_advice_gate_enabled,
+                    question_preview=_compact_log_text(
+                        q.question,
+                        max_chars=max(32, int(getattr(args, "log_question_max_chars", DEFAULT_LOG_QUESTION_MAX_CHARS))),
+                    ),
+                )
+            report_lines.append(f"\n## {q.id}: {q.title}\n")
+            report_lines.append(f"\n**Question:**\n\n{q.question}\n")
+            report_lines.append(
+                f"- Question modes: answer_mode={q.answer_mode} advice_mode={q.advice_mode}\n"
+            )
 
-        preflights = q.preflight or []
-        evidence_blocks: List[str] = []
-        preflight_filtered_to_zero_failures: List[Dict[str, Any]] = []
+            preflights = q.preflight or []
+            evidence_blocks: List[str] = []
+            preflight_filtered_to_zero_failures: List[Dict[str, Any]] = []
 
-        dependency_issues = _validate_group_by_path_dependencies(preflights)
-        if dependency_issues:
-            msg = (
-                "Preflight transform dependency validation failed: "
-                "group_by_path_top_n.from must reference a prior step in the same question."
-            )
-            if not validator_section_opened:
-                report_lines.append("\n**Validator issues:**\n\n")
-                validator_section_opened = True
-            report_lines.append(f"- Evidence gate: {msg}\n")
-            for it in dependency_issues[: int(ISSUE_CAPS.get("unknown_paths", 10))]:
-                report_lines.append(f"- Preflight transform: {it}\n")
-            fatal_contract_issues.extend([f"{q.id}: {it}" for it in dependency_issues])
-            _log_event(
-                logging.ERROR,
-                "question.preflight.transform_dependency.invalid",
-                fn="_run_single",
-                qid=q.id,
-                issue_count=len(dependency_issues),
-                sample=dependency_issues[:3],
-            )
-            try:
-                partial_report_path = out_dir / REPORT_FILE
-                write_text(partial_report_path, "".join(report_lines))
+            dependency_issues = _validate_group_by_path_dependencies(preflights)
+            if dependency_issues:
+                msg = (
+                    "Preflight transform dependency validation failed: "
+                    "group_by_path_top_n.from must reference a prior step in the same question."
+                )
+                if not validator_section_opened:
+                    report_lines.append("\n**Validator issues:**\n\n")
+                    validator_section_opened = True
+                report_lines.append(f"- Evidence gate: {msg}\n")
+                report_lines.extend(f"- Preflight transform: {it}\n" for it in dependency_issues[: int(ISSUE_CAPS.get("unknown_paths", 10))])
+                fatal_contract_issues.extend(f"{q.id}: {it}" for it in dependency_issues)
                 _log_event(
                     logging.ERROR,
-                    "run.abort.preflight_transform_dependency",
+                    "question.preflight.transform_dependency.invalid",
                     fn="_run_single",
                     qid=q.id,
-                    partial_report=str(partial_report_path),
+                    issue_count=len(dependency_issues),
+                    sample=dependency_issues[:3],
                 )
-            except Exception:
-                pass
-            raise SystemExit(2)
+                _persist_partial_report(
+                    out_dir,
+                    report_lines,
+                    event="run.abort.preflight_transform_dependency",
+                    qid=q.id,
+                )
+                raise SystemExit(2)
 
-        # Preflights
-        for step in preflights:
-            if not isinstance(step, dict):
-                continue
-            name = step.get("name")
-            cmd = step.get("cmd")
-            if not name or not isinstance(cmd, list):
-                continue
+            # Preflights
+            def _plan_step(step: Any) -> _PreflightPlan | None:
+                return _plan_preflight_step(
+                    step,
+                    qid=q.id,
+                    out_dir=out_dir,
+                    spec=spec,
+                    prefix=prefix,
+                    all_specs=all_specs,
+                    prefix_for_engine=_prefix_for,
+                    env_for_engine=_env_for_engine,
+                    input_stats=preflight_input_stats,
+                    parquet_path=parquet_path,
+                    index_path=index_path,
+                )
 
-            out_file = out_dir / f"{q.id}_{name}.json"
-
-            # engine_override: use a different engine's prefix for this preflight step
-            step_spec = spec
-            step_prefix = prefix
-            override_engine = step.get("engine_override")
-            if override_engine and all_specs and override_engine in all_specs:
-                step_spec = all_specs[override_engine]
-                step_prefix = build_engine_prefix(step_spec, use_uv=use_uv, target_dir=parquet_path.parent if step_spec.target_dir_flag else None)
-            step_env = _env_for_engine(step_spec.name)
-
-            argv_exact = build_engine_preflight_argv(
-                step_spec,
-                step_prefix,
-                cmd=cmd,
-                index_path=index_path,
-                parquet_path=parquet_path,
-            )
-            sig = build_artifact_signature(argv=argv_exact, inputs=[pack_path, parquet_path, index_path])
-            cache_hit_file = preflight_sig_cache.get(sig)
-            _log_event(
-                logging.INFO,
-                "preflight.step.start",
-                fn="_run_single",
-                qid=q.id,
-                step=name,
-                engine=step_spec.name,
-                cmd=_shell_join(argv_exact, max_chars=640),
-                cached=bool(
-                    (args.cache_preflights and out_file.exists())
-                    or (cache_hit_file is not None and cache_hit_file.exists())
-                ),
+            # With --preflight-workers > 1, the engine calls of each fence (see
+            # _preflight_fences) are started together up front; the loop below
+            # still handles caching, artifacts and short-circuiting step by step.
+            preflight_fences = (
+                _preflight_fences(preflights, short_circuit=bool(args.short_circuit_preflights))
+                if args.preflight_workers > 1
+                else {}
             )
+            prefetched: Dict[str, concurrent.futures.Future[CmdResult]] = {}
+            # Artifacts written/loaded by this question's preflight loop, keyed by
+            # path; the filter and evidence passes below reuse them instead of
+            # re-reading the JSON from disk.
+            step_artifacts: Dict[Path, Any] = {}
+            # Artifacts whose current stdout already went through
+            # _learn_runtime_keys_from_payload; re-learning the same payload is a no-op.
+            keys_learned: set[Path] = set()
+            for step_idx, step in enumerate(preflights):
+                if step_idx in preflight_fences:
+                    fence_plans: List[_PreflightPlan] = []
+                    fence_sigs: set = set()
+                    for fence_step in preflights[step_idx:preflight_fences[step_idx]]:
+                        fence_plan = _plan_step(fence_step)
+                        if fence_plan is None or fence_plan.sig in fence_sigs:
+                            continue
+                        fence_sigs.add(fence_plan.sig)
+                        # Steps likely served from an existing artifact are not prefetched.
+                        if args.cache_preflights and fence_plan.out_file.exists():
+                            continue
+                        fence_hit = preflight_sig_cache.get(fence_plan.sig)
+                        if fence_hit is not None and fence_hit.exists() and not fence_plan.out_file.exists():
+                            continue
+                        fence_plans.append(fence_plan)
+                    prefetched = _start_preflight_prefetch(
+                        fence_plans,
+                        max_workers=args.preflight_workers,
+                        index_path=index_path,
+                        parquet_path=parquet_path,
+                    )
 
-            if args.cache_preflights and out_file.exists():
-                try:
-                    existing = load_json_file(out_file)
-                    if existing.get("_sig") == sig:
-                        report_lines.append(f"- Preflight `{name}`: cached → {out_file.name}\n")
-                        if (
-                            args.short_circuit_preflights
-                            and bool(step.get("stop_if_nonempty"))
-                            and int(existing.get("returncode", 1)) == 0
-                            and _has_preflight_hits(existing.get("stdout"))
-                        ):
-                            report_lines.append("  - ⤷ short-circuit: stop_if_nonempty (cached)\n")
+                plan = _plan_step(step)
+                if plan is None:
+                    continue
+                name = plan.name
+                cmd = plan.cmd
+                out_file = plan.out_file
+                step_spec = plan.spec
+                step_prefix = plan.prefix
+                step_env = plan.env
+                argv_exact = plan.argv
+                sig = plan.sig
+                cache_hit_file = preflight_sig_cache.get(sig)
+                artifact_writer.wait(out_file, cache_hit_file)
+                _log_event(
+                    logging.INFO,
+                    "preflight.step.start",
+                    fn="_run_single",
+                    qid=q.id,
+                    step=name,
+                    engine=step_spec.name,
+                    cmd=_shell_join(argv_exact, max_chars=640),
+                    cached=bool(
+                        (args.cache_preflights and out_file.exists())
+                        or (cache_hit_file is not None and cache_hit_file.exists())
+                    ),
+                )
+
+                if args.cache_preflights and out_file.exists():
+                    try:
+                        existing = load_json_file(out_file)
+                        if existing.get("_sig") == sig:
+                            step_artifacts[out_file] = existing
+                            report_lines.append(f"- Preflight `{name}`: cached → {out_file.name}\n")
+                            if (
+                                args.short_circuit_preflights
+                                and bool(step.get("stop_if_nonempty"))
+                                and int(existing.get("returncode", 1)) == 0
+                                and _has_preflight_hits(existing.get("stdout"))
+                            ):
+                                report_lines.append("  - ⤷ short-circuit: stop_if_nonempty (cached)\n")
+                                _log_event(
+                                    logging.INFO,
+                                    "preflight.step.short_circuit",
+                                    fn="_run_single",
+                                    qid=q.id,
+                                    step=name,
+                                    cached=True,
+                                )
+                                break
                             _log_event(
                                 logging.INFO,
-                                "preflight.step.short_circuit",
+                                "preflight.step.cached",
                                 fn="_run_single",
                                 qid=q.id,
                                 step=name,
-                                cached=True,
+                                returncode=existing.get("returncode"),
+                                artifact=str(out_file),
                             )
-                            break
-                        _log_event(
-                            logging.INFO,
-                            "preflight.step.cached",
-                            fn="_run_single",
-                            qid=q.id,
-                            step=name,
-                            returncode=existing.get("returncode"),
-                            artifact=str(out_file),
-                        )
-                        preflight_sig_cache[sig] = out_file
-                        continue
-                except Exception:
-                    pass
+                            preflight_sig_cache[sig] = out_file
+                            continue
+                    except Exception:
+                        pass
 
-            if (not out_file.exists()) and cache_hit_file and cache_hit_file.exists():
-                try:
-                    shutil.copy2(cache_hit_file, out_file)
-                    existing = load_json_file(out_file)
-                    if existing.get("_sig") == sig:
-                        report_lines.append(f"- Preflight `{name}`: cached(sig) → {out_file.name}\n")
-                        if (
-                            args.short_circuit_preflights
-                            and bool(step.get("stop_if_nonempty"))
-                            and int(existing.get("returncode", 1)) == 0
-                            and _has_preflight_hits(existing.get("stdout"))
-                        ):
-                            report_lines.append("  - ⤷ short-circuit: stop_if_nonempty (cached)\n")
+                if (not out_file.exists()) and cache_hit_file and cache_hit_file.exists():
+                    try:
+                        _link_or_copy(cache_hit_file, out_file)
+                        existing = load_json_file(out_file)
+                        if existing.get("_sig") == sig:
+                            step_artifacts[out_file] = existing
+                            report_lines.append(f"- Preflight `{name}`: cached(sig) → {out_file.name}\n")
+                            if (
+                                args.short_circuit_preflights
+                                and bool(step.get("stop_if_nonempty"))
+                                and int(existing.get("returncode", 1)) == 0
+                                and _has_preflight_hits(existing.get("stdout"))
+                            ):
+                                report_lines.append("  - ⤷ short-circuit: stop_if_nonempty (cached)\n")
+                                _log_event(
+                                    logging.INFO,
+                                    "preflight.step.short_circuit",
+                                    fn="_run_single",
+                                    qid=q.id,
+                                    step=name,
+                                    cached=True,
+                                )
+                                break
                             _log_event(
                                 logging.INFO,
-                                "preflight.step.short_circuit",
+                                "preflight.step.cached",
                                 fn="_run_single",
                                 qid=q.id,
                                 step=name,
-                                cached=True,
+                                returncode=existing.get("returncode"),
+                                artifact=str(out_file),
                             )
-                            break
+                            preflight_sig_cache[sig] = out_file
+                            continue
+                    except Exception:
+                        pass
+
+                prefetched_res = prefetched.pop(sig, None)
+                if prefetched_res is not None:
+                    res = prefetched_res.result()
+                else:
+                    res = run_engine_preflight(
+                        step_spec,
+                        step_prefix,
+                        cmd=cmd,
+                        index_path=index_path,
+                        parquet_path=parquet_path,
+                        env_overrides=step_env,
+                    )
+                parsed_stdout = parse_json_maybe(res.stdout) if _json_prefix_char(res.stdout) in ("{", "[") else None
+                stdout_data = parsed_stdout if parsed_stdout is not None else res.stdout
+                _learn_runtime_keys_from_payload(stdout_data)
+                keys_learned.add(out_file)
+                # Only the INFO event below reads the row estimate.
+                stdout_row_est = _count_iter_rows(stdout_data) if LOGGER.isEnabledFor(logging.INFO) else -1
+                art = {
+                    "_sig": sig,
+                    "argv": res.argv,
+                    "returncode": res.returncode,
+                    "stdout": stdout_data,
+                    "stderr": res.stderr,
+                }
+                artifact_writer.write_json(out_file, art)
+                step_artifacts[out_file] = art
+                preflight_sig_cache[sig] = out_file
+                report_lines.append(f"- Preflight `{name}`: rc={res.returncode} → {out_file.name}\n")
+                key_counts = _effective_key_counts()
+                _log_event(
+                    logging.INFO,
+                    "preflight.step.done",
+                    fn="_run_single",
+                    qid=q.id,
+                    step=name,
+                    returncode=res.returncode,
+                    artifact=str(out_file),
+                    stdout_row_est=stdout_row_est,
+                    stdout_chars=len(res.stdout or ""),
+                    path_keys=key_counts["path_keys"],
+                    line_keys=key_counts["line_keys"],
+                    snippet_keys=key_counts["snippet_keys"],
+                )
+                if res.returncode != 0:
+                    report_lines.append("  - ⚠️ preflight failed (see stderr in artifact)\n")
+                    _log_event(
+                        logging.WARNING,
+                        "preflight.step.failed",
+                        fn="_run_single",
+                        qid=q.id,
+                        step=name,
+                        stderr_preview=_compact_log_text(res.stderr or "", max_chars=DEFAULT_LOG_FIELD_MAX_CHARS),
+                    )
+                elif (
+                    args.short_circuit_preflights
+                    and bool(step.get("stop_if_nonempty"))
+                    and _has_preflight_hits(stdout_data)
+                ):
+                    report_lines.append("  - ⤷ short-circuit: stop_if_nonempty\n")
+                    _log_event(
+                        logging.INFO,
+                        "preflight.step.short_circuit",
+                        fn="_run_single",
+                        qid=q.id,
+                        step=name,
+                        cached=False,
+                    )
+                    break
+
+            artifact_writer.wait()
+
+            # Build cross-preflight context for group_by_path_top_n transforms.
+            # Materialize filtered rows keyed by step name so downstream
+            # deterministic synthesizers/plugins consume the same normalized
+            # preflight data that was injected into prompts.
+            preflight_rows_by_name: Dict[str, List[Dict[str, Any]]] = {}
+            for _pstep in preflights:
+                _pname = _pstep.get("name") if isinstance(_pstep, dict) else None
+                if not _pname:
+                    continue
+                _part_path = out_dir / f"{q.id}_{_pname}.json"
+                if _part_path in step_artifacts or _part_path.exists():
+                    try:
+                        _part_data = step_artifacts.get(_part_path)
+                        if _part_data is None:
+                            _part_data = load_json_file(_part_path)
+                            step_artifacts[_part_path] = _part_data
+                        if _part_data.get("returncode") == 0:
+                            _stdout = _part_data.get("stdout", [])
+                            if _part_path not in keys_learned:
+                                _learn_runtime_keys_from_payload(_stdout)
+                                keys_learned.add(_part_path)
+                            _rows, _row_container_key = _iter_rows_keyed(_stdout)
+                            _raw_count = len(_rows)
+                            _raw_rows = _rows
+                            _t = _step_transform(_pstep)
+                            # A cached artifact already filtered by this exact filter keeps its rows.
+                            # The signature is only needed for that comparison or for the rewrite
+                            # below, so a fresh artifact does not pay for it up front.
+                            _already_filtered = _part_data.get("_stdout_filtered") is True
+                            _filter_sig = _transform_filter_sig(_t) if _already_filtered else None
+                            if not (
+                                _filter_sig is not None
+                                and _part_data.get("_stdout_filter_sig") == _filter_sig
+                            ):
+                                _rows = _apply_transform_filters(_rows, _t, ctx={"preflight_rows_by_name": preflight_rows_by_name})
+                            preflight_rows_by_name[_pname] = _rows
+
+                            # Persist filtered stdout so plugins/deterministic synthesis
+                            # read normalized artifacts instead of raw unfiltered hits.
+                            if isinstance(_stdout, (dict, list)):
+                                _new_count = len(_rows)
+                                if (_raw_count != _new_count) or not _already_filtered:
+                                    # stdout_raw is only kept when filtering dropped something;
+                                    # otherwise it would serialize the same payload twice.
+                                    _dropped_any = (_raw_count != _new_count) or (
+                                        isinstance(_stdout, list) and len(_stdout) != _new_count
+                                    )
+                                    if _dropped_any and "stdout_raw" not in _part_data:
+                                        _part_data["stdout_raw"] = _stdout
+                                    _part_data["stdout"] = _replace_rows_in_stdout(
+                                        _stdout,
+                                        _rows,
+                                        row_container_key=_row_container_key,
+                                        filtered_to_zero=bool(_raw_count > 0 and _new_count == 0),
+                                    )
+                                    keys_learned.discard(_part_path)
+                                    _part_data["_stdout_filtered"] = True
+                                    if not _already_filtered:
+                                        _filter_sig = _transform_filter_sig(_t)
+                                    if _filter_sig is not None:
+                                        _part_data["_stdout_filter_sig"] = _filter_sig
+                                    _part_data["_stdout_rows_before_filter_count"] = int(_raw_count)
+                                    _part_data["_stdout_rows_after_filter_count"] = int(_new_count)
+                                    write_json(_part_path, _part_data)
+                                    _filtered_to_zero = _raw_count > 0 and _new_count == 0
+                                    if LOGGER.isEnabledFor(logging.INFO) or (
+                                        _filtered_to_zero and LOGGER.isEnabledFor(logging.WARNING)
+                                    ):
+                                        # Path diagnostics only feed the log events below.
+                                        _raw_paths = _unique_paths(_raw_rows)
+                                        _new_paths = _unique_paths(_rows)
+                                        _new_path_set = frozenset(_new_paths)
+                                        # Only the dropped-path count and a sample are logged.
+                                        _dropped_iter = (p for p in _raw_paths if p not in _new_path_set)
+                                        _dropped_sample = list(itertools.islice(_dropped_iter, path_sample_items))
+                                        _dropped_count = len(_dropped_sample) + sum(1 for _ in _dropped_iter)
+                                        _filter_diag = _summarize_transform_filters(_t)
+                                        _log_event(
+                                            logging.INFO,
+                                            "preflight.step.filtered",
+                                            fn="_run_single",
+                                            qid=q.id,
+                                            step=_pname,
+                                            rows_before=_raw_count,
+                                            rows_after=_new_count,
+                                            unique_paths_before=len(_raw_paths),
+                                            unique_paths_after=len(_new_paths),
+                                            dropped_paths=_dropped_count,
+                                            path_sample_before=_raw_paths[:path_sample_items],
+                                            path_sample_after=_new_paths[:path_sample_items],
+                                            dropped_path_sample=_dropped_sample,
+                                            artifact=str(_part_path),
+                                            **_filter_diag,
+                                        )
+                                        if _filtered_to_zero:
+                                            _log_event(
+                                                logging.WARNING,
+                                                "preflight.step.filtered_to_zero",
+                                                fn="_run_single",
+                                                qid=q.id,
+                                                step=_pname,
+                                                rows_before=_raw_count,
+                                                unique_paths_before=len(_raw_paths),
+                                                dropped_paths=_dropped_count,
+                                                dropped_path_sample=_dropped_sample,
+                                                artifact=str(_part_path),
+                                                **_filter_diag,
+                                            )
+                    except Exception:
+                        pass
+            transform_ctx: Dict[str, Any] = {"preflight_rows_by_name": preflight_rows_by_name}
+
+            # Evidence injection from preflight artifacts (BC-001: field-aware)
+            usable_evidence_blocks = 0
+            for step in preflights:
+                name = step.get("name") if isinstance(step, dict) else None
+                if not name:
+                    continue
+                art_path = out_dir / f"{q.id}_{name}.json"
+                if art_path not in step_artifacts and not art_path.exists():
+                    continue
+                try:
+                    art_data = step_artifacts.get(art_path)
+                    if art_data is None:
+                        art_data = load_json_file(art_path)
+                    if art_data.get("returncode") != 0:
+                        continue
+                    stdout_data = art_data.get("stdout")
+                    stdout_already_filtered = bool(art_data.get("_stdout_filtered"))
+                    if art_path not in keys_learned:
+                        _learn_runtime_keys_from_payload(stdout_data)
+                    # IMPORTANT:
+                    # When preflight output was filtered-to-zero, stdout may be "empty"
+                    # but we must still inject a deterministic "0 results" evidence block
+                    # so citation provenance can remain evidence-backed.
+                    pre_filter_count_hint = _safe_int(art_data.get("_stdout_rows_before_filter_count"), 0)
+                    post_filter_count_hint = _safe_int(art_data.get("_stdout_rows_after_filter_count"), -1)
+                    filtered_to_zero_hint = bool(stdout_data.get("_stdout_filtered_to_zero")) if isinstance(stdout_data, dict) else False
+                    filtered_to_zero_artifact = stdout_already_filtered and pre_filter_count_hint > 0 and post_filter_count_hint == 0
+                    if (not _nonempty_stdout(stdout_data)) and not (filtered_to_zero_hint or filtered_to_zero_artifact):
+                        continue
+                    # Merged step transform (filters, limits, render override); see _step_transform.
+                    transform = _step_transform(step)
+
+                    # ---------------------------------------------------------
+                    # DOC_SUMMARY injection (deterministic, citeable)
+                    #
+                    # Problem: doc evidence triggers "INSUFFICIENT EVIDENCE"
+                    # refusal when model sees a truncated list. We precompute
+                    # summary counts from the full JSON to give stable facts.
+                    # Fields are explicitly *_shown to prevent repo-global claims.
+                    # ---------------------------------------------------------
+                    if name == "doc_analysis" and isinstance(stdout_data, dict) and _has_preflight_hits(stdout_data):
+                        cite_tok = f"{q.id}_{name}.json:1"
+                        ents = stdout_data.get("entities")
+                        mods = stdout_data.get("module_docs")
+
+                        # Capture configured max_items for transparency
+                        max_items_cfg = None
+                        mi = transform.get("max_items")
+                        try:
+                            max_items_cfg = int(mi) if mi is not None else None
+                        except Exception:
+                            max_items_cfg = None
+
+                        if isinstance(ents, list):
+                            entities_shown = len(ents)
+                            vis_counts = _doc_visibility_counts(ents)
+
+                            module_docs_shown = module_docs_with_shown = module_docs_without_shown = 0
+                            if isinstance(mods, list):
+                                module_docs_shown = len(mods)
+                                module_docs_with_shown = sum(1 for m in mods if isinstance(m, dict) and m.get("has_doc"))
+                                module_docs_without_shown = module_docs_shown - module_docs_with_shown
+
+                            mi_part = f"max_items_configured={max_items_cfg}" if max_items_cfg is not None else "max_items_configured=(unset)"
+                            summary = (
+                                f"DOC_SUMMARY: entities_shown={entities_shown} {mi_part} "
+                                f"pub_shown={vis_counts['pub_shown']} pub_doc_shown={vis_counts['pub_doc_shown']} "
+                                f"pub_undoc_shown={vis_counts['pub_undoc_shown']} pub_crate_shown={vis_counts['pub_crate_shown']} "
+                                f"private_shown={vis_counts['private_shown']} other_vis_shown={vis_counts['other_vis_shown']} "
+                                f"module_docs_shown={module_docs_shown} module_docs_with_shown={module_docs_with_shown} module_docs_without_shown={module_docs_without_shown}"
+                            )
+                        else:
+                            # Fallback: schema mismatch — still inject citeable marker
+                            mi_part = f"max_items_configured={max_items_cfg}" if max_items_cfg is not None else "max_items_configured=(unset)"
+                            summary = f"DOC_SUMMARY: unavailable (schema mismatch: missing entities list) {mi_part}"
+
+                        evidence_blocks.append(f"[Preflight DOC_SUMMARY]:\nCITE={cite_tok}\n{summary}")
+
+                    # Read step-level render controls from pack YAML
+                    step_render = step.get("render", DEFAULT_RENDER_MODE)
+                    step_fence = step.get("fence_lang", "")
+                    step_max = step.get("block_max_chars", args.preflight_max_chars)
+
+                    # Honor transform: filters, limits, render override
+                    rows, detected_container_key = _iter_rows_keyed(stdout_data)
+                    pre_filter_count = _safe_int(art_data.get("_stdout_rows_before_filter_count"), len(rows))
+                    stored_container_key = art_data.get("_stdout_row_container_key")
+                    row_container_key = (
+                        str(stored_container_key)
+                        if isinstance(stored_container_key, str) and stored_container_key.strip()
+                        else detected_container_key
+                    )
+                    if rows:
+                        # Apply semantic filters only when artifact has not already been normalized.
+                        if not stdout_already_filtered:
+                            rows = _apply_transform_filters(rows, transform, ctx=transform_ctx)
+
+                        t_max_items = transform.get("max_items")
+                        if t_max_items and isinstance(t_max_items, int):
+                            rows = rows[:t_max_items]
+
+                        t_max_chars = transform.get("max_chars")
+                        if t_max_chars and isinstance(t_max_chars, int):
+                            step_max = t_max_chars  # transform max_chars overrides default
+
+                        stdout_data = _replace_rows_in_stdout(
+                            stdout_data,
+                            rows,
+                            row_container_key=row_container_key,
+                            filtered_to_zero=bool(pre_filter_count > 0 and len(rows) == 0),
+                        )
+
+                    # transform.render overrides step-level render
+                    if transform.get("render"):
+                        step_render = transform["render"]
+
+                    step_has_usable_evidence = _has_preflight_hits(stdout_data)
+                    if step_has_usable_evidence:
+                        usable_evidence_blocks += 1
+                    elif (
+                        PREFLIGHT_FILTERED_TO_ZERO_FAIL_ENABLED
+                        and pre_filter_count >= PREFLIGHT_FILTERED_TO_ZERO_FAIL_RAW_ROWS_THRESHOLD
+                    ):
+                        filter_diag = _summarize_transform_filters(transform)
+                        preflight_filtered_to_zero_failures.append(
+                            {
+                                "step": str(name),
+                                "rows_before": int(pre_filter_count),
+                                "filters": filter_diag,
+                            }
+                        )
                         _log_event(
-                            logging.INFO,
-                            "preflight.step.cached",
+                            logging.ERROR,
+                            "preflight.step.filtered_to_zero.fail_gate",
                             fn="_run_single",
                             qid=q.id,
                             step=name,
-                            returncode=existing.get("returncode"),
-                            artifact=str(out_file),
+                            rows_before=pre_filter_count,
+                            threshold=PREFLIGHT_FILTERED_TO_ZERO_FAIL_RAW_ROWS_THRESHOLD,
+                            artifact=str(art_path),
+                            **filter_diag,
                         )
-                        preflight_sig_cache[sig] = out_file
-                        continue
+
+                    # If all rows were filtered away, emit a clear "0 results" block
+                    if pre_filter_count > 0 and not step_has_usable_evidence:
+                        filters_used = [k for k in TRANSFORM_FILTER_KEYS if transform.get(k)]
+                        block = f"[{name}] 0 results (filtered {pre_filter_count} raw hits; filters: {', '.join(filters_used)})"
+                    else:
+                        block = format_evidence_block(
+                            str(name), stdout_data,
+                            max_chars=step_max,
+                            render_mode=step_render,
+                            fence_lang=step_fence,
+                        )
+                    cite_tok = f"{q.id}_{name}.json:1"
+                    evidence_blocks.append(
+                        f"[Preflight {name}]:\nCITE={cite_tok}\n{block}"
+                    )
                 except Exception:
-                    pass
+                    continue
 
-            res = run_engine_preflight(
-                step_spec,
-                step_prefix,
-                cmd=cmd,
-                index_path=index_path,
-                parquet_path=parquet_path,
-                env_overrides=step_env,
+            use_quote_bypass = (
+                (args._effective_qb_mode == "on")
+                or (args._effective_qb_mode == "auto" and usable_evidence_blocks > 0)
             )
-            parsed_stdout = parse_json_maybe(res.stdout) if str(res.stdout).lstrip().startswith(("{", "[")) else None
-            stdout_data = parsed_stdout if parsed_stdout is not None else res.stdout
-            _learn_runtime_keys_from_payload(stdout_data)
-            stdout_row_est = len(_iter_rows(stdout_data)) if isinstance(stdout_data, (dict, list)) else 0
-            art = {
-                "_sig": sig,
-                "argv": res.argv,
-                "returncode": res.returncode,
-                "stdout": stdout_data,
-                "stderr": res.stderr,
-            }
-            write_json(out_file, art)
-            preflight_sig_cache[sig] = out_file
-            report_lines.append(f"- Preflight `{name}`: rc={res.returncode} → {out_file.name}\n")
+            evidence_is_empty = (usable_evidence_blocks == 0)
             _log_event(
                 logging.INFO,
-                "preflight.step.done",
+                "question.evidence.summary",
                 fn="_run_single",
                 qid=q.id,
-                step=name,
-                returncode=res.returncode,
-                artifact=str(out_file),
-                stdout_row_est=stdout_row_est,
-                stdout_chars=len(res.stdout or ""),
-                path_keys=len(_effective_path_keys()),
-                line_keys=len(_effective_line_keys()),
-                snippet_keys=len(_effective_snippet_keys()),
+                preflight_steps=len(preflights),
+                evidence_blocks=len(evidence_blocks),
+                evidence_usable_blocks=usable_evidence_blocks,
+                quote_bypass_mode=args._effective_qb_mode,
+                use_quote_bypass=use_quote_bypass,
+                evidence_empty=evidence_is_empty,
+                **_effective_key_counts(),
             )
-            if res.returncode != 0:
-                report_lines.append("  - ⚠️ preflight failed (see stderr in artifact)\n")
-                _log_event(
-                    logging.WARNING,
-                    "preflight.step.failed",
-                    fn="_run_single",
+            _write_evidence_key_map(out_dir=out_dir, parquet_path=parquet_path, engine_name=spec.name)
+
+            # Citation provenance: build allowed token set from injected evidence (optional).
+            if pack.validation.enforce_citations_from_evidence:
+                allowed_citations_by_q[q.id] = _extract_allowed_citation_tokens(evidence_blocks)
+
+            augmented_question = _build_augmented_question(q.question, evidence_blocks, quote_bypass=use_quote_bypass, response_schema=pack.response_schema)
+            augmented_prompt_path = out_dir / f"{q.id}_augmented_prompt.md"
+            write_text(augmented_prompt_path, augmented_question)
+            question_evidence_audit: Dict[str, Any] | None = None
+            question_evidence_audit_path: Path | None = None
+            question_evidence_summary_row: Dict[str, Any] | None = None
+            if bool(getattr(args, "evidence_audit", EVIDENCE_AUDIT_ENABLED_DEFAULT)):
+                question_evidence_audit = _build_question_evidence_audit(
                     qid=q.id,
-                    step=name,
-                    stderr_preview=_compact_log_text(res.stderr or "", max_chars=DEFAULT_LOG_FIELD_MAX_CHARS),
+                    title=q.title,
+                    question_text=q.question,
+                    answer_mode=q.answer_mode,
+                    advice_mode=q.advice_mode,
+                    quote_bypass_mode=args._effective_qb_mode,
+                    evidence_blocks=evidence_blocks,
+                    preflight_steps=[s for s in preflights if isinstance(s, dict)],
+                    parquet_path_universe=parquet_path_universe,
+                    parquet_path_meta=parquet_path_universe_meta,
+                    repo_root=repo_root,
                 )
-            elif (
-                args.short_circuit_preflights
-                and bool(step.get("stop_if_nonempty"))
-                and _has_preflight_hits(stdout_data)
-            ):
-                report_lines.append("  - ⤷ short-circuit: stop_if_nonempty\n")
+                question_evidence_audit["evidence_usable_blocks_count"] = int(usable_evidence_blocks)
+                question_evidence_audit["evidence_empty"] = bool(evidence_is_empty)
+                question_evidence_audit.setdefault("artifacts", {})
+                question_evidence_audit["artifacts"]["augmented_prompt"] = str(augmented_prompt_path.name)
+                question_evidence_audit_path = _write_question_evidence_audit(
+                    out_dir=out_dir,
+                    qid=q.id,
+                    audit=question_evidence_audit,
+                    writer=artifact_writer,
+                )
+                question_evidence_summary_row = {
+                    "qid": q.id,
+                    "evidence_blocks_count": int(question_evidence_audit.get("evidence_blocks_count", 0)),
+                    "evidence_usable_blocks_count": int(question_evidence_audit.get("evidence_usable_blocks_count", 0)),
+                    "evidence_paths_count": int(question_evidence_audit.get("evidence_paths_count", 0)),
+                    "paths_missing_from_parquet_count": int(
+                        question_evidence_audit.get("paths_missing_from_parquet_count", 0)
+                    ),
+                    "artifact": str(question_evidence_audit_path.name),
+                }
+                evidence_audit_rows.append(question_evidence_summary_row)
                 _log_event(
                     logging.INFO,
-                    "preflight.step.short_circuit",
+                    "question.evidence.audit",
                     fn="_run_single",
                     qid=q.id,
-                    step=name,
-                    cached=False,
+                    artifact=str(question_evidence_audit_path),
+                    evidence_blocks=question_evidence_audit.get("evidence_blocks_count"),
+                    evidence_usable_blocks=question_evidence_audit.get("evidence_usable_blocks_count"),
+                    evidence_paths=question_evidence_audit.get("evidence_paths_count"),
+                    paths_missing_from_parquet=question_evidence_audit.get("paths_missing_from_parquet_count"),
+                    path_match_count=question_evidence_audit.get("paths_matched_to_parquet_count"),
+                    path_missing_sample=question_evidence_audit.get("paths_missing_from_parquet_sample"),
                 )
-                break
-
-        # Build cross-preflight context for group_by_path_top_n transforms.
-        # Materialize filtered rows keyed by step name so downstream
-        # deterministic synthesizers/plugins consume the same normalized
-        # preflight data that was injected into prompts.
-        preflight_rows_by_name: Dict[str, List[Dict[str, Any]]] = {}
-        for _pstep in preflights:
-            _pname = _pstep.get("name") if isinstance(_pstep, dict) else None
-            if not _pname:
-                continue
-            _part_path = out_dir / f"{q.id}_{_pname}.json"
-            if _part_path.exists():
-                try:
-                    _part_data = load_json_file(_part_path)
-                    if _part_data.get("returncode") == 0:
-                        _stdout = _part_data.get("stdout", [])
-                        _learn_runtime_keys_from_payload(_stdout)
-                        _rows = _iter_rows(_stdout)
-                        _raw_count = len(_rows)
-                        _raw_paths = _unique_paths(_rows)
-                        _row_container_key = _detect_row_container_key(_stdout) if isinstance(_stdout, dict) else None
-                        _t = _pstep.get("transform") if isinstance(_pstep, dict) else None
-                        if isinstance(_t, dict):
-                            _t = dict(_t)
-                            _t.setdefault("_default_test_path_patterns", default_test_path_patterns)
-                            _t.setdefault("_default_exclude_path_regex", DEFAULT_EXCLUDE_PATH_REGEX)
-                        else:
-                            _t = {
-                                "_default_test_path_patterns": default_test_path_patterns,
-                                "_default_exclude_path_regex": DEFAULT_EXCLUDE_PATH_REGEX,
-                            }
-                        _rows = _apply_transform_filters(_rows, _t, ctx={"preflight_rows_by_name": preflight_rows_by_name})
-                        _new_paths = _unique_paths(_rows)
-                        _new_path_set = set(_new_paths)
-                        _dropped_paths = [p for p in _raw_paths if p not in _new_path_set]
-                        _filter_diag = _summarize_transform_filters(_t)
-                        preflight_rows_by_name[_pname] = _rows
-
-                        # Persist filtered stdout so plugins/deterministic synthesis
-                        # read normalized artifacts instead of raw unfiltered hits.
-                        if isinstance(_stdout, (dict, list)):
-                            _new_count = len(_rows)
-                            if (_raw_count != _new_count) or (_part_data.get("_stdout_filtered") is not True):
-                                if "stdout_raw" not in _part_data:
-                                    _part_data["stdout_raw"] = _stdout
-                                _part_data["stdout"] = _replace_rows_in_stdout(
-                                    _stdout,
-                                    _rows,
-                                    row_container_key=_row_container_key,
-                                    filtered_to_zero=bool(_raw_count > 0 and _new_count == 0),
-                                )
-                                _part_data["_stdout_filtered"] = True
-                                _part_data["_stdout_rows_before_filter_count"] = int(_raw_count)
-                                _part_data["_stdout_rows_after_filter_count"] = int(_new_count)
-                                write_json(_part_path, _part_data)
-                                _log_event(
-                                    logging.INFO,
-                                    "preflight.step.filtered",
-                                    fn="_run_single",
-                                    qid=q.id,
-                                    step=_pname,
-                                    rows_before=_raw_count,
-                                    rows_after=_new_count,
-                                    unique_paths_before=len(_raw_paths),
-                                    unique_paths_after=len(_new_paths),
-                                    dropped_paths=len(_dropped_paths),
-                                    path_sample_before=_raw_paths[:path_sample_items],
-                                    path_sample_after=_new_paths[:path_sample_items],
-                                    dropped_path_sample=_dropped_paths[:path_sample_items],
-                                    artifact=str(_part_path),
-                                    **_filter_diag,
-                                )
-                                if _raw_count > 0 and _new_count == 0:
-                                    _log_event(
-                                        logging.WARNING,
-                                        "preflight.step.filtered_to_zero",
-                                        fn="_run_single",
-                                        qid=q.id,
-                                        step=_pname,
-                                        rows_before=_raw_count,
-                                        unique_paths_before=len(_raw_paths),
-                                        dropped_paths=len(_dropped_paths),
-                                        dropped_path_sample=_dropped_paths[:path_sample_items],
-                                        artifact=str(_part_path),
-                                        **_filter_diag,
-                                    )
-                except Exception:
-                    pass
-        transform_ctx: Dict[str, Any] = {"preflight_rows_by_name": preflight_rows_by_name}
 
-        # Evidence injection from preflight artifacts (BC-001: field-aware)
-        usable_evidence_blocks = 0
-        for step in preflights:
-            name = step.get("name") if isinstance(step, dict) else None
-            if not name:
-                continue
-            art_path = out_dir / f"{q.id}_{name}.json"
-            if not art_path.exists():
-                continue
-            try:
-                art_data = load_json_file(art_path)
-                if art_data.get("returncode") != 0:
-                    continue
-                stdout_data = art_data.get("stdout")
-                stdout_already_filtered = bool(art_data.get("_stdout_filtered"))
-                _learn_runtime_keys_from_payload(stdout_data)
-                # IMPORTANT:
-                # When preflight output was filtered-to-zero, stdout may be "empty"
-                # but we must still inject a deterministic "0 results" evidence block
-                # so citation provenance can remain evidence-backed.
-                pre_filter_count_hint = _safe_int(art_data.get("_stdout_rows_before_filter_count"), 0)
-                post_filter_count_hint = _safe_int(art_data.get("_stdout_rows_after_filter_count"), -1)
-                filtered_to_zero_hint = bool(stdout_data.get("_stdout_filtered_to_zero")) if isinstance(stdout_data, dict) else False
-                filtered_to_zero_artifact = bool(art_data.get("_stdout_filtered")) and pre_filter_count_hint > 0 and post_filter_count_hint == 0
-                if (not _nonempty_stdout(stdout_data)) and not (filtered_to_zero_hint or filtered_to_zero_artifact):
-                    continue
-
-                # ---------------------------------------------------------
-                # DOC_SUMMARY injection (deterministic, citeable)
-                #
-                # Problem: doc evidence triggers "INSUFFICIENT EVIDENCE"
-                # refusal when model sees a truncated list. We precompute
-                # summary counts from the full JSON to give stable facts.
-                # Fields are explicitly *_shown to prevent repo-global claims.
-                # ---------------------------------------------------------
-                if name == "doc_analysis" and isinstance(stdout_data, dict) and _has_preflight_hits(stdout_data):
-                    cite_tok = f"{q.id}_{name}.json:1"
-                    ents = stdout_data.get("entities")
-                    mods = stdout_data.get("module_docs")
-
-                    # Capture configured max_items for transparency
-                    max_items_cfg = None
-                    if isinstance(step, dict) and isinstance(step.get("transform"), dict):
-                        mi = step["transform"].get("max_items")
-                        try:
-                            max_items_cfg = int(mi) if mi is not None else None
-                        except Exception:
-                            max_items_cfg = None
-
-                    if isinstance(ents, list):
-                        entities_shown = len(ents)
-                        pub_shown = pub_doc_shown = pub_undoc_shown = 0
-                        pub_crate_shown = private_shown = other_vis_shown = 0
-
-                        for e in ents:
-                            if not isinstance(e, dict):
-                                continue
-                            v = (e.get("visibility") or "").strip()
-                            if v == "pub":
-                                pub_shown += 1
-                                d = e.get("doc")
-                                has_doc = bool(d.get("has_doc")) if isinstance(d, dict) else False
-                                if has_doc:
-                                    pub_doc_shown += 1
-                                else:
-                                    pub_undoc_shown += 1
-                            elif v == "pub(crate)":
-                                pub_crate_shown += 1
-                            elif v == "private":
-                                private_shown += 1
-                            else:
-                                other_vis_shown += 1
-
-                        module_docs_shown = module_docs_with_shown = module_docs_without_shown = 0
-                        if isinstance(mods, list):
-                            module_docs_shown = len(mods)
-                            for m in mods:
-                                if isinstance(m, dict) and bool(m.get("has_doc")):
-                                    module_docs_with_shown += 1
-                                else:
-                                    module_docs_without_shown += 1
-
-                        mi_part = f"max_items_configured={max_items_cfg}" if max_items_cfg is not None else "max_items_configured=(unset)"
-                        summary = (
-                            f"DOC_SUMMARY: entities_shown={entities_shown} {mi_part} "
-                            f"pub_shown={pub_shown} pub_doc_shown={pub_doc_shown} pub_undoc_shown={pub_undoc_shown} "
-                            f"pub_crate_shown={pub_crate_shown} private_shown={private_shown} other_vis_shown={other_vis_shown} "
-                            f"module_docs_shown={module_docs_shown} module_docs_with_shown={module_docs_with_shown} module_docs_without_shown={module_docs_without_shown}"
-                        )
-                    else:
-                        # Fallback: schema mismatch — still inject citeable marker
-                        mi_part = f"max_items_configured={max_items_cfg}" if max_items_cfg is not None else "max_items_configured=(unset)"
-                        summary = f"DOC_SUMMARY: unavailable (schema mismatch: missing entities list) {mi_part}"
-
-                    evidence_blocks.append(f"[Preflight DOC_SUMMARY]:\nCITE={cite_tok}\n{summary}")
-
-                # Read step-level render controls from pack YAML
-                step_render = step.get("render", DEFAULT_RENDER_MODE)
-                step_fence = step.get("fence_lang", "")
-                step_max = step.get("block_max_chars", args.preflight_max_chars)
-
-                # Honor transform: filters, limits, render override
-                transform = step.get("transform") or {}
-                if isinstance(transform, dict):
-                    transform = dict(transform)
-                else:
-                    transform = {}
-                transform.setdefault("_default_test_path_patterns", default_test_path_patterns)
-                transform.setdefault("_default_exclude_path_regex", DEFAULT_EXCLUDE_PATH_REGEX)
-                rows = _iter_rows(stdout_data)
-                pre_filter_count = _safe_int(art_data.get("_stdout_rows_before_filter_count"), len(rows))
-                row_container_key = (
-                    str(art_data.get("_stdout_row_container_key"))
-                    if isinstance(art_data.get("_stdout_row_container_key"), str)
-                    and str(art_data.get("_stdout_row_container_key")).strip()
-                    else (_detect_row_container_key(stdout_data) if isinstance(stdout_data, dict) else None)
+            if preflight_filtered_to_zero_failures:
+                steps = ", ".join(f"{f.get('step')}({f.get('rows_before')})" for f in preflight_filtered_to_zero_failures)
+                msg = (
+                    "Preflight starvation gate failed: at least one preflight returned high raw-hit volume but "
+                    f"filters collapsed to zero usable evidence (threshold={PREFLIGHT_FILTERED_TO_ZERO_FAIL_RAW_ROWS_THRESHOLD}). "
+                    "This indicates corpus pollution or wrong scope; question execution aborted."
                 )
-                if rows:
-                    # Apply semantic filters only when artifact has not already been normalized.
-                    if not stdout_already_filtered:
-                        rows = _apply_transform_filters(rows, transform, ctx=transform_ctx)
-
-                    t_max_items = transform.get("max_items")
-                    if t_max_items and isinstance(t_max_items, int):
-                        rows = rows[:t_max_items]
-
-                    t_max_chars = transform.get("max_chars")
-                    if t_max_chars and isinstance(t_max_chars, int):
-                        step_max = t_max_chars  # transform max_chars overrides default
-
-                    stdout_data = _replace_rows_in_stdout(
-                        stdout_data,
-                        rows,
-                        row_container_key=row_container_key,
-                        filtered_to_zero=bool(pre_filter_count > 0 and len(rows) == 0),
-                    )
-
-                # transform.render overrides step-level render
-                if transform.get("render"):
-                    step_render = transform["render"]
-
-                step_has_usable_evidence = _has_preflight_hits(stdout_data)
-                if step_has_usable_evidence:
-                    usable_evidence_blocks += 1
-                elif (
-                    PREFLIGHT_FILTERED_TO_ZERO_FAIL_ENABLED
-                    and pre_filter_count >= PREFLIGHT_FILTERED_TO_ZERO_FAIL_RAW_ROWS_THRESHOLD
-                ):
-                    filter_diag = _summarize_transform_filters(transform)
-                    preflight_filtered_to_zero_failures.append(
-                        {
-                            "step": str(name),
-                            "rows_before": int(pre_filter_count),
-                            "filters": filter_diag,
-                        }
-                    )
-                    _log_event(
-                        logging.ERROR,
-                        "preflight.step.filtered_to_zero.fail_gate",
-                        fn="_run_single",
-                        qid=q.id,
-                        step=name,
-                        rows_before=pre_filter_count,
-                        threshold=PREFLIGHT_FILTERED_TO_ZERO_FAIL_RAW_ROWS_THRESHOLD,
-                        artifact=str(art_path),
-                        **filter_diag,
-                    )
-
-                # If all rows were filtered away, emit a clear "0 results" block
-                if pre_filter_count > 0 and not step_has_usable_evidence:
-                    filters_used = [k for k in TRANSFORM_FILTER_KEYS if transform.get(k)]
-                    block = f"[{name}] 0 results (filtered {pre_filter_count} raw hits; filters: {', '.join(filters_used)})"
-                else:
-                    block = format_evidence_block(
-                        str(name), stdout_data,
-                        max_chars=step_max,
-                        render_mode=step_render,
-                        fence_lang=step_fence,
-                    )
-                cite_tok = f"{q.id}_{name}.json:1"
-                evidence_blocks.append(
-                    f"[Preflight {name}]:\nCITE={cite_tok}\n{block}"
+                report_lines.append(
+                    f"- ⛔ Preflight starvation gate: {len(preflight_filtered_to_zero_failures)} step(s) collapsed to zero "
+                    f"after filtering ({steps})\n"
                 )
-            except Exception:
-                continue
-
-        use_quote_bypass = (
-            (args._effective_qb_mode == "on")
-            or (args._effective_qb_mode == "auto" and usable_evidence_blocks > 0)
-        )
-        evidence_is_empty = (usable_evidence_blocks == 0)
-        _log_event(
-            logging.INFO,
-            "question.evidence.summary",
-            fn="_run_single",
-            qid=q.id,
-            preflight_steps=len(preflights),
-            evidence_blocks=len(evidence_blocks),
-            evidence_usable_blocks=usable_evidence_blocks,
-            quote_bypass_mode=args._effective_qb_mode,
-            use_quote_bypass=use_quote_bypass,
-            evidence_empty=evidence_is_empty,
-            path_keys=len(_effective_path_keys()),
-            line_keys=len(_effective_line_keys()),
-            snippet_keys=len(_effective_snippet_keys()),
-            iter_rows_keys=len(_effective_iter_rows_keys()),
-        )
-        _write_evidence_key_map(out_dir=out_dir, parquet_path=parquet_path, engine_name=spec.name)
-
-        # Citation provenance: build allowed token set from injected evidence (optional).
-        if pack.validation.enforce_citations_from_evidence:
-            allowed_citations_by_q[q.id] = _extract_allowed_citation_tokens(evidence_blocks)
-
-        augmented_question = _build_augmented_question(q.question, evidence_blocks, quote_bypass=use_quote_bypass, response_schema=pack.response_schema)
-        augmented_prompt_path = out_dir / f"{q.id}_augmented_prompt.md"
-        write_text(augmented_prompt_path, augmented_question)
-        question_evidence_audit: Dict[str, Any] | None = None
-        question_evidence_audit_path: Path | None = None
-        question_evidence_summary_row: Dict[str, Any] | None = None
-        if bool(getattr(args, "evidence_audit", EVIDENCE_AUDIT_ENABLED_DEFAULT)):
-            question_evidence_audit = _build_question_evidence_audit(
-                qid=q.id,
-                title=q.title,
-                question_text=q.question,
-                answer_mode=q.answer_mode,
-                advice_mode=q.advice_mode,
-                quote_bypass_mode=args._effective_qb_mode,
-                evidence_blocks=evidence_blocks,
-                preflight_steps=[s for s in preflights if isinstance(s, dict)],
-                parquet_path_universe=parquet_path_universe,
-                parquet_path_meta=parquet_path_universe_meta,
-                repo_root=repo_root,
-            )
-            question_evidence_audit["evidence_usable_blocks_count"] = int(usable_evidence_blocks)
-            question_evidence_audit["evidence_empty"] = bool(evidence_is_empty)
-            question_evidence_audit.setdefault("artifacts", {})
-            question_evidence_audit["artifacts"]["augmented_prompt"] = str(augmented_prompt_path.name)
-            question_evidence_audit_path = _write_question_evidence_audit(
-                out_dir=out_dir,
-                qid=q.id,
-                audit=question_evidence_audit,
-            )
-            question_evidence_summary_row = {
-                "qid": q.id,
-                "evidence_blocks_count": int(question_evidence_audit.get("evidence_blocks_count", 0)),
-                "evidence_usable_blocks_count": int(question_evidence_audit.get("evidence_usable_blocks_count", 0)),
-                "evidence_paths_count": int(question_evidence_audit.get("evidence_paths_count", 0)),
-                "paths_missing_from_parquet_count": int(
-                    question_evidence_audit.get("paths_missing_from_parquet_count", 0)
-                ),
-                "artifact": str(question_evidence_audit_path.name),
-            }
-            evidence_audit_rows.append(question_evidence_summary_row)
-            _log_event(
-                logging.INFO,
-                "question.evidence.audit",
-                fn="_run_single",
-                qid=q.id,
-                artifact=str(question_evidence_audit_path),
-                evidence_blocks=question_evidence_audit.get("evidence_blocks_count"),
-                evidence_usable_blocks=question_evidence_audit.get("evidence_usable_blocks_count"),
-                evidence_paths=question_evidence_audit.get("evidence_paths_count"),
-                paths_missing_from_parquet=question_evidence_audit.get("paths_missing_from_parquet_count"),
-                path_match_count=question_evidence_audit.get("paths_matched_to_parquet_count"),
-                path_missing_sample=question_evidence_audit.get("paths_missing_from_parquet_sample"),
-            )
-
-        if preflight_filtered_to_zero_failures:
-            steps = ", ".join(f"{f.get('step')}({f.get('rows_before')})" for f in preflight_filtered_to_zero_failures)
-            msg = (
-                "Preflight starvation gate failed: at least one preflight returned high raw-hit volume but "
-                f"filters collapsed to zero usable evidence (threshold={PREFLIGHT_FILTERED_TO_ZERO_FAIL_RAW_ROWS_THRESHOLD}). "
-                "This indicates corpus pollution or wrong scope; question execution aborted."
-            )
-            report_lines.append(
-                f"- ⛔ Preflight starvation gate: {len(preflight_filtered_to_zero_failures)} step(s) collapsed to zero "
-                f"after filtering ({steps})\n"
-            )
-            if not validator_section_opened:
-                report_lines.append("\n**Validator issues:**\n\n")
-                validator_section_opened = True
-            report_lines.append(f"- Evidence gate: {msg}\n")
-            fatal_contract_issues.append(f"{q.id}: {msg}")
-            _log_event(
-                logging.ERROR,
-                "question.preflight.filtered_to_zero.fail_fast",
-                fn="_run_single",
-                qid=q.id,
-                failures=preflight_filtered_to_zero_failures[:path_sample_items],
-                fail_fast=PREFLIGHT_FILTERED_TO_ZERO_FAIL_FAST,
-            )
-            if PREFLIGHT_FILTERED_TO_ZERO_FAIL_FAST:
-                try:
-                    partial_report_path = out_dir / REPORT_FILE
-                    write_text(partial_report_path, "".join(report_lines))
-                    _log_event(
-                        logging.ERROR,
-                        "run.abort.preflight_filtered_to_zero",
-                        fn="_run_single",
+                if not validator_section_opened:
+                    report_lines.append("\n**Validator issues:**\n\n")
+                    validator_section_opened = True
+                report_lines.append(f"- Evidence gate: {msg}\n")
+                fatal_contract_issues.append(f"{q.id}: {msg}")
+                _log_event(
+                    logging.ERROR,
+                    "question.preflight.filtered_to_zero.fail_fast",
+                    fn="_run_single",
+                    qid=q.id,
+                    failures=preflight_filtered_to_zero_failures[:path_sample_items],
+                    fail_fast=PREFLIGHT_FILTERED_TO_ZERO_FAIL_FAST,
+                )
+                if PREFLIGHT_FILTERED_TO_ZERO_FAIL_FAST:
+                    _persist_partial_report(
+                        out_dir,
+                        report_lines,
+                        event="run.abort.preflight_filtered_to_zero",
                         qid=q.id,
-                        partial_report=str(partial_report_path),
                     )
-                except Exception:
-                    pass
-                raise SystemExit(2)
-
-        def _compute_schema_issues_local(answer_text: str) -> List[str]:
-            issues_local = validate_response_schema(answer_text or "", pack.validation)
-            required_keys = extract_required_keys_from_contract(strict_response_template)
-            issues_local.extend(validate_required_key_lines(answer_text or "", required_keys))
-            if pack.validation.enforce_citations_from_evidence:
-                allowed = allowed_citations_by_q.get(q.id, set())
-                provenance_issues = validate_citations_from_evidence(answer_text or "", allowed=allowed)
-                for it in provenance_issues:
-                    issues_local.append(f"Citation provenance: {it}")
-            gate_issues = validate_path_gates(answer_text or "", evidence_blocks, pack.validation)
-            for it in gate_issues:
-                issues_local.append(f"Path gates: {it}")
-            return issues_local
-
-        top_k_max = q.top_k if q.top_k is not None else int((q.chat or {}).get("top_k", pack.defaults.chat_top_k))
-        top_k_max = max(1, int(top_k_max))
-        top_k = 0
-        question_chat_cfg = q.chat or {}
-        strict_response_template = str(question_chat_cfg.get("strict_response_template") or "").strip()
-        retry_on_schema_fail = bool(question_chat_cfg.get("retry_on_schema_fail", False))
-        try:
-            schema_retry_attempts = int(question_chat_cfg.get("schema_retry_attempts", 0) or 0)
-        except Exception:
-            schema_retry_attempts = 0
-        schema_retry_attempts = max(0, schema_retry_attempts)
-        if schema_retry_attempts > 0:
-            retry_on_schema_fail = True
+                    raise SystemExit(2)
 
-        # Strict evidence presence gate: do not continue a question without extracted evidence.
-        if STRICT_FAIL_ON_EMPTY_EVIDENCE and evidence_is_empty:
-            msg = (
-                "No usable deterministic evidence extracted for question (all preflight outputs empty or "
-                "filtered_to_zero); strict evidence gate requires evidence-backed analysis and aborts this run."
-            )
-            report_lines.append(
-                "- ⛔ Strict evidence gate: no usable deterministic evidence extracted "
-                "(model/advice skipped, run aborted)\n"
-            )
-            if not validator_section_opened:
-                report_lines.append("\n**Validator issues:**\n\n")
-                validator_section_opened = True
-            report_lines.append(f"- Evidence gate: {msg}\n")
-            fatal_contract_issues.append(f"{q.id}: {msg}")
-            _log_event(
-                logging.ERROR,
-                "question.evidence.empty.fail_fast",
-                fn="_run_single",
-                qid=q.id,
-                fail_fast=STRICT_EMPTY_EVIDENCE_FAIL_FAST,
-                quote_bypass_mode=args._effective_qb_mode,
-            )
-            if STRICT_EMPTY_EVIDENCE_FAIL_FAST:
-                try:
-                    partial_report_path = out_dir / REPORT_FILE
-                    write_text(partial_report_path, "".join(report_lines))
-                    _log_event(
-                        logging.ERROR,
-                        "run.abort.empty_evidence",
-                        fn="_run_single",
-                        qid=q.id,
-                        partial_report=str(partial_report_path),
-                    )
-                except Exception:
-                    pass
-                raise SystemExit(2)
+            def _compute_schema_issues_local(answer_text: str) -> List[str]:
+                issues_local = validate_response_schema(answer_text or "", pack.validation)
+                issues_local.extend(validate_required_key_lines(answer_text or "", strict_required_keys))
+                if pack.validation.enforce_citations_from_evidence:
+                    allowed = allowed_citations_by_q.get(q.id, frozenset())
+                    provenance_issues = validate_citations_from_evidence(answer_text or "", allowed=allowed)
+                    for it in provenance_issues:
+                        issues_local.append(f"Citation provenance: {it}")
+                gate_issues = validate_path_gates(answer_text or "", evidence_blocks, pack.validation)
+                for it in gate_issues:
+                    issues_local.append(f"Path gates: {it}")
+                return issues_local
+
+            top_k_max = q.top_k if q.top_k is not None else int((q.chat or {}).get("top_k", pack.defaults.chat_top_k))
+            top_k_max = max(1, int(top_k_max))
+            top_k = 0
+            question_chat_cfg = q.chat or {}
+            strict_response_template = str(question_chat_cfg.get("strict_response_template") or "").strip()
+            strict_required_keys = extract_required_keys_from_contract(strict_response_template)
+            retry_on_schema_fail = bool(question_chat_cfg.get("retry_on_schema_fail", False))
+            try:
+                schema_retry_attempts = int(question_chat_cfg.get("schema_retry_attempts", 0) or 0)
+            except Exception:
+                schema_retry_attempts = 0
+            schema_retry_attempts = max(0, schema_retry_attempts)
+            if schema_retry_attempts > 0:
+                retry_on_schema_fail = True
 
-        # Chat / model call (or deterministic synthesis)
-        if q.answer_mode == "deterministic":
-            report_lines.append("- Deterministic answer_mode: model call skipped by question config.\n")
-            _log_event(
-                logging.INFO,
-                "question.answer.skip",
-                fn="_run_single",
-                qid=q.id,
-                reason="deterministic_answer_mode",
-            )
-            det_answer = ""
-            if callable(synthesize_deterministic_answer):
-                try:
-                    det_answer = str(synthesize_deterministic_answer(q.id, out_dir) or "")
-                except Exception:
-                    det_answer = ""
-            if not det_answer.strip():
-                det_answer = _build_deterministic_seed_answer(q.id, evidence_blocks)
-            chat_obj = {
-                "answer": det_answer,
-                "sources": [],
-                "_deterministic_answer": True,
-                "_deterministic_reason": "question.answer_mode=deterministic",
-            }
-            chat_res = CmdResult(argv=[], returncode=0, stdout=json.dumps(chat_obj), stderr="")
-            chat_json = chat_obj
-        elif args.evidence_empty_gate and evidence_is_empty:
-            report_lines.append(f"- ⛔ Evidence-empty gate: no deterministic evidence extracted → NOT FOUND (model call skipped)\n")
-            _log_event(
-                logging.WARNING,
-                "question.answer.skip",
-                fn="_run_single",
-                qid=q.id,
-                reason="evidence_empty_gate",
-                quote_bypass_mode=args._effective_qb_mode,
-            )
-            chat_obj = {
-                "answer": str(
-                    PROMPTS.get(
-                        "evidence_empty_answer",
-                        "**NOT FOUND**\n\nDeterministic evidence extraction returned no results. Model call skipped.",
-                    )
-                ),
-                "sources": [],
-                "_evidence_empty_gated": True,
-            }
-            chat_res = CmdResult(argv=[], returncode=0, stdout=json.dumps(chat_obj), stderr="")
-            chat_json = chat_obj
-        else:
-            if use_quote_bypass:
-                bypass_prompt = _build_quote_bypass_prompt(q.question, evidence_blocks, response_schema=pack.response_schema)
-                bypass_prompt_path = out_dir / f"{q.id}_bypass_prompt.md"
-                write_text(bypass_prompt_path, bypass_prompt)
-                prompt_file = prompt_analyze
-                qtext = bypass_prompt
-                prompt_mode = "analyze_only"
-                if question_evidence_audit is not None:
-                    question_evidence_audit.setdefault("artifacts", {})
-                    question_evidence_audit["artifacts"]["bypass_prompt"] = str(bypass_prompt_path.name)
-            else:
-                prompt_file = prompt_grounding
-                qtext = augmented_question
-                prompt_mode = "grounding"
-                if question_evidence_audit is not None:
-                    question_evidence_audit.setdefault("artifacts", {})
-                    question_evidence_audit["artifacts"]["grounding_prompt"] = str(augmented_prompt_path.name)
-
-            if strict_response_template:
-                qtext = _inject_strict_response_template(qtext, strict_response_template)
-                if question_evidence_audit is not None:
-                    question_evidence_audit.setdefault("strict_template", {})
-                    question_evidence_audit["strict_template"] = {
-                        "enabled": True,
-                        "template_sha256": _sha256_text(strict_response_template),
-                    }
-
-            top_k_initial = max(1, int(args.chat_top_k_initial))
-            top_k = min(top_k_initial, top_k_max) if args.adaptive_top_k else top_k_max
-
-            def _record_llm_dispatch(
-                *,
-                phase: str,
-                prompt_mode_local: str,
-                prompt_text_local: str,
-                prompt_file_local: Path | None,
-                top_k_local: int,
-            ) -> None:
-                if question_evidence_audit is None:
-                    return
-                rec = _append_llm_dispatch_to_audit(
-                    audit=question_evidence_audit,
-                    phase=phase,
-                    prompt_mode=prompt_mode_local,
-                    prompt_text=prompt_text_local,
-                    prompt_file=prompt_file_local,
-                    backend=args.backend,
-                    model=args.model or "(default)",
-                    top_k=top_k_local,
-                    prompt_profile=args.prompt_profile if spec.prompt_profile_flag else None,
+            # Strict evidence presence gate: do not continue a question without extracted evidence.
+            if STRICT_FAIL_ON_EMPTY_EVIDENCE and evidence_is_empty:
+                msg = (
+                    "No usable deterministic evidence extracted for question (all preflight outputs empty or "
+                    "filtered_to_zero); strict evidence gate requires evidence-backed analysis and aborts this run."
                 )
-                if question_evidence_audit_path is not None:
-                    _write_question_evidence_audit(
-                        out_dir=out_dir,
+                report_lines.append(
+                    "- ⛔ Strict evidence gate: no usable deterministic evidence extracted "
+                    "(model/advice skipped, run aborted)\n"
+                )
+                if not validator_section_opened:
+                    report_lines.append("\n**Validator issues:**\n\n")
+                    validator_section_opened = True
+                report_lines.append(f"- Evidence gate: {msg}\n")
+                fatal_contract_issues.append(f"{q.id}: {msg}")
+                _log_event(
+                    logging.ERROR,
+                    "question.evidence.empty.fail_fast",
+                    fn="_run_single",
+                    qid=q.id,
+                    fail_fast=STRICT_EMPTY_EVIDENCE_FAIL_FAST,
+                    quote_bypass_mode=args._effective_qb_mode,
+                )
+                if STRICT_EMPTY_EVIDENCE_FAIL_FAST:
+                    _persist_partial_report(
+                        out_dir,
+                        report_lines,
+                        event="run.abort.empty_evidence",
                         qid=q.id,
-                        audit=question_evidence_audit,
                     )
+                    raise SystemExit(2)
+
+            # Chat / model call (or deterministic synthesis)
+            if q.answer_mode == "deterministic":
+                report_lines.append("- Deterministic answer_mode: model call skipped by question config.\n")
                 _log_event(
                     logging.INFO,
-                    "question.chat.dispatch",
+                    "question.answer.skip",
                     fn="_run_single",
                     qid=q.id,
-                    phase=phase,
-                    prompt_mode=prompt_mode_local,
-                    backend=args.backend,
-                    model=args.model or "(default)",
-                    top_k=top_k_local,
-                    prompt_file=str(prompt_file_local) if prompt_file_local else "(none)",
-                    prompt_sha256=rec.get("prompt_sha256"),
-                    prompt_chars=rec.get("prompt_chars"),
-                    prompt_cite_markers=rec.get("prompt_cite_markers"),
+                    reason="deterministic_answer_mode",
                 )
+                det_answer = ""
+                if callable(synthesize_deterministic_answer):
+                    try:
+                        det_answer = str(synthesize_deterministic_answer(q.id, out_dir) or "")
+                    except Exception:
+                        det_answer = ""
+                if not det_answer.strip():
+                    det_answer = _build_deterministic_seed_answer(q.id, evidence_blocks)
+                chat_obj = {
+                    "answer": det_answer,
+                    "sources": [],
+                    "_deterministic_answer": True,
+                    "_deterministic_reason": "question.answer_mode=deterministic",
+                }
+                # chat_json carries the payload; the synthesized result's stdout is never parsed.
+                chat_res = CmdResult(argv=[], returncode=0, stdout="", stderr="")
+                chat_json = chat_obj
+            elif args.evidence_empty_gate and evidence_is_empty:
+                report_lines.append(f"- ⛔ Evidence-empty gate: no deterministic evidence extracted → NOT FOUND (model call skipped)\n")
+                _log_event(
+                    logging.WARNING,
+                    "question.answer.skip",
+                    fn="_run_single",
+                    qid=q.id,
+                    reason="evidence_empty_gate",
+                    quote_bypass_mode=args._effective_qb_mode,
+                )
+                chat_obj = {
+                    "answer": _EVIDENCE_EMPTY_ANSWER,
+                    "sources": [],
+                    "_evidence_empty_gated": True,
+                }
+                # chat_json carries the payload; the synthesized result's stdout is never parsed.
+                chat_res = CmdResult(argv=[], returncode=0, stdout="", stderr="")
+                chat_json = chat_obj
+            else:
+                if use_quote_bypass:
+                    bypass_prompt = _build_quote_bypass_prompt(q.question, evidence_blocks, response_schema=pack.response_schema)
+                    bypass_prompt_path = out_dir / f"{q.id}_bypass_prompt.md"
+                    write_text(bypass_prompt_path, bypass_prompt)
+                    prompt_file = prompt_analyze
+                    qtext = bypass_prompt
+                    prompt_mode = "analyze_only"
+                    if question_evidence_audit is not None:
+                        question_evidence_audit.setdefault("artifacts", {})
+                        question_evidence_audit["artifacts"]["bypass_prompt"] = str(bypass_prompt_path.name)
+                else:
+                    prompt_file = prompt_grounding
+                    qtext = augmented_question
+                    prompt_mode = "grounding"
+                    if question_evidence_audit is not None:
+                        question_evidence_audit.setdefault("artifacts", {})
+                        question_evidence_audit["artifacts"]["grounding_prompt"] = str(augmented_prompt_path.name)
 
-            _log_event(
-                logging.INFO,
-                "question.chat.prepare",
-                fn="_run_single",
-                qid=q.id,
-                prompt_mode=prompt_mode,
-                prompt_file=str(prompt_file) if prompt_file else "(none)",
-                backend=args.backend,
-                model=args.model or "(default)",
-                top_k=top_k,
-                top_k_max=top_k_max,
-                strict_response_template=bool(strict_response_template),
-                retry_on_schema_fail=retry_on_schema_fail,
-                schema_retry_attempts=schema_retry_attempts,
-                prompt_preview=_compact_log_text(
-                    qtext,
-                    max_chars=max(64, int(getattr(args, "log_prompt_max_chars", DEFAULT_LOG_PROMPT_MAX_CHARS))),
-                ),
-            )
-
-            _record_llm_dispatch(
-                phase="primary",
-                prompt_mode_local=prompt_mode,
-                prompt_text_local=qtext,
-                prompt_file_local=prompt_file,
-                top_k_local=int(top_k),
-            )
-            chat_res = run_engine_chat(
-                spec,
-                prefix,
-                question=qtext,
-                index_path=index_path,
-                parquet_path=parquet_path,
-                backend=args.backend,
-                model=args.model,
-                top_k=int(top_k),
-                prompt_profile=args.prompt_profile if spec.prompt_profile_flag else None,
-                system_prompt_file=prompt_file,
-                max_tokens=args.max_tokens if args.max_tokens is not None else pack.defaults.max_tokens,
-                temperature=args.temperature if args.temperature is not None else pack.defaults.temperature,
-                top_p=args.top_p,
-                num_ctx=args.num_ctx,
-                env_overrides=main_engine_env,
-            )
-            chat_json = parse_json_maybe(chat_res.stdout) or chat_res.stdout
+                if strict_response_template:
+                    qtext = _inject_strict_response_template(qtext, strict_response_template)
+                    if question_evidence_audit is not None:
+                        question_evidence_audit.setdefault("strict_template", {})
+                        question_evidence_audit["strict_template"] = {
+                            "enabled": True,
+                            "template_sha256": _sha256_text(strict_response_template),
+                        }
 
-            # Adaptive rerun: if validators fail at low-k, retry once with max-k.
-            if args.adaptive_top_k and top_k < top_k_max:
-                ans_probe, _ = _extract_answer_and_sources(chat_json)
-                probe_issues = _compute_schema_issues_local(ans_probe or "")
-                if probe_issues:
-                    report_lines.append(
-                        f"- Adaptive rerun: validator issues={len(probe_issues)} "
-                        f"(top_k={top_k} → {top_k_max})\n"
+                top_k_initial = max(1, int(args.chat_top_k_initial))
+                top_k = min(top_k_initial, top_k_max) if args.adaptive_top_k else top_k_max
+
+                def _record_llm_dispatch(
+                    *,
+                    phase: str,
+                    prompt_mode_local: str,
+                    prompt_text_local: str,
+                    prompt_file_local: Path | None,
+                    top_k_local: int,
+                ) -> None:
+                    if question_evidence_audit is None:
+                        return
+                    rec = _append_llm_dispatch_to_audit(
+                        audit=question_evidence_audit,
+                        phase=phase,
+                        prompt_mode=prompt_mode_local,
+                        prompt_text=prompt_text_local,
+                        prompt_file=prompt_file_local,
+                        backend=args.backend,
+                        model=args.model or "(default)",
+                        top_k=top_k_local,
+                        prompt_profile=args.prompt_profile if spec.prompt_profile_flag else None,
                     )
+                    if question_evidence_audit_path is not None:
+                        _write_question_evidence_audit(
+                            out_dir=out_dir,
+                            qid=q.id,
+                            audit=question_evidence_audit,
+                            writer=artifact_writer,
+                        )
                     _log_event(
-                        logging.WARNING,
-                        "question.chat.adaptive_rerun",
+                        logging.INFO,
+                        "question.chat.dispatch",
                         fn="_run_single",
                         qid=q.id,
-                        issue_count=len(probe_issues),
-                        top_k_before=top_k,
-                        top_k_after=top_k_max,
-                    )
-                    adaptive_rerun_count += 1
-                    issue_bullets = "\n".join(
-                        f"- {it}" for it in probe_issues[: int(ISSUE_CAPS.get("adaptive_rerun_bullets", 8))]
-                    )
-                    rerun_preamble = str(
-                        PROMPT_ADAPTIVE_RERUN.get(
-                            "preamble",
-                            (
-                                "IMPORTANT:\n"
-                                "- Follow the required response schema exactly (VERDICT/CITATIONS first).\n"
-                                "- If evidence is present, do not output NOT FOUND.\n"
-                                "- Ensure CITATIONS tokens are path:line(-line)."
-                            ),
-                        )
-                    ).strip()
-                    rerun_issues_header = str(
-                        PROMPT_ADAPTIVE_RERUN.get("issues_header", "Validation issues to fix in this rerun:")
-                    )
-                    rerun_qtext = (
-                        rerun_preamble
-                        + "\n\n"
-                        + rerun_issues_header
-                        + "\n"
-                        + issue_bullets
-                        + "\n\n"
-                        + qtext
-                    )
-                    top_k = top_k_max
-                    _record_llm_dispatch(
-                        phase="adaptive_rerun",
-                        prompt_mode_local=f"{prompt_mode}:adaptive_rerun",
-                        prompt_text_local=rerun_qtext,
-                        prompt_file_local=prompt_file,
-                        top_k_local=int(top_k),
-                    )
-                    chat_res = run_engine_chat(
-                        spec,
-                        prefix,
-                        question=rerun_qtext,
-                        index_path=index_path,
-                        parquet_path=parquet_path,
+                        phase=phase,
+                        prompt_mode=prompt_mode_local,
                         backend=args.backend,
-                        model=args.model,
-                        top_k=int(top_k),
-                        prompt_profile=args.prompt_profile if spec.prompt_profile_flag else None,
-                        system_prompt_file=prompt_file,
-                        max_tokens=args.max_tokens if args.max_tokens is not None else pack.defaults.max_tokens,
-                        temperature=args.temperature if args.temperature is not None else pack.defaults.temperature,
-                        top_p=args.top_p,
-                        num_ctx=args.num_ctx,
-                        env_overrides=main_engine_env,
+                        model=args.model or "(default)",
+                        top_k=top_k_local,
+                        prompt_file=str(prompt_file_local) if prompt_file_local else "(none)",
+                        prompt_sha256=rec.get("prompt_sha256"),
+                        prompt_chars=rec.get("prompt_chars"),
+                        prompt_cite_markers=rec.get("prompt_cite_markers"),
                     )
-                    chat_json = parse_json_maybe(chat_res.stdout) or chat_res.stdout
 
-            # Optional schema retry loop: rerun with strict template + explicit validator errors.
-            if retry_on_schema_fail and schema_retry_attempts > 0:
-                for retry_idx in range(1, schema_retry_attempts + 1):
-                    ans_probe, _ = _extract_answer_and_sources(chat_json)
-                    probe_issues = _compute_schema_issues_local(ans_probe or "")
-                    if not probe_issues:
-                        _log_event(
-                            logging.INFO,
-                            "question.chat.schema_retry.satisfied",
-                            fn="_run_single",
-                            qid=q.id,
-                            attempt=retry_idx - 1,
-                        )
-                        break
-                    report_lines.append(
-                        f"- Schema retry {retry_idx}/{schema_retry_attempts}: validator issues={len(probe_issues)}\n"
-                    )
+                if LOGGER.isEnabledFor(logging.INFO):
                     _log_event(
-                        logging.WARNING,
-                        "question.chat.schema_retry",
+                        logging.INFO,
+                        "question.chat.prepare",
                         fn="_run_single",
                         qid=q.id,
-                        attempt=f"{retry_idx}/{schema_retry_attempts}",
-                        issue_count=len(probe_issues),
-                    )
-                    schema_retry_count += 1
-                    retry_prompt = _build_schema_retry_prompt(
-                        base_question=qtext,
-                        strict_template=strict_response_template,
-                        issues=probe_issues,
-                        attempt=retry_idx,
-                        total_attempts=schema_retry_attempts,
-                    )
-                    _record_llm_dispatch(
-                        phase=f"schema_retry_{retry_idx}",
-                        prompt_mode_local=f"{prompt_mode}:schema_retry",
-                        prompt_text_local=retry_prompt,
-                        prompt_file_local=prompt_file,
-                        top_k_local=int(top_k),
-                    )
-                    chat_res = run_engine_chat(
-                        spec,
-                        prefix,
-                        question=retry_prompt,
-                        index_path=index_path,
-                        parquet_path=parquet_path,
+                        prompt_mode=prompt_mode,
+                        prompt_file=str(prompt_file) if prompt_file else "(none)",
                         backend=args.backend,
-                        model=args.model,
-                        top_k=int(top_k),
-                        prompt_profile=args.prompt_profile if spec.prompt_profile_flag else None,
-                        system_prompt_file=prompt_file,
-                        max_tokens=args.max_tokens if args.max_tokens is not None else pack.defaults.max_tokens,
-                        temperature=args.temperature if args.temperature is not None else pack.defaults.temperature,
-                        top_p=args.top_p,
-                        num_ctx=args.num_ctx,
-                        env_overrides=main_engine_env,
+                        model=args.model or "(default)",
+                        top_k=top_k,
+                        top_k_max=top_k_max,
+                        strict_response_template=bool(strict_response_template),
+                        retry_on_schema_fail=retry_on_schema_fail,
+                        schema_retry_attempts=schema_retry_attempts,
+                        prompt_preview=_compact_log_text(
+                            qtext,
+                            max_chars=max(64, int(getattr(args, "log_prompt_max_chars", DEFAULT_LOG_PROMPT_MAX_CHARS))),
+                        ),
                     )
-                    chat_json = parse_json_maybe(chat_res.stdout) or chat_res.stdout
 
-        chat_file = out_dir / f"{q.id}_chat.json"
-        write_json(chat_file, {"argv": chat_res.argv, "returncode": chat_res.returncode, "stdout": chat_json, "stderr": chat_res.stderr})
-        report_lines.append(f"- Chat: rc={chat_res.returncode} → {chat_file.name} (top_k={top_k})\n")
-        _log_event(
-            logging.INFO,
-            "question.chat.done",
-            fn="_run_single",
-            qid=q.id,
-            returncode=chat_res.returncode,
-            top_k=top_k,
-            artifact=str(chat_file),
-        )
-
-        ans, sources = _extract_answer_and_sources(chat_json)
-        raw_ans = ans or ""
-
-        # Persist raw model answer alongside any repaired answer (debug/provenance SSOT).
-        raw_persisted = False
-        if isinstance(chat_json, dict):
-            if not chat_json.get("_raw_answer"):
-                chat_json["_raw_answer"] = raw_ans
-                raw_persisted = True
-        else:
-            chat_json = {"answer": raw_ans, "sources": sources, "_raw_answer": raw_ans}
-            raw_persisted = True
-        if raw_persisted:
-            write_json(
-                chat_file,
-                {"argv": chat_res.argv, "returncode": chat_res.returncode, "stdout": chat_json, "stderr": chat_res.stderr},
-            )
-
-        if q.answer_mode == "llm" and strict_response_template:
-            repaired_ans, repair_notes = _repair_answer_for_strict_contract(
-                qid=q.id,
-                answer=ans or "",
-                strict_template=strict_response_template,
-                evidence_blocks=evidence_blocks,
-                validation=pack.validation,
-            )
-            if repaired_ans != (ans or ""):
-                ans = repaired_ans
-                if isinstance(chat_json, dict):
-                    chat_json["answer"] = ans
-                else:
-                    chat_json = {"answer": ans, "sources": sources, "_raw_answer": raw_ans}
-                write_json(
-                    chat_file,
-                    {"argv": chat_res.argv, "returncode": chat_res.returncode, "stdout": chat_json, "stderr": chat_res.stderr},
-                )
-                if repair_notes:
-                    report_lines.append(f"- Strict contract repair applied: {', '.join(repair_notes)}\n")
-
-        # Deterministic Gate B repair: when body paths are present but matching
-        # CITATIONS tokens are missing, auto-complete from injected evidence.
-        if ans and evidence_blocks and pack.validation.enforce_paths_must_be_cited:
-            ans2, added_citations = _auto_complete_citations_for_path_gates(
-                ans, evidence_blocks, pack.validation
-            )
-            if ans2 and ans2 != ans:
-                ans = ans2
-                if isinstance(chat_json, dict):
-                    chat_json["answer"] = ans
-                else:
-                    chat_json = {"answer": ans, "sources": sources, "_raw_answer": raw_ans}
-                write_json(
-                    chat_file,
-                    {
-                        "argv": chat_res.argv,
-                        "returncode": chat_res.returncode,
-                        "stdout": chat_json,
-                        "stderr": chat_res.stderr,
-                    },
+                _record_llm_dispatch(
+                    phase="primary",
+                    prompt_mode_local=prompt_mode,
+                    prompt_text_local=qtext,
+                    prompt_file_local=prompt_file,
+                    top_k_local=int(top_k),
                 )
-                _log_event(
-                    logging.INFO,
-                    "question.path_gate.autocomplete",
-                    fn="_run_single",
-                    qid=q.id,
-                    added_count=len(added_citations),
-                    added=added_citations[: int(ISSUE_CAPS.get("uncited_paths", 10))],
+                chat_res = run_engine_chat(
+                    spec,
+                    prefix,
+                    question=qtext,
+                    top_k=int(top_k),
+                    system_prompt_file=prompt_file,
+                    **chat_engine_kwargs,
                 )
+                chat_json = parse_json_maybe(chat_res.stdout) or chat_res.stdout
 
-        if ans:
-            report_lines.append("\n**Answer:**\n\n")
-            report_lines.append(ans + "\n\n")
-        if sources is not None:
-            report_lines.append("**Sources:**\n\n")
-            if isinstance(sources, list):
-                for s in sources[: int(ISSUE_CAPS.get("sources", 20))]:
-                    report_lines.append(f"- {s}\n")
-            else:
-                report_lines.append(f"- {sources}\n")
+                # Adaptive rerun: if validators fail at low-k, retry once with max-k.
+                if args.adaptive_top_k and top_k < top_k_max:
+                    ans_probe, _ = _extract_answer_and_sources(chat_json)
+                    probe_issues = _compute_schema_issues_local(ans_probe or "")
+                    if probe_issues:
+                        report_lines.append(
+                            f"- Adaptive rerun: validator issues={len(probe_issues)} "
+                            f"(top_k={top_k} → {top_k_max})\n"
+                        )
+                        _log_event(
+                            logging.WARNING,
+                            "question.chat.adaptive_rerun",
+                            fn="_run_single",
+                            qid=q.id,
+                            issue_count=len(probe_issues),
+                            top_k_before=top_k,
+                            top_k_after=top_k_max,
+                        )
+                        adaptive_rerun_count += 1
+                        issue_bullets = "\n".join(
+                            f"- {it}" for it in probe_issues[: int(ISSUE_CAPS.get("adaptive_rerun_bullets", 8))]
+                        )
+                        rerun_qtext = (
+                            _ADAPTIVE_RERUN_PREAMBLE
+                            + "\n\n"
+                            + _ADAPTIVE_RERUN_ISSUES_HEADER
+                            + "\n"
+                            + issue_bullets
+                            + "\n\n"
+                            + qtext
+                        )
+                        top_k = top_k_max
+                        _record_llm_dispatch(
+                            phase="adaptive_rerun",
+                            prompt_mode_local=f"{prompt_mode}:adaptive_rerun",
+                            prompt_text_local=rerun_qtext,
+                            prompt_file_local=prompt_file,
+                            top_k_local=int(top_k),
+                        )
+                        chat_res = run_engine_chat(
+                            spec,
+                            prefix,
+                            question=rerun_qtext,
+                            top_k=int(top_k),
+                            system_prompt_file=prompt_file,
+                            **chat_engine_kwargs,
+                        )
+                        chat_json = parse_json_maybe(chat_res.stdout) or chat_res.stdout
+
+                # Optional schema retry loop: rerun with strict template + explicit validator errors.
+                if retry_on_schema_fail and schema_retry_attempts > 0:
+                    # From the second retry on, the question is re-sent with evidence
+                    # trimmed to prompts.schema_retry.evidence_budget_chars (0 = off).
+                    retry_base_qtext = qtext
+                    retry_compressed_qtext: str | None = None
+                    # (answer, base question) hash pairs already sent back for a retry. The
+                    # issues (and so the retry prompt, modulo the attempt counter) follow
+                    # from the answer, so a repeated pair would re-dispatch the same
+                    # request; the first trimmed-evidence retry changes the base question
+                    # and still runs.
+                    seen_retry_answers: set[Tuple[str, str]] = set()
+                    for retry_idx in range(1, schema_retry_attempts + 1):
+                        ans_probe, _ = _extract_answer_and_sources(chat_json)
+                        probe_issues = _compute_schema_issues_local(ans_probe or "")
+                        if not probe_issues:
+                            _log_event(
+                                logging.INFO,
+                                "question.chat.schema_retry.satisfied",
+                                fn="_run_single",
+                                qid=q.id,
+                                attempt=retry_idx - 1,
+                            )
+                            break
+                        if retry_idx >= 2 and _SCHEMA_RETRY_EVIDENCE_BUDGET_CHARS > 0 and retry_compressed_qtext is None:
+                            compressed_blocks = _compress_evidence_blocks(evidence_blocks, _SCHEMA_RETRY_EVIDENCE_BUDGET_CHARS)
+                            if compressed_blocks is evidence_blocks:
+                                retry_compressed_qtext = qtext
+                            else:
+                                if use_quote_bypass:
+                                    retry_compressed_qtext = _build_quote_bypass_prompt(
+                                        q.question, compressed_blocks, response_schema=pack.response_schema
+                                    )
+                                else:
+                                    retry_compressed_qtext = _build_augmented_question(
+                                        q.question, compressed_blocks, quote_bypass=False, response_schema=pack.response_schema
+                                    )
+                                if strict_response_template:
+                                    retry_compressed_qtext = _inject_strict_response_template(
+                                        retry_compressed_qtext, strict_response_template
+                                    )
+                                report_lines.append(
+                                    f"- Schema retry evidence trimmed: chars={sum(map(len, evidence_blocks))}"
+                                    f" → {sum(map(len, compressed_blocks))} (budget={_SCHEMA_RETRY_EVIDENCE_BUDGET_CHARS})\n"
+                                )
+                                if question_evidence_audit is not None:
+                                    question_evidence_audit["schema_retry_evidence_compression"] = {
+                                        "compression_applied": True,
+                                        "budget_chars": _SCHEMA_RETRY_EVIDENCE_BUDGET_CHARS,
+                                        "evidence_chars_before": sum(map(len, evidence_blocks)),
+                                        "evidence_chars_after": sum(map(len, compressed_blocks)),
+                                        "from_attempt": retry_idx,
+                                    }
+                            retry_base_qtext = retry_compressed_qtext
+                        retry_key = (_sha256_text(ans_probe or ""), _sha256_text(retry_base_qtext))
+                        if retry_key in seen_retry_answers:
+                            report_lines.append(
+                                f"- Schema retry {retry_idx}/{schema_retry_attempts}: skipped "
+                                f"(answer unchanged since previous retry; issues={len(probe_issues)})\n"
+                            )
+                            _log_event(
+                                logging.WARNING,
+                                "question.chat.schema_retry.skipped_duplicate",
+                                fn="_run_single",
+                                qid=q.id,
+                                attempt=f"{retry_idx}/{schema_retry_attempts}",
+                                issue_count=len(probe_issues),
+                            )
+                            break
+                        seen_retry_answers.add(retry_key)
+                        report_lines.append(
+                            f"- Schema retry {retry_idx}/{schema_retry_attempts}: validator issues={len(probe_issues)}\n"
+                        )
+                        _log_event(
+                            logging.WARNING,
+                            "question.chat.schema_retry",
+                            fn="_run_single",
+                            qid=q.id,
+                            attempt=f"{retry_idx}/{schema_retry_attempts}",
+                            issue_count=len(probe_issues),
+                        )
+                        schema_retry_count += 1
+                        retry_prompt = _build_schema_retry_prompt(
+                            base_question=retry_base_qtext,
+                            strict_template=strict_response_template,
+                            issues=probe_issues,
+                            attempt=retry_idx,
+                            total_attempts=schema_retry_attempts,
+                        )
+                        _record_llm_dispatch(
+                            phase=f"schema_retry_{retry_idx}",
+                            prompt_mode_local=f"{prompt_mode}:schema_retry",
+                            prompt_text_local=retry_prompt,
+                            prompt_file_local=prompt_file,
+                            top_k_local=int(top_k),
+                        )
+                        chat_res = run_engine_chat(
+                            spec,
+                            prefix,
+                            question=retry_prompt,
+                            top_k=int(top_k),
+                            system_prompt_file=prompt_file,
+                            **chat_engine_kwargs,
+                        )
+                        chat_json = parse_json_maybe(chat_res.stdout) or chat_res.stdout
 
-        schema_issues = _compute_schema_issues_local(ans or "")
-        if qv_enabled and ans and question_validators_cfg:
-            qv_issues = _apply_question_validators(
-                qid=q.id,
-                answer_text=ans or "",
-                cfg=question_validators_cfg,
-                default_test_path_patterns=default_test_path_patterns,
-            )
-            if qv_issues:
-                schema_issues.extend(qv_issues)
-                _log_event(
-                    logging.WARNING,
-                    "question.qvalidators.issues",
-                    fn="_run_single",
-                    qid=q.id,
-                    issue_count=len(qv_issues),
-                    sample=qv_issues[:3],
-                )
-            else:
-                _log_event(
-                    logging.INFO,
-                    "question.qvalidators.ok",
-                    fn="_run_single",
-                    qid=q.id,
-                )
-        if schema_issues:
-            validator_section_opened = True
-            report_lines.append("\n**Validator issues:**\n\n")
-            for it in schema_issues:
-                report_lines.append(f"- Response schema: {it}\n")
-            if pack.validation.fail_on_missing_citations:
-                fatal_contract_issues.extend([f"{q.id}: {it}" for it in schema_issues])
-            _log_event(
-                logging.WARNING,
-                "question.validator.issues",
-                fn="_run_single",
-                qid=q.id,
-                issue_count=len(schema_issues),
-                sample=schema_issues[:3],
-            )
-        else:
+            chat_file = out_dir / f"{q.id}_chat.json"
+            report_lines.append(f"- Chat: rc={chat_res.returncode} → {chat_file.name} (top_k={top_k})\n")
             _log_event(
                 logging.INFO,
-                "question.validator.ok",
+                "question.chat.done",
                 fn="_run_single",
                 qid=q.id,
+                returncode=chat_res.returncode,
+                top_k=top_k,
+                artifact=str(chat_file),
             )
 
-        if q.advice_mode == "llm":
-            if not evidence_blocks:
-                report_lines.append("- Advice: skipped (no evidence blocks available)\n")
-                advice_rc = "skipped_no_evidence"
+            ans, sources = _extract_answer_and_sources(chat_json)
+            raw_ans = ans or ""
+
+            # Persist raw model answer alongside any repaired answer (debug/provenance SSOT).
+            # From here on chat_json is a dict; repairs below update its "answer" and
+            # the artifact is written once after them.
+            if isinstance(chat_json, dict):
+                if not chat_json.get("_raw_answer"):
+                    chat_json["_raw_answer"] = raw_ans
             else:
-                advice_prompt = q.advice_prompt or _build_advice_prompt(
+                chat_json = {"answer": raw_ans, "sources": sources, "_raw_answer": raw_ans}
+
+            if q.answer_mode == "llm" and strict_response_template:
+                repaired_ans, repair_notes = _repair_answer_for_strict_contract(
                     qid=q.id,
-                    question_text=q.question,
-                    deterministic_answer=ans or "",
+                    answer=ans or "",
+                    strict_template=strict_response_template,
                     evidence_blocks=evidence_blocks,
+                    validation=pack.validation,
                 )
-                advice_prompt_path = out_dir / f"{q.id}_advice_prompt.md"
-                write_text(advice_prompt_path, advice_prompt)
-                if question_evidence_audit is not None:
-                    question_evidence_audit.setdefault("artifacts", {})
-                    question_evidence_audit["artifacts"]["advice_prompt"] = str(advice_prompt_path.name)
-                    if question_evidence_audit_path is not None:
-                        _write_question_evidence_audit(
-                            out_dir=out_dir,
-                            qid=q.id,
-                            audit=question_evidence_audit,
-                        )
+                if repaired_ans != (ans or ""):
+                    ans = repaired_ans
+                    chat_json["answer"] = ans
+                    if repair_notes:
+                        report_lines.append(f"- Strict contract repair applied: {', '.join(repair_notes)}\n")
+
+            # Deterministic Gate B repair: when body paths are present but matching
+            # CITATIONS tokens are missing, auto-complete from injected evidence.
+            if ans and evidence_blocks and pack.validation.enforce_paths_must_be_cited:
+                ans2, added_citations = _auto_complete_citations_for_path_gates(
+                    ans, evidence_blocks, pack.validation
+                )
+                if ans2 and ans2 != ans:
+                    ans = ans2
+                    chat_json["answer"] = ans
+                    _log_event(
+                        logging.INFO,
+                        "question.path_gate.autocomplete",
+                        fn="_run_single",
+                        qid=q.id,
+                        added_count=len(added_citations),
+                        added=added_citations[: int(ISSUE_CAPS.get("uncited_paths", 10))],
+                    )
+            artifact_writer.write_json(chat_file, _cmd_result_payload(chat_res, chat_json))
+
+            if ans:
+                report_lines.append("\n**Answer:**\n\n")
+                report_lines.append(ans + "\n\n")
+            if sources is not None:
+                report_lines.append("**Sources:**\n\n")
+                if isinstance(sources, list):
+                    report_lines.extend(f"- {s}\n" for s in itertools.islice(sources, int(ISSUE_CAPS.get("sources", 20))))
+                else:
+                    report_lines.append(f"- {sources}\n")
 
-                advice_top_k_cap = int(ISSUE_CAPS.get("advice_top_k_cap", 8))
-                default_advice_top_k = 0 if not ADVICE_RETRIEVAL_CITATIONS_ENABLED else min(advice_top_k_cap, top_k_max)
-                advice_top_k = int((q.chat or {}).get("advice_top_k", default_advice_top_k))
-                advice_top_k = max(0, advice_top_k)
-                advice_prompt_file = Path(DEFAULT_ADVICE_PROMPT_FILE) if Path(DEFAULT_ADVICE_PROMPT_FILE).exists() else (prompt_grounding or prompt_analyze)
-                _log_event(
-                    logging.INFO,
-                    "question.advice.prepare",
-                    fn="_run_single",
+            schema_issues = _compute_schema_issues_local(ans or "")
+            if qv_enabled and ans and question_validators_cfg:
+                qv_issues = _apply_question_validators(
                     qid=q.id,
-                    advice_prompt_file=str(advice_prompt_file) if advice_prompt_file else "(none)",
-                    advice_top_k=advice_top_k,
+                    answer_text=ans or "",
+                    cfg=question_validators_cfg,
+                    default_test_path_patterns=default_test_path_patterns,
                 )
-                if question_evidence_audit is not None:
-                    rec = _append_llm_dispatch_to_audit(
-                        audit=question_evidence_audit,
-                        phase="advice_primary",
-                        prompt_mode="advice",
-                        prompt_text=advice_prompt,
-                        prompt_file=advice_prompt_file,
-                        backend=args.backend,
-                        model=args.model or "(default)",
-                        top_k=advice_top_k,
-                        prompt_profile=args.prompt_profile if spec.prompt_profile_flag else None,
+                if qv_issues:
+                    schema_issues.extend(qv_issues)
+                    _log_event(
+                        logging.WARNING,
+                        "question.qvalidators.issues",
+                        fn="_run_single",
+                        qid=q.id,
+                        issue_count=len(qv_issues),
+                        sample=qv_issues[:3],
                     )
-                    if question_evidence_audit_path is not None:
-                        _write_question_evidence_audit(
-                            out_dir=out_dir,
-                            qid=q.id,
-                            audit=question_evidence_audit,
-                        )
+                else:
                     _log_event(
                         logging.INFO,
-                        "question.advice.dispatch",
+                        "question.qvalidators.ok",
                         fn="_run_single",
                         qid=q.id,
-                        phase="advice_primary",
-                        backend=args.backend,
-                        model=args.model or "(default)",
-                        top_k=advice_top_k,
-                        prompt_file=str(advice_prompt_file) if advice_prompt_file else "(none)",
-                        prompt_sha256=rec.get("prompt_sha256"),
-                        prompt_chars=rec.get("prompt_chars"),
                     )
-
-                advice_res = run_engine_chat(
-                    spec,
-                    prefix,
-                    question=advice_prompt,
-                    index_path=index_path,
-                    parquet_path=parquet_path,
-                    backend=args.backend,
-                    model=args.model,
-                    top_k=advice_top_k,
-                    prompt_profile=args.prompt_profile if spec.prompt_profile_flag else None,
-                    system_prompt_file=advice_prompt_file,
-                    max_tokens=args.max_tokens if args.max_tokens is not None else pack.defaults.max_tokens,
-                    temperature=args.temperature if args.temperature is not None else pack.defaults.temperature,
-                    top_p=args.top_p,
-                    num_ctx=args.num_ctx,
-                    env_overrides=main_engine_env,
-                )
-                advice_json = parse_json_maybe(advice_res.stdout) or advice_res.stdout
-                advice_file = out_dir / f"{q.id}_advice_chat.json"
-                write_json(
-                    advice_file,
-                    {
-                        "argv": advice_res.argv,
-                        "returncode": advice_res.returncode,
-                        "stdout": advice_json,
-                        "stderr": advice_res.stderr,
-                    },
-                )
-                report_lines.append(
-                    f"- Advice: rc={advice_res.returncode} → {advice_file.name} (top_k={advice_top_k})\n"
+            if schema_issues:
+                validator_section_opened = True
+                report_lines.append("\n**Validator issues:**\n\n")
+                report_lines.extend(f"- Response schema: {it}\n" for it in schema_issues)
+                if pack.validation.fail_on_missing_citations:
+                    fatal_contract_issues.extend(f"{q.id}: {it}" for it in schema_issues)
+                _log_event(
+                    logging.WARNING,
+                    "question.validator.issues",
+                    fn="_run_single",
+                    qid=q.id,
+                    issue_count=len(schema_issues),
+                    sample=schema_issues[:3],
                 )
-                advice_rc = advice_res.returncode
+            else:
                 _log_event(
                     logging.INFO,
-                    "question.advice.done",
+                    "question.validator.ok",
                     fn="_run_single",
                     qid=q.id,
-                    returncode=advice_res.returncode,
-                    artifact=str(advice_file),
                 )
-                if isinstance(advice_json, dict):
-                    advice_text = (
-                        advice_json.get("answer")
-                        or advice_json.get("response")
-                        or advice_json.get("text")
-                        or ""
-                    )
-                else:
-                    advice_text = str(advice_json or "")
 
-                advice_min_issues = _resolve_min_concrete_issues(pack.pack_type)
-                advice_quality_issues = _validate_advice_quality(
-                    advice_text=advice_text,
-                    evidence_blocks=evidence_blocks,
-                    min_concrete_issues_when_evidence=advice_min_issues,
-                )
-                advice_retry_attempts = (
-                    ADVICE_RETRY_ATTEMPTS
-                    if (mission_advice_gate_enabled and ADVICE_RETRY_ON_VALIDATION_FAIL)
-                    else 0
-                )
-                for retry_idx in range(1, advice_retry_attempts + 1):
-                    if not advice_quality_issues:
-                        _log_event(
-                            logging.INFO,
-                            "question.advice.retry.satisfied",
-                            fn="_run_single",
-                            qid=q.id,
-                            attempt=retry_idx - 1,
-                        )
-                        break
-                    report_lines.append(
-                        f"- Advice retry {retry_idx}/{advice_retry_attempts}: validator issues={len(advice_quality_issues)}\n"
+            if q.advice_mode == "llm":
+                if not evidence_blocks:
+                    report_lines.append("- Advice: skipped (no evidence blocks available)\n")
+                    advice_rc = "skipped_no_evidence"
+                else:
+                    advice_prompt = q.advice_prompt or _build_advice_prompt(
+                        qid=q.id,
+                        question_text=q.question,
+                        deterministic_answer=ans or "",
+                        evidence_blocks=evidence_blocks,
                     )
+                    advice_prompt_path = out_dir / f"{q.id}_advice_prompt.md"
+                    write_text(advice_prompt_path, advice_prompt)
+                    if question_evidence_audit is not None:
+                        question_evidence_audit.setdefault("artifacts", {})
+                        question_evidence_audit["artifacts"]["advice_prompt"] = str(advice_prompt_path.name)
+
+                    advice_top_k_cap = int(ISSUE_CAPS.get("advice_top_k_cap", 8))
+                    default_advice_top_k = 0 if not ADVICE_RETRIEVAL_CITATIONS_ENABLED else min(advice_top_k_cap, top_k_max)
+                    advice_top_k = int((q.chat or {}).get("advice_top_k", default_advice_top_k))
+                    advice_top_k = max(0, advice_top_k)
+                    advice_prompt_file = Path(DEFAULT_ADVICE_PROMPT_FILE) if Path(DEFAULT_ADVICE_PROMPT_FILE).exists() else (prompt_grounding or prompt_analyze)
                     _log_event(
-                        logging.WARNING,
-                        "question.advice.retry",
+                        logging.INFO,
+                        "question.advice.prepare",
                         fn="_run_single",
                         qid=q.id,
-                        attempt=f"{retry_idx}/{advice_retry_attempts}",
-                        issue_count=len(advice_quality_issues),
-                        sample=advice_quality_issues[:3],
-                    )
-                    advice_retry_count += 1
-                    retry_prompt = _build_advice_retry_prompt(
-                        base_prompt=advice_prompt,
-                        issues=advice_quality_issues,
-                        attempt=retry_idx,
-                        total_attempts=advice_retry_attempts,
+                        advice_prompt_file=str(advice_prompt_file) if advice_prompt_file else "(none)",
+                        advice_top_k=advice_top_k,
                     )
                     if question_evidence_audit is not None:
                         rec = _append_llm_dispatch_to_audit(
                             audit=question_evidence_audit,
-                            phase=f"advice_retry_{retry_idx}",
-                            prompt_mode="advice_retry",
-                            prompt_text=retry_prompt,
+                            phase="advice_primary",
+                            prompt_mode="advice",
+                            prompt_text=advice_prompt,
                             prompt_file=advice_prompt_file,
                             backend=args.backend,
                             model=args.model or "(default)",
@@ -6392,13 +7377,14 @@ def _run_single(
                                 out_dir=out_dir,
                                 qid=q.id,
                                 audit=question_evidence_audit,
+                                writer=artifact_writer,
                             )
                         _log_event(
                             logging.INFO,
                             "question.advice.dispatch",
                             fn="_run_single",
                             qid=q.id,
-                            phase=f"advice_retry_{retry_idx}",
+                            phase="advice_primary",
                             backend=args.backend,
                             model=args.model or "(default)",
                             top_k=advice_top_k,
@@ -6406,43 +7392,27 @@ def _run_single(
                             prompt_sha256=rec.get("prompt_sha256"),
                             prompt_chars=rec.get("prompt_chars"),
                         )
+
                     advice_res = run_engine_chat(
                         spec,
                         prefix,
-                        question=retry_prompt,
-                        index_path=index_path,
-                        parquet_path=parquet_path,
-                        backend=args.backend,
-                        model=args.model,
+                        question=advice_prompt,
                         top_k=advice_top_k,
-                        prompt_profile=args.prompt_profile if spec.prompt_profile_flag else None,
                         system_prompt_file=advice_prompt_file,
-                        max_tokens=args.max_tokens if args.max_tokens is not None else pack.defaults.max_tokens,
-                        temperature=args.temperature if args.temperature is not None else pack.defaults.temperature,
-                        top_p=args.top_p,
-                        num_ctx=args.num_ctx,
-                        env_overrides=main_engine_env,
+                        **chat_engine_kwargs,
                     )
                     advice_json = parse_json_maybe(advice_res.stdout) or advice_res.stdout
-                    write_json(
-                        advice_file,
-                        {
-                            "argv": advice_res.argv,
-                            "returncode": advice_res.returncode,
-                            "stdout": advice_json,
-                            "stderr": advice_res.stderr,
-                        },
-                    )
+                    advice_file = out_dir / f"{q.id}_advice_chat.json"
+                    artifact_writer.write_json(advice_file, _cmd_result_payload(advice_res, advice_json))
                     report_lines.append(
-                        f"  - Advice retry rc={advice_res.returncode} → {advice_file.name}\n"
+                        f"- Advice: rc={advice_res.returncode} → {advice_file.name} (top_k={advice_top_k})\n"
                     )
                     advice_rc = advice_res.returncode
                     _log_event(
                         logging.INFO,
-                        "question.advice.retry.done",
+                        "question.advice.done",
                         fn="_run_single",
                         qid=q.id,
-                        attempt=f"{retry_idx}/{advice_retry_attempts}",
                         returncode=advice_res.returncode,
                         artifact=str(advice_file),
                     )
@@ -6455,113 +7425,222 @@ def _run_single(
                         )
                     else:
                         advice_text = str(advice_json or "")
+
+                    advice_min_issues = _resolve_min_concrete_issues(pack.pack_type)
                     advice_quality_issues = _validate_advice_quality(
                         advice_text=advice_text,
                         evidence_blocks=evidence_blocks,
                         min_concrete_issues_when_evidence=advice_min_issues,
                     )
-
-                if advice_text.strip():
-                    report_lines.append("\n**Improvement Suggestions (LLM):**\n\n")
-                    report_lines.append(advice_text.strip() + "\n\n")
-
-                if advice_quality_issues:
-                    if not advice_validator_section_opened:
-                        report_lines.append("\n**Advice validator issues:**\n\n")
-                        advice_validator_section_opened = True
-                    for it in advice_quality_issues:
-                        report_lines.append(f"- Advice quality: {it}\n")
-                    if mission_advice_gate_enabled:
-                        fatal_advice_gate_issues.extend([f"{q.id}: {it}" for it in advice_quality_issues])
-                    _log_event(
-                        logging.WARNING,
-                        "question.advice.validator.issues",
-                        fn="_run_single",
-                        qid=q.id,
-                        issue_count=len(advice_quality_issues),
-                        sample=advice_quality_issues[:3],
+                    advice_retry_attempts = (
+                        ADVICE_RETRY_ATTEMPTS
+                        if (mission_advice_gate_enabled and ADVICE_RETRY_ON_VALIDATION_FAIL)
+                        else 0
                     )
-                else:
-                    _log_event(
-                        logging.INFO,
-                        "question.advice.validator.ok",
-                        fn="_run_single",
+                    for retry_idx in range(1, advice_retry_attempts + 1):
+                        if not advice_quality_issues:
+                            _log_event(
+                                logging.INFO,
+                                "question.advice.retry.satisfied",
+                                fn="_run_single",
+                                qid=q.id,
+                                attempt=retry_idx - 1,
+                            )
+                            break
+                        report_lines.append(
+                            f"- Advice retry {retry_idx}/{advice_retry_attempts}: validator issues={len(advice_quality_issues)}\n"
+                        )
+                        _log_event(
+                            logging.WARNING,
+                            "question.advice.retry",
+                            fn="_run_single",
+                            qid=q.id,
+                            attempt=f"{retry_idx}/{advice_retry_attempts}",
+                            issue_count=len(advice_quality_issues),
+                            sample=advice_quality_issues[:3],
+                        )
+                        advice_retry_count += 1
+                        retry_prompt = _build_advice_retry_prompt(
+                            base_prompt=advice_prompt,
+                            issues=advice_quality_issues,
+                            attempt=retry_idx,
+                            total_attempts=advice_retry_attempts,
+                        )
+                        if question_evidence_audit is not None:
+                            rec = _append_llm_dispatch_to_audit(
+                                audit=question_evidence_audit,
+                                phase=f"advice_retry_{retry_idx}",
+                                prompt_mode="advice_retry",
+                                prompt_text=retry_prompt,
+                                prompt_file=advice_prompt_file,
+                                backend=args.backend,
+                                model=args.model or "(default)",
+                                top_k=advice_top_k,
+                                prompt_profile=args.prompt_profile if spec.prompt_profile_flag else None,
+                            )
+                            if question_evidence_audit_path is not None:
+                                _write_question_evidence_audit(
+                                    out_dir=out_dir,
+                                    qid=q.id,
+                                    audit=question_evidence_audit,
+                                    writer=artifact_writer,
+                                )
+                            _log_event(
+                                logging.INFO,
+                                "question.advice.dispatch",
+                                fn="_run_single",
+                                qid=q.id,
+                                phase=f"advice_retry_{retry_idx}",
+                                backend=args.backend,
+                                model=args.model or "(default)",
+                                top_k=advice_top_k,
+                                prompt_file=str(advice_prompt_file) if advice_prompt_file else "(none)",
+                                prompt_sha256=rec.get("prompt_sha256"),
+                                prompt_chars=rec.get("prompt_chars"),
+                            )
+                        advice_res = run_engine_chat(
+                            spec,
+                            prefix,
+                            question=retry_prompt,
+                            top_k=advice_top_k,
+                            system_prompt_file=advice_prompt_file,
+                            **chat_engine_kwargs,
+                        )
+                        advice_json = parse_json_maybe(advice_res.stdout) or advice_res.stdout
+                        artifact_writer.write_json(advice_file, _cmd_result_payload(advice_res, advice_json))
+                        report_lines.append(
+                            f"  - Advice retry rc={advice_res.returncode} → {advice_file.name}\n"
+                        )
+                        advice_rc = advice_res.returncode
+                        _log_event(
+                            logging.INFO,
+                            "question.advice.retry.done",
+                            fn="_run_single",
+                            qid=q.id,
+                            attempt=f"{retry_idx}/{advice_retry_attempts}",
+                            returncode=advice_res.returncode,
+                            artifact=str(advice_file),
+                        )
+                        if isinstance(advice_json, dict):
+                            advice_text = (
+                                advice_json.get("answer")
+                                or advice_json.get("response")
+                                or advice_json.get("text")
+                                or ""
+                            )
+                        else:
+                            advice_text = str(advice_json or "")
+                        advice_quality_issues = _validate_advice_quality(
+                            advice_text=advice_text,
+                            evidence_blocks=evidence_blocks,
+                            min_concrete_issues_when_evidence=advice_min_issues,
+                        )
+
+                    if advice_text.strip():
+                        report_lines.append("\n**Improvement Suggestions (LLM):**\n\n")
+                        report_lines.append(advice_text.strip() + "\n\n")
+
+                    if advice_quality_issues:
+                        if not advice_validator_section_opened:
+                            report_lines.append("\n**Advice validator issues:**\n\n")
+                            advice_validator_section_opened = True
+                        report_lines.extend(f"- Advice quality: {it}\n" for it in advice_quality_issues)
+                        if mission_advice_gate_enabled:
+                            fatal_advice_gate_issues.extend(f"{q.id}: {it}" for it in advice_quality_issues)
+                        _log_event(
+                            logging.WARNING,
+                            "question.advice.validator.issues",
+                            fn="_run_single",
+                            qid=q.id,
+                            issue_count=len(advice_quality_issues),
+                            sample=advice_quality_issues[:3],
+                        )
+                    else:
+                        _log_event(
+                            logging.INFO,
+                            "question.advice.validator.ok",
+                            fn="_run_single",
+                            qid=q.id,
+                            retries=advice_retry_count,
+                        )
+
+            q_elapsed_s = round(time.perf_counter() - q_t0, 3)
+            citations_count = _count_citations_in_answer(ans or "")
+            sources_count = 0
+            if isinstance(sources, list):
+                sources_count = len(sources)
+            elif sources:
+                sources_count = 1
+            # Evidence blocks are always formatted strings; no per-block str() coercion.
+            evidence_chars = sum(map(len, evidence_blocks))
+            llm_dispatch_count = 0
+            missing_paths_count = 0
+            if question_evidence_audit is not None:
+                llm_dispatch_count = len(question_evidence_audit.get("llm_dispatches") or [])
+                missing_paths_count = int(question_evidence_audit.get("paths_missing_from_parquet_count") or 0)
+                question_evidence_audit["result"] = {
+                    "schema_issues_count": len(schema_issues),
+                    "advice_quality_issues_count": len(advice_quality_issues),
+                    "citations_count": citations_count,
+                    "sources_count": sources_count,
+                    "answer_chars": len(ans or ""),
+                    "elapsed_s": q_elapsed_s,
+                }
+                question_evidence_audit["llm_dispatch_count"] = llm_dispatch_count
+                if question_evidence_audit_path is not None:
+                    _write_question_evidence_audit(
+                        out_dir=out_dir,
                         qid=q.id,
-                        retries=advice_retry_count,
+                        audit=question_evidence_audit,
+                        writer=artifact_writer,
                     )
-
-        q_elapsed_s = round(time.perf_counter() - q_t0, 3)
-        citations_count = _count_citations_in_answer(ans or "")
-        sources_count = 0
-        if isinstance(sources, list):
-            sources_count = len(sources)
-        elif sources:
-            sources_count = 1
-        evidence_chars = sum(len(str(b or "")) for b in evidence_blocks)
-        llm_dispatch_count = 0
-        missing_paths_count = 0
-        if question_evidence_audit is not None:
-            llm_dispatch_count = len(question_evidence_audit.get("llm_dispatches") or [])
-            missing_paths_count = int(question_evidence_audit.get("paths_missing_from_parquet_count") or 0)
-            question_evidence_audit["result"] = {
-                "schema_issues_count": len(schema_issues),
-                "advice_quality_issues_count": len(advice_quality_issues),
-                "citations_count": citations_count,
-                "sources_count": sources_count,
-                "answer_chars": len(ans or ""),
-                "elapsed_s": q_elapsed_s,
-            }
-            question_evidence_audit["llm_dispatch_count"] = llm_dispatch_count
-            if question_evidence_audit_path is not None:
-                _write_question_evidence_audit(
-                    out_dir=out_dir,
-                    qid=q.id,
-                    audit=question_evidence_audit,
-                )
-        if question_evidence_summary_row is not None:
-            question_evidence_summary_row["llm_dispatches"] = llm_dispatch_count
-            question_evidence_summary_row["schema_issues_count"] = len(schema_issues)
-            question_evidence_summary_row["advice_issues_count"] = len(advice_quality_issues)
-            question_evidence_summary_row["elapsed_s"] = q_elapsed_s
-        _log_event(
-            logging.INFO,
-            "question.done",
-            fn="_run_single",
-            qid=q.id,
-            elapsed_s=q_elapsed_s,
-            preflight_steps=len(preflights),
-            evidence_blocks=len(evidence_blocks),
-            evidence_usable_blocks=usable_evidence_blocks,
-            evidence_chars=evidence_chars,
-            answer_chars=len(ans or ""),
-            citations_count=citations_count,
-            sources_count=sources_count,
-            schema_issue_count=len(schema_issues),
-            advice_issue_count=len(advice_quality_issues),
-            schema_retries=schema_retry_count,
-            advice_retries=advice_retry_count,
-            adaptive_reruns=adaptive_rerun_count,
-            advice_rc=advice_rc if q.advice_mode == "llm" else "(n/a)",
-            llm_dispatches=llm_dispatch_count,
-            paths_missing_from_parquet=missing_paths_count,
-        )
-        question_runtime_stats.append(
-            {
-                "qid": q.id,
-                "elapsed_s": q_elapsed_s,
-                "evidence_blocks": len(evidence_blocks),
-                "evidence_usable_blocks": usable_evidence_blocks,
-                "schema_issues": len(schema_issues),
-                "advice_issues": len(advice_quality_issues),
-                "schema_retries": schema_retry_count,
-                "advice_retries": advice_retry_count,
-                "adaptive_reruns": adaptive_rerun_count,
-            }
-        )
+            if question_evidence_summary_row is not None:
+                question_evidence_summary_row["llm_dispatches"] = llm_dispatch_count
+                question_evidence_summary_row["schema_issues_count"] = len(schema_issues)
+                question_evidence_summary_row["advice_issues_count"] = len(advice_quality_issues)
+                question_evidence_summary_row["elapsed_s"] = q_elapsed_s
+            _log_event(
+                logging.INFO,
+                "question.done",
+                fn="_run_single",
+                qid=q.id,
+                elapsed_s=q_elapsed_s,
+                preflight_steps=len(preflights),
+                evidence_blocks=len(evidence_blocks),
+                evidence_usable_blocks=usable_evidence_blocks,
+                evidence_chars=evidence_chars,
+                answer_chars=len(ans or ""),
+                citations_count=citations_count,
+                sources_count=sources_count,
+                schema_issue_count=len(schema_issues),
+                advice_issue_count=len(advice_quality_issues),
+                schema_retries=schema_retry_count,
+                advice_retries=advice_retry_count,
+                adaptive_reruns=adaptive_rerun_count,
+                advice_rc=advice_rc if q.advice_mode == "llm" else "(n/a)",
+                llm_dispatches=llm_dispatch_count,
+                paths_missing_from_parquet=missing_paths_count,
+            )
+            question_runtime_stats.append(
+                {
+                    "qid": q.id,
+                    "elapsed_s": q_elapsed_s,
+                    "evidence_blocks": len(evidence_blocks),
+                    "evidence_usable_blocks": usable_evidence_blocks,
+                    "schema_issues": len(schema_issues),
+                    "advice_issues": len(advice_quality_issues),
+                    "schema_retries": schema_retry_count,
+                    "advice_retries": advice_retry_count,
+                    "adaptive_reruns": adaptive_rerun_count,
+                }
+            )
+    finally:
+        artifact_writer.close()
 
     evidence_summary_path: Path | None = None
+    # Shared by the evidence summary and the run.done event.
+    missing_total = sum(int(r.get("paths_missing_from_parquet_count") or 0) for r in evidence_audit_rows)
     if bool(getattr(args, "evidence_audit", EVIDENCE_AUDIT_ENABLED_DEFAULT)):
-        missing_total = sum(int(r.get("paths_missing_from_parquet_count") or 0) for r in evidence_audit_rows)
         usable_total = sum(int(r.get("evidence_usable_blocks_count") or 0) for r in evidence_audit_rows)
         evidence_summary_obj = {
             "generated_at": datetime.now(timezone.utc).isoformat(),
@@ -6602,12 +7681,10 @@ def _run_single(
             )
 
     report_path = out_dir / REPORT_FILE
-    write_text(report_path, "".join(report_lines))
+    report_text = "".join(report_lines)
+    write_text(report_path, report_text)
 
-    ok, total, issues = _parse_report_ok_count(
-        report_path,
-        include_advice_issues=mission_advice_gate_enabled,
-    )
+    ok, total, issues = _report_ok_count(report_text, include_advice_issues=mission_advice_gate_enabled)
 
     # Plugins: post_run outputs
     extra_outputs: Dict[str, Any] = {}
@@ -6616,10 +7693,7 @@ def _run_single(
         "file": str(final_key_map_path.name),
         "parquet_schema_source": _RUNTIME_PARQUET_SCHEMA_SOURCE,
         "parquet_columns_count": len(_RUNTIME_PARQUET_COLUMNS),
-        "path_keys": len(_effective_path_keys()),
-        "line_keys": len(_effective_line_keys()),
-        "snippet_keys": len(_effective_snippet_keys()),
-        "iter_rows_keys": len(_effective_iter_rows_keys()),
+        **_effective_key_counts(),
     }
     if evidence_summary_path is not None:
         extra_outputs["evidence_delivery_audit"] = {
@@ -6654,14 +7728,15 @@ def _run_single(
                     "metrics": out.metrics,
                     "hashes": out.hashes,
                 }
-                _log_event(
-                    logging.INFO,
-                    "plugin.run.done",
-                    fn="_run_single",
-                    plugin=plugin.name,
-                    files=list((out.files or {}).keys()),
-                    metrics_keys=list((out.metrics or {}).keys()),
-                )
+                if LOGGER.isEnabledFor(logging.INFO):
+                    _log_event(
+                        logging.INFO,
+                        "plugin.run.done",
+                        fn="_run_single",
+                        plugin=plugin.name,
+                        files=list((out.files or {}).keys()),
+                        metrics_keys=list((out.metrics or {}).keys()),
+                    )
         except Exception as e:
             extra_outputs.setdefault("plugin_errors", {})
             extra_outputs["plugin_errors"][plugin.name] = str(e)
@@ -6688,31 +7763,30 @@ def _run_single(
 
     print(f"Wrote report: {report_path}")
     print(f"Wrote manifest: {manifest_path}")
-    run_elapsed_s = round(time.perf_counter() - run_t0, 3)
-    slow_questions = sorted(
-        question_runtime_stats,
-        key=lambda row: float(row.get("elapsed_s") or 0.0),
-        reverse=True,
-    )[:3]
-    _log_event(
-        logging.INFO,
-        "run.done",
-        fn="_run_single",
-        report=str(report_path),
-        manifest=str(manifest_path),
-        score_ok=ok,
-        total=total,
-        issues=issues,
-        fatal_contract_issues=len(fatal_contract_issues),
-        fatal_advice_gate_issues=len(fatal_advice_gate_issues),
-        elapsed_s=run_elapsed_s,
-        slow_questions=slow_questions,
-        evidence_audit_artifact=str(evidence_summary_path) if evidence_summary_path else "(disabled)",
-        evidence_audit_questions=len(evidence_audit_rows),
-        evidence_audit_missing_paths=sum(
-            int(r.get("paths_missing_from_parquet_count") or 0) for r in evidence_audit_rows
-        ),
-    )
+    if LOGGER.isEnabledFor(logging.INFO):
+        run_elapsed_s = round(time.perf_counter() - run_t0, 3)
+        slow_questions = heapq.nlargest(
+            3,
+            question_runtime_stats,
+            key=lambda row: float(row.get("elapsed_s") or 0.0),
+        )
+        _log_event(
+            logging.INFO,
+            "run.done",
+            fn="_run_single",
+            report=str(report_path),
+            manifest=str(manifest_path),
+            score_ok=ok,
+            total=total,
+            issues=issues,
+            fatal_contract_issues=len(fatal_contract_issues),
+            fatal_advice_gate_issues=len(fatal_advice_gate_issues),
+            elapsed_s=run_elapsed_s,
+            slow_questions=slow_questions,
+            evidence_audit_artifact=str(evidence_summary_path) if evidence_summary_path else "(disabled)",
+            evidence_audit_questions=len(evidence_audit_rows),
+            evidence_audit_missing_paths=missing_total,
+        )
 
     if fatal_contract_issues or fatal_advice_gate_issues:
         raise SystemExit(2)
@@ -6720,6 +7794,49 @@ def _run_single(
     return 0, extra_outputs
 
 
+def _init_replicate_worker(raw_level: str | None) -> None:
+    """ProcessPoolExecutor initializer for ``--replicate-workers``.
+
+    Spawn/forkserver workers start with logging unconfigured, so the level is
+    re-applied here. File handlers inherited through fork are dropped: each
+    seed logs to its own file (see ``_run_replicate_seed``).
+    """
+    root = logging.getLogger()
+    for h in list(root.handlers):
+        if isinstance(h, logging.FileHandler):
+            root.removeHandler(h)
+    _setup_logging(raw_level)
+
+
+def _run_replicate_seed(*, seed: int, out_dir: Path, args: argparse.Namespace, **run_kwargs: Any) -> Any:
+    """Run one replicate seed in a worker process.
+
+    With ``--log-to-file`` the seed writes its own ``<seed out_dir>/<log file
+    name>`` instead of appending to the base run log alongside other seeds.
+    """
+    seed_log: Path | None = None
+    if args.log_to_file:
+        seed_log = _attach_log_file_handler(out_dir / Path(str(args.log_file)).name, args.log_level)
+        args._run_log_file = str(seed_log)
+    _log_event(
+        logging.INFO,
+        "replicate.seed.worker",
+        fn="_run_replicate_seed",
+        seed=seed,
+        pid=os.getpid(),
+        log_file=str(seed_log) if seed_log else "(disabled)",
+    )
+    try:
+        return _run_single(out_dir=out_dir, args=args, **run_kwargs)
+    finally:
+        if seed_log is not None:
+            root = logging.getLogger()
+            for h in list(root.handlers):
+                if isinstance(h, logging.FileHandler) and Path(h.baseFilename) == seed_log:
+                    root.removeHandler(h)
+                    h.close()
+
+
 def _run_replicates(args: argparse.Namespace) -> int:
     seeds = DEFAULT_REPLICATE_SEEDS
     if args.replicate_seeds:
@@ -6748,7 +7865,7 @@ def _run_replicates(args: argparse.Namespace) -> int:
     results: List[Tuple[int, Path, int, int, int]] = []
     guru_results: List[Tuple[int, Path, int, int, int]] = []
 
-    for seed in seeds:
+    def _start_seed(seed: int) -> Path:
         seed_out = out_dir_base / f"{REPLICATE_SEED_PREFIX}{seed}"
         ensure_dir(seed_out)
         _log_event(
@@ -6758,38 +7875,67 @@ def _run_replicates(args: argparse.Namespace) -> int:
             seed=seed,
             out_dir=str(seed_out),
         )
-        _run_single(pack_path=pack_path, pack=pack, spec=spec, args=args, parquet_path=parquet_path, index_path=index_path, out_dir=seed_out, all_specs=specs)
+        return seed_out
 
-        report = seed_out / REPORT_FILE
-        ok, total, issue_count = _parse_report_ok_count(
-            report,
-            include_advice_issues=_is_mission_pack_type(pack.pack_type),
-        )
-        results.append((seed, report, ok, total, issue_count))
-        _log_event(
-            logging.INFO,
-            "replicate.seed.done",
-            fn="_run_replicates",
-            seed=seed,
-            score_ok=ok,
-            total=total,
-            issues=issue_count,
+    run_kwargs: Dict[str, Any] = dict(
+        pack_path=pack_path, pack=pack, spec=spec, args=args, parquet_path=parquet_path, index_path=index_path, all_specs=specs
+    )
+    # Seeds are independent runs; with --replicate-workers > 1 they run in worker
+    # processes, each seed with its own log file. Results are still collected
+    # (and a seed's SystemExit re-raised) in seed order, so the summaries do not
+    # depend on completion order.
+    workers = max(1, min(int(getattr(args, "replicate_workers", 1) or 1), len(seeds)))
+    pool: concurrent.futures.ProcessPoolExecutor | None = None
+    seed_runs: List[Tuple[Path, concurrent.futures.Future[Any]]] = []
+    if workers > 1:
+        pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_replicate_worker, initargs=(args.log_level,)
         )
+        for seed in seeds:
+            seed_out = _start_seed(seed)
+            seed_runs.append((seed_out, pool.submit(_run_replicate_seed, seed=seed, out_dir=seed_out, **run_kwargs)))
 
-        # If plugin produced GURU_METRICS.json, aggregate it too
-        gm = seed_out / GURU_METRICS_FILE
-        if gm.exists():
-            try:
-                obj = json.loads(gm.read_text(encoding="utf-8"))
-                guru_ok = int(obj.get("guru_score", 0))
-                guru_total = int(obj.get("total_questions", total))
-                guru_issues = int(obj.get("issues", 0))
-                guru_results.append((seed, gm, guru_ok, guru_total, guru_issues))
-            except Exception:
-                pass
+    try:
+        for i, seed in enumerate(seeds):
+            if pool is None:
+                seed_out = _start_seed(seed)
+                _run_single(out_dir=seed_out, **run_kwargs)
+            else:
+                seed_out, fut = seed_runs[i]
+                fut.result()
+            report = seed_out / REPORT_FILE
+            ok, total, issue_count = _parse_report_ok_count(
+                report,
+                include_advice_issues=_is_mission_pack_type(pack.pack_type),
+            )
+            results.append((seed, report, ok, total, issue_count))
+            _log_event(
+                logging.INFO,
+                "replicate.seed.done",
+                fn="_run_replicates",
+                seed=seed,
+                score_ok=ok,
+                total=total,
+                issues=issue_count,
+            )
+
+            # If plugin produced GURU_METRICS.json, aggregate it too
+            gm = seed_out / GURU_METRICS_FILE
+            if gm.exists():
+                try:
+                    obj = load_json_file(gm)
+                    guru_ok = int(obj.get("guru_score", 0))
+                    guru_total = int(obj.get("total_questions", total))
+                    guru_issues = int(obj.get("issues", 0))
+                    guru_results.append((seed, gm, guru_ok, guru_total, guru_issues))
+                except Exception:
+                    pass
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
 
-    summary = generate_stability_summary(results, out_dir_base, title=PACK_STABILITY_TITLE)
-    print(summary.read_text(encoding="utf-8"))
+    _, summary_text = generate_stability_summary(results, out_dir_base, title=PACK_STABILITY_TITLE)
+    print(summary_text)
 
     if guru_results:
         # Write a separate stability summary for Guru metrics
@@ -6809,8 +7955,9 @@ def _run_replicates(args: argparse.Namespace) -> int:
                 f"| {seed} | {gok}/{gtot} | {gissues} | "
                 f"[{path.name}]({REPLICATE_SEED_PREFIX}{seed}/{path.name}) |\n"
             )
-        guru_summary.write_text("".join(lines), encoding="utf-8")
-        print(guru_summary.read_text(encoding="utf-8"))
+        guru_summary_text = "".join(lines)
+        write_text(guru_summary, guru_summary_text)
+        print(guru_summary_text)
 
     _log_event(
         logging.INFO,
@@ -6880,7 +8027,18 @@ def main() -> int:
     ap.add_argument("--no-uv", action="store_true", help="Use direct CLI instead of uv")
 
     ap.add_argument("--cache-preflights", action="store_true", help="Cache preflight artifacts")
+    ap.add_argument(
+        "--cache-chat",
+        action="store_true",
+        help="Reuse successful chat/advice results for identical calls (exact argv + env + input files) from OUT_DIR/.chat_cache; ignored when temperature > 0",
+    )
     ap.add_argument("--short-circuit-preflights", action="store_true", help="Skip later preflights when stop_if_nonempty step already produced hits")
+    ap.add_argument(
+        "--preflight-workers",
+        type=int,
+        default=PREFLIGHT_MAX_WORKERS,
+        help=f"Run up to N independent preflight steps of a question concurrently (default: {PREFLIGHT_MAX_WORKERS})",
+    )
     ap.add_argument("--adaptive-top-k", action="store_true", help="Start chat with smaller top_k and rerun once at max top_k if validators fail")
     ap.add_argument("--chat-top-k-initial", type=int, default=DEFAULT_CHAT_TOP_K_INITIAL, help="Initial top_k when --adaptive-top-k is enabled")
     ap.add_argument("--preflight-max-chars", type=int, default=DEFAULT_PREFLIGHT_MAX_CHARS, help="Max chars per preflight evidence injected")
@@ -6915,6 +8073,12 @@ def main() -> int:
 
     ap.add_argument("--replicate", action="store_true", help="Run replicates with different seeds")
     ap.add_argument("--replicate-seeds", type=str, default=None, help="Comma-separated seeds")
+    ap.add_argument(
+        "--replicate-workers",
+        type=int,
+        default=1,
+        help="Run up to N replicate seeds concurrently in worker processes (default: 1 = serial)",
+    )
     ap.add_argument(
         "--log-level",
         default=DEFAULT_LOG_LEVEL,
@@ -7070,10 +8234,8 @@ def main() -> int:
     index_path = Path(args.index)
     out_dir = Path(args.out_dir)
     engine_specs_path = Path(args.engine_specs)
-
-    for p in (pack_path, parquet_path, index_path, engine_specs_path):
-        if not p.exists():
-            raise SystemExit(f"Missing required path: {p}")
+    # All four were located by _resolve_existing_path above, which exits on a
+    # missing file; no second existence check here.
 
     pack = _parse_pack(load_pack(pack_path))
 
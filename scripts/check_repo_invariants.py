@@ -1,26 +1,36 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import yaml
 
+try:  # libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 ROOT = Path(__file__).resolve().parents[1]
 
 
 def load_yaml(path: Path):
     try:
-        return yaml.safe_load(path.read_text(encoding="utf-8"))
+        return yaml.load(path.read_text(encoding="utf-8"), Loader=_YamlLoader)
     except Exception as exc:
         raise RuntimeError(f"YAML_FAIL {path.relative_to(ROOT)} {exc}")
 
 
 def check_invariants() -> tuple[bool, list[str]]:
     errs: list[str] = []
+    # Parsed documents by path; the pack checks below reuse them instead of
+    # reading and parsing every pack_*.yaml a second time.
+    parsed: dict[Path, object] = {}
     for p in ROOT.rglob("*.yaml"):
         try:
-            load_yaml(p)
+            parsed[p] = load_yaml(p)
         except RuntimeError as exc:
             errs.append(str(exc))
 
@@ -36,7 +46,7 @@ def check_invariants() -> tuple[bool, list[str]]:
             errs.append(f"MISSING_REQUIRED_FILE {req}")
 
     for p in ROOT.glob("pack_*.yaml"):
-        obj = load_yaml(p) or {}
+        obj = (parsed[p] if p in parsed else load_yaml(p)) or {}
         if not isinstance(obj, dict):
             errs.append(f"PACK_NOT_MAPPING {p.name}")
             continue
@@ -73,8 +83,20 @@ def run_script_tests() -> tuple[bool, int, int, int]:
     total = len(tests)
     passed = 0
     failed = 0
-    for t in tests:
-        proc = subprocess.run([sys.executable, str(t)], cwd=str(ROOT))
+
+    def _run(t: Path) -> subprocess.CompletedProcess[str]:
+        return subprocess.run([sys.executable, str(t)], cwd=str(ROOT), capture_output=True, text=True)
+
+    # Tests are independent scripts; run them concurrently and replay their
+    # captured output in path order so the log reads as a serial run.
+    with ThreadPoolExecutor(max_workers=max(1, min(len(tests), os.cpu_count() or 4))) as ex:
+        procs = list(ex.map(_run, tests))
+    for t, proc in zip(tests, procs):
+        if proc.stdout:
+            sys.stdout.write(proc.stdout)
+        if proc.stderr:
+            sys.stderr.write(proc.stderr)
+        sys.stdout.flush()
         if proc.returncode == 0:
             passed += 1
         else:
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+import sys
+import tempfile
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+import run_pack
+
+calls = []
+
+
+def fake_run_cmd(argv, *, cwd=None, env=None):
+    calls.append(dict(env or {}))
+    return run_pack.CmdResult(argv=list(argv), returncode=0, stdout='{"answer":"x"}', stderr="")
+
+
+run_pack.run_cmd = fake_run_cmd
+with tempfile.TemporaryDirectory() as td:
+    d = Path(td)
+    (d / "i.faiss").write_text("i", encoding="utf-8")
+    (d / "p.parquet").write_text("p", encoding="utf-8")
+    spec = run_pack.EngineSpec(name="e", prefix_uv=[], prefix_direct=["eng"])
+    kw = dict(question="q", index_path=d / "i.faiss", parquet_path=d / "p.parquet", backend="b", model=None,
+              top_k=1, prompt_profile=None, system_prompt_file=None, max_tokens=8, cache_dir=d / ".chat_cache")
+    run_pack.run_engine_chat(spec, ["eng"], temperature=0.0, env_overrides={"ENGINE_SHA256": "a"}, **kw)
+    run_pack.run_engine_chat(spec, ["eng"], temperature=0.0, env_overrides={"ENGINE_SHA256": "a"}, **kw)
+    assert len(calls) == 1, calls
+    run_pack.run_engine_chat(spec, ["eng"], temperature=0.0, env_overrides={"ENGINE_SHA256": "b"}, **kw)
+    assert len(calls) == 2, calls
+    run_pack.run_engine_chat(spec, ["eng"], temperature=0.7, env_overrides={"ENGINE_SHA256": "a"}, **kw)
+    run_pack.run_engine_chat(spec, ["eng"], temperature=0.7, env_overrides={"ENGINE_SHA256": "a"}, **kw)
+    assert len(calls) == 4, calls
+print('ok')
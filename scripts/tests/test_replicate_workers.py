@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+import argparse
+import contextlib
+import io
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+import run_pack
+
+# Workers must see the patched _run_single, so they are forked from this process.
+if "fork" in multiprocessing.get_all_start_methods():
+    multiprocessing.set_start_method("fork", force=True)
+
+
+def fake_run_single(*, out_dir, **_kw):
+    seed = int(out_dir.name[len(run_pack.REPLICATE_SEED_PREFIX):])
+    if seed == 99:
+        raise SystemExit(2)
+    # Earlier seeds finish later, so completion order differs from seed order.
+    time.sleep(0.02 * (5 - seed % 5))
+    body = "".join(f"## Q{i}:\n" + ("**Validator issues:**\n" if i < seed % 3 else "") for i in range(4))
+    (out_dir / run_pack.REPORT_FILE).write_text(body, encoding="utf-8")
+    return 0, {}
+
+
+run_pack._run_single = fake_run_single
+
+
+def run(out_dir, seeds, workers):
+    args = argparse.Namespace(
+        pack="pack_rust_audit_rsqt_general_set1_v1_0.yaml", parquet="x.parquet", index="x.faiss",
+        engine_specs="engine_specs.yaml", out_dir=str(out_dir), replicate_seeds=seeds,
+        replicate_workers=workers, log_level="WARNING", log_to_file=False, log_file="run.log",
+    )
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_pack._run_replicates(args)
+    text = (out_dir / run_pack.STABILITY_FILE).read_text(encoding="utf-8")
+    return text[text.index("## Per-Replicate Results"):]
+
+
+with tempfile.TemporaryDirectory() as td:
+    d = Path(td)
+    serial = run(d / "serial", "1,2,3,4", 1)
+    parallel = run(d / "parallel", "1,2,3,4", 2)
+    assert serial == parallel, (serial, parallel)
+    assert [ln.split("|")[1].strip() for ln in parallel.splitlines()[4:]] == ["1", "2", "3", "4"]
+    try:
+        run(d / "fail", "1,99,3", 2)
+    except SystemExit as e:
+        assert e.code == 2, e.code
+    else:
+        raise AssertionError("seed SystemExit was not re-raised")
+print('ok')
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from run_pack import _compress_evidence_blocks
+
+small = ["[Preflight a]:\nx=1\n", "[Preflight b]:\ny=2\n"]
+assert _compress_evidence_blocks(small, 1000) is small
+assert _compress_evidence_blocks(small, 0) is small
+
+def block(name, n):
+    lines = [f"[Preflight {name}]:"]
+    for i in range(n):
+        lines += [f"CITE=src/{name}.rs:{i}", f"    let v{i} = compute_{name}({i});", ""]
+    return "\n".join(lines)
+
+blocks = [block("a", 20), block("b", 30)]
+budget = 400
+share = budget // len(blocks)
+out = _compress_evidence_blocks(blocks, budget)
+assert len(out) == len(blocks)
+for src, got in zip(blocks, out):
+    src_lines = src.splitlines()
+    got_lines = got.splitlines()
+    assert got_lines[0] == src_lines[0]
+    assert [l for l in got_lines if l.startswith("CITE=")] == [l for l in src_lines if l.startswith("CITE=")]
+    assert all(l.strip() for l in got_lines)
+    used = len(got_lines[0]) + sum(len(l) + 1 for l in got_lines[1:] if not l.startswith("CITE="))
+    assert used <= share, (used, share)
+    assert len(got) < len(src)
+print('ok')